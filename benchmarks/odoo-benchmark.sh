@@ -0,0 +1,54 @@
+## Odoo-WooCommerce Sync Benchmarks
+# Last update: 2026-10-19
+
+
+# Settings
+website="website.com"
+website_root_directory="/var/www/vhosts/$website/httpdocs"
+odoo_conf="/etc/odoo.conf"
+database_name="woocommerce_sync_benchmark"
+odoo_addon_name="woocommerce_sync"
+benchmarks_directory="$website_root_directory/odoo/custom-addons/odoo-woocommerce-sync/benchmarks"
+
+# Synthetic WooCommerce catalog
+woocommerce_port=8080
+woocommerce_products=500
+woocommerce_variations=5
+woocommerce_customers=1000
+woocommerce_orders=2000
+woocommerce_latency_ms=100
+
+
+# Create a fresh benchmark database with the WooCommerce Sync module installed
+$website_root_directory/odoo/venv/bin/python3 $website_root_directory/odoo/odoo-bin \
+    --config=$odoo_conf \
+    --database $database_name \
+    --init $odoo_addon_name \
+    --without-demo=all \
+    --stop-after-init
+
+# Start the WooCommerce REST API stand-in server in the background
+$website_root_directory/odoo/venv/bin/python3 $benchmarks_directory/woocommerce_mock_server.py \
+    --port $woocommerce_port \
+    --products $woocommerce_products \
+    --variations $woocommerce_variations \
+    --customers $woocommerce_customers \
+    --orders $woocommerce_orders \
+    --latency-ms $woocommerce_latency_ms &
+woocommerce_mock_server_pid=$!
+sleep 2
+
+# Run the sync (cold, then warm) and report the stage metrics
+WOOCOMMERCE_BENCHMARK_URL="http://127.0.0.1:$woocommerce_port" \
+WOOCOMMERCE_BENCHMARK_RUNS=2 \
+WOOCOMMERCE_BENCHMARK_OUTPUT="$benchmarks_directory/benchmark-$(date +%Y%m%d-%H%M%S).json" \
+PYTHONPATH="$website_root_directory/odoo" \
+$website_root_directory/odoo/venv/bin/python3 $benchmarks_directory/woocommerce_sync_benchmark.py \
+    --config=$odoo_conf \
+    --database $database_name
+
+# Stop the WooCommerce REST API stand-in server
+kill $woocommerce_mock_server_pid
+
+# Drop the benchmark database
+# dropdb $database_name
@@ -0,0 +1,542 @@
+## Odoo-WooCommerce Sync Benchmarks - WooCommerce REST API stand-in server
+# Last update: 2026-10-19
+
+# Serves a synthetic WooCommerce catalog (products, product variations, customers, orders, taxes, settings and images) over the WooCommerce REST API (wc/v3) routes used by the 'woocommerce_sync' add-on, with configurable latency and WooCommerce pagination headers ('X-WP-Total', 'X-WP-TotalPages'). Authentication is not checked.
+
+# Usage: python woocommerce_mock_server.py --port 8069 --products 500 --variations 5 --customers 1000 --orders 2000 --latency-ms 200
+
+import argparse
+import json
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Settings
+API_PREFIX = '/wp-json/wc/v3/'
+DATE_BASE = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
+TAX_CLASSES = ('standard', 'reduced-rate', 'zero-rate')
+COUNTRIES = (('DE', 'BE', 19.0, 7.0), ('AT', '', 20.0, 10.0), ('FR', '', 20.0, 5.5), ('US', 'CA', 7.25, 7.25))
+
+
+def date_format(date):
+    return date.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def image_png_create(index, size=64):
+    """Create a small solid-color PNG image (standard library only)."""
+    color = bytes(((index * 67) % 256, (index * 131) % 256, (index * 199) % 256))
+    raw = b''.join(b'\x00' + color * size for _ in range(size))
+
+    def chunk(chunk_type, data):
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)) + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b'')
+
+
+class WoocommerceCatalog:
+    """Synthetic WooCommerce catalog. Records follow the WooCommerce REST API (wc/v3) schemas."""
+
+    def __init__(self, base_url, products=100, variations=3, customers=100, orders=100, images=2, seed=0):
+        self.base_url = base_url.rstrip('/')
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.images_count = images
+        self.products_count = products
+
+        self.tax_rates = []
+        for country, state, rate_standard, rate_reduced in COUNTRIES:
+            for tax_class, rate in (('standard', rate_standard), ('reduced-rate', rate_reduced)):
+                self.tax_rates.append(
+                    {
+                        'id': len(self.tax_rates) + 1,
+                        'country': country,
+                        'state': state,
+                        'rate': f'{rate:.4f}',
+                        'name': f'{country} {tax_class}',
+                        'priority': 1,
+                        'compound': False,
+                        'shipping': True,
+                        'order': len(self.tax_rates),
+                        'class': tax_class,
+                    }
+                )
+
+        self.products = {}
+        self.variations = {}
+        for index in range(1, products + 1):
+            product = self.product_create(index, variations if index % 2 == 0 and variations else 0)
+            self.products[product['id']] = product
+
+        self.customers = {}
+        for index in range(1, customers + 1):
+            customer = self.customer_create(index)
+            self.customers[customer['id']] = customer
+
+        self.orders = {}
+        for index in range(1, orders + 1):
+            order = self.order_create(index)
+            self.orders[order['id']] = order
+
+    def image_url(self, index):
+        return f'{self.base_url}/images/{index}.png'
+
+    def address_create(self, index, email=None):
+        country, state, _rate_standard, _rate_reduced = COUNTRIES[index % len(COUNTRIES)]
+        address = {
+            'first_name': f'First{index}',
+            'last_name': f'Last{index}',
+            'company': f'Company {index}' if index % 5 == 0 else '',
+            'address_1': f'{index} Main Street',
+            'address_2': '',
+            'city': f'City {index % 50}',
+            'state': state,
+            'postcode': f'{10000 + index}',
+            'country': country,
+            'phone': f'+49 30 {1000000 + index}',
+        }
+        if email is not None:
+            address['email'] = email
+        return address
+
+    def product_create(self, index, variations_count):
+        date_created = DATE_BASE + timedelta(minutes=index)
+        price = round(5 + (index % 200) * 0.75, 2)
+        product_id = index * 1000
+        product = {
+            'id': product_id,
+            'name': f'Product {index}',
+            'slug': f'product-{index}',
+            'permalink': f'{self.base_url}/product/product-{index}/',
+            'date_created': date_format(date_created),
+            'date_created_gmt': date_format(date_created),
+            'date_modified': date_format(date_created),
+            'date_modified_gmt': date_format(date_created),
+            'type': 'variable' if variations_count else 'simple',
+            'status': 'publish',
+            'featured': False,
+            'catalog_visibility': 'visible',
+            'description': f'<p>Description of product {index}. ' + 'Lorem ipsum dolor sit amet. ' * 20 + '</p>',
+            'short_description': f'<p>Short description of product {index}.</p>',
+            'sku': f'SKU-{index:06d}',
+            'price': f'{price:.2f}',
+            'regular_price': f'{price:.2f}',
+            'sale_price': '',
+            'date_on_sale_from': None,
+            'date_on_sale_from_gmt': None,
+            'date_on_sale_to': None,
+            'date_on_sale_to_gmt': None,
+            'price_html': f'<span class="amount">{price:.2f}</span>',
+            'on_sale': False,
+            'purchasable': True,
+            'total_sales': index % 37,
+            'virtual': False,
+            'downloadable': False,
+            'downloads': [],
+            'download_limit': -1,
+            'download_expiry': -1,
+            'external_url': '',
+            'button_text': '',
+            'tax_status': 'taxable',
+            'tax_class': '' if index % 3 else 'reduced-rate',
+            'manage_stock': not variations_count,
+            'stock_quantity': (index * 7) % 100 if not variations_count else None,
+            'stock_status': 'instock',
+            'backorders': 'no',
+            'backorders_allowed': False,
+            'backordered': False,
+            'sold_individually': False,
+            'weight': f'{0.1 + (index % 20) / 10:.1f}',
+            'dimensions': {'length': '10', 'width': '10', 'height': '5'},
+            'shipping_required': True,
+            'shipping_taxable': True,
+            'shipping_class': '',
+            'shipping_class_id': 0,
+            'reviews_allowed': True,
+            'average_rating': '0.00',
+            'rating_count': 0,
+            'related_ids': [((index + offset) % max(self.products_count, 1) + 1) * 1000 for offset in range(1, 4)],
+            'upsell_ids': [],
+            'cross_sell_ids': [],
+            'parent_id': 0,
+            'purchase_note': '',
+            'categories': [{'id': 15 + index % 10, 'name': f'Category {index % 10}', 'slug': f'category-{index % 10}'}],
+            'tags': [{'id': 100 + index % 20, 'name': f'Tag {index % 20}', 'slug': f'tag-{index % 20}'}],
+            'images': [
+                {'id': index * 10 + image_index, 'src': self.image_url((index + image_index) % max(self.images_count * 10, 1)), 'name': f'product-{index}-{image_index}', 'alt': ''}
+                for image_index in range(self.images_count)
+            ],
+            'attributes': [],
+            'default_attributes': [],
+            'variations': [],
+            'grouped_products': [],
+            'menu_order': 0,
+            'meta_data': [{'id': index, 'key': '_benchmark', 'value': 'yes'}],
+            'brands': [],
+            'lang': 'en',
+        }
+
+        if variations_count:
+            sizes = [f'Size {size_index}' for size_index in range(1, variations_count + 1)]
+            product['attributes'] = [{'id': 1, 'name': 'Size', 'position': 0, 'visible': True, 'variation': True, 'options': sizes}]
+            self.variations[product_id] = {}
+            for variation_index, size in enumerate(sizes, start=1):
+                variation = {
+                    'id': product_id + variation_index,
+                    'name': f'Product {index} - {size}',
+                    'type': 'variation',
+                    'permalink': f'{product["permalink"]}?attribute_size={variation_index}',
+                    'date_created': product['date_created'],
+                    'date_created_gmt': product['date_created_gmt'],
+                    'date_modified': product['date_modified'],
+                    'date_modified_gmt': product['date_modified_gmt'],
+                    'status': 'publish',
+                    'description': '',
+                    'sku': f'{product["sku"]}-{variation_index}',
+                    'price': product['price'],
+                    'regular_price': product['regular_price'],
+                    'sale_price': '',
+                    'date_on_sale_from': None,
+                    'date_on_sale_from_gmt': None,
+                    'date_on_sale_to': None,
+                    'date_on_sale_to_gmt': None,
+                    'on_sale': False,
+                    'purchasable': True,
+                    'virtual': False,
+                    'downloadable': False,
+                    'downloads': [],
+                    'download_limit': -1,
+                    'download_expiry': -1,
+                    'tax_status': 'taxable',
+                    'tax_class': 'parent',
+                    'manage_stock': True,
+                    'stock_quantity': (index + variation_index * 3) % 50,
+                    'stock_status': 'instock',
+                    'backorders': 'no',
+                    'backorders_allowed': False,
+                    'backordered': False,
+                    'weight': product['weight'],
+                    'dimensions': product['dimensions'],
+                    'shipping_class': '',
+                    'shipping_class_id': 0,
+                    'image': {'id': index * 10 + variation_index, 'src': self.image_url((index + variation_index) % max(self.images_count * 10, 1)), 'name': f'variation-{index}-{variation_index}', 'alt': ''}
+                    if self.images_count
+                    else None,
+                    'attributes': [{'id': 1, 'name': 'Size', 'option': size}],
+                    'menu_order': variation_index,
+                    'meta_data': [],
+                    'parent_id': product_id,
+                }
+                self.variations[product_id][variation['id']] = variation
+                product['variations'].append(variation['id'])
+
+        return product
+
+    def customer_create(self, index):
+        date_created = DATE_BASE + timedelta(minutes=index)
+        email = f'customer{index}@example.com'
+        return {
+            'id': index,
+            'date_created': date_format(date_created),
+            'date_created_gmt': date_format(date_created),
+            'date_modified': date_format(date_created),
+            'date_modified_gmt': date_format(date_created),
+            'email': email,
+            'first_name': f'First{index}',
+            'last_name': f'Last{index}',
+            'role': 'customer',
+            'username': f'customer{index}',
+            'is_paying_customer': index % 2 == 0,
+            'avatar_url': self.image_url(index % max(self.images_count * 10, 1)) if self.images_count else '',
+            'meta_data': [],
+            'billing': self.address_create(index, email=email),
+            'shipping': self.address_create(index),
+        }
+
+    def order_create(self, index):
+        date_created = DATE_BASE + timedelta(minutes=index)
+        customer_id = (index % len(self.customers)) + 1 if self.customers and index % 4 else 0
+        email = self.customers[customer_id]['email'] if customer_id else f'guest{index}@example.com'
+        billing = self.address_create(customer_id or index, email=email)
+
+        line_items = []
+        products = list(self.products.values())
+        for line_index in range(1, 1 + (index % 4) + 1):
+            product = products[(index * line_index) % len(products)] if products else None
+            variation_id = product['variations'][0] if product and product['variations'] else 0
+            quantity = 1 + line_index % 3
+            price = float(product['price']) if product else 10.0
+            tax_rate = next((tax_rate for tax_rate in self.tax_rates if tax_rate['country'] == billing['country'] and tax_rate['class'] == 'standard'), None)
+            total = round(price * quantity, 2)
+            total_tax = round(total * float(tax_rate['rate']) / 100, 2) if tax_rate else 0.0
+            line_items.append(
+                {
+                    'id': index * 100 + line_index,
+                    'name': product['name'] if product else 'Product',
+                    'product_id': product['id'] if product else 0,
+                    'variation_id': variation_id,
+                    'quantity': quantity,
+                    'tax_class': '',
+                    'subtotal': f'{total:.2f}',
+                    'subtotal_tax': f'{total_tax:.2f}',
+                    'total': f'{total:.2f}',
+                    'total_tax': f'{total_tax:.2f}',
+                    'taxes': [{'id': tax_rate['id'], 'total': f'{total_tax:.2f}', 'subtotal': f'{total_tax:.2f}'}] if tax_rate else [],
+                    'meta_data': [],
+                    'sku': product['sku'] if product else '',
+                    'price': price,
+                },
+            )
+
+        total = sum(float(line_item['total']) for line_item in line_items)
+        total_tax = sum(float(line_item['total_tax']) for line_item in line_items)
+        return {
+            'id': 100000 + index,
+            'parent_id': 0,
+            'number': str(100000 + index),
+            'order_key': f'wc_order_{index:08d}',
+            'created_via': 'checkout',
+            'version': '9.0.0',
+            'status': ('processing', 'completed', 'on-hold')[index % 3],
+            'currency': 'EUR',
+            'date_created': date_format(date_created),
+            'date_created_gmt': date_format(date_created),
+            'date_modified': date_format(date_created),
+            'date_modified_gmt': date_format(date_created),
+            'discount_total': '0.00',
+            'discount_tax': '0.00',
+            'shipping_total': '4.90',
+            'shipping_tax': '0.00',
+            'cart_tax': f'{total_tax:.2f}',
+            'total': f'{total + total_tax + 4.90:.2f}',
+            'total_tax': f'{total_tax:.2f}',
+            'prices_include_tax': False,
+            'customer_id': customer_id,
+            'customer_ip_address': '127.0.0.1',
+            'customer_user_agent': 'benchmark',
+            'customer_note': '',
+            'billing': billing,
+            'shipping': self.address_create(customer_id or index),
+            'payment_method': 'bacs',
+            'payment_method_title': 'Direct bank transfer',
+            'transaction_id': '',
+            'date_paid': date_format(date_created),
+            'date_paid_gmt': date_format(date_created),
+            'date_completed': None,
+            'date_completed_gmt': None,
+            'cart_hash': '',
+            'meta_data': [],
+            'line_items': line_items,
+            'tax_lines': [],
+            'shipping_lines': [{'id': index, 'method_title': 'Flat rate', 'method_id': 'flat_rate', 'total': '4.90', 'total_tax': '0.00', 'taxes': []}],
+            'fee_lines': [],
+            'coupon_lines': [],
+            'refunds': [],
+            'lang': 'en',
+        }
+
+    def settings_retrieve(self, settings_group):
+        settings = {
+            'general': {'woocommerce_currency': 'EUR', 'woocommerce_default_country': 'DE:BE'},
+            'products': {'woocommerce_weight_unit': 'kg', 'woocommerce_dimension_unit': 'cm'},
+            'tax': {'woocommerce_prices_include_tax': 'no'},
+        }.get(settings_group, {})
+        return [{'id': setting_id, 'label': setting_id, 'value': value} for setting_id, value in settings.items()]
+
+    def record_update(self, record, data):
+        with self.lock:
+            record.update({key: value for key, value in data.items() if key != 'id'})
+            date_modified = date_format(datetime.now(UTC))
+            record['date_modified'] = date_modified
+            record['date_modified_gmt'] = date_modified
+        return record
+
+
+def records_filter(records, query):
+    """Apply the WooCommerce REST API list parameters supported by the stand-in server."""
+    if query.get('include'):
+        record_ids = {int(record_id) for record_id in query['include'].split(',') if record_id}
+        records = [record for record in records if record['id'] in record_ids]
+    if query.get('type'):
+        records = [record for record in records if record.get('type') == query['type']]
+    if query.get('status') and query['status'] != 'any':
+        records = [record for record in records if record.get('status', query['status']) == query['status']]
+    if query.get('manage_stock'):
+        records = [record for record in records if record.get('manage_stock') is (query['manage_stock'] == 'true')]
+    if query.get('sku'):
+        records = [record for record in records if record.get('sku') == query['sku']]
+    if query.get('modified_after'):
+        records = [record for record in records if record['date_modified_gmt'] > query['modified_after']]
+    return records
+
+
+def fields_filter(record, fields):
+    if not fields:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+class WoocommerceMockRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'WooCommerceMock/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def response_send(self, status, body, headers=None, content_type='application/json'):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, str(value))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def listing_send(self, records, query):
+        per_page = max(1, min(int(query.get('per_page', 10)), 100))
+        page = max(1, int(query.get('page', 1)))
+        records = records_filter(records, query)
+        fields = [field for field in query.get('_fields', '').split(',') if field]
+        total_pages = max(1, -(-len(records) // per_page))
+        records_page = [fields_filter(record, fields) for record in records[(page - 1) * per_page : page * per_page]]
+        self.response_send(200, records_page, headers={'X-WP-Total': len(records), 'X-WP-TotalPages': total_pages})
+
+    def request_handle(self, method):
+        # Simulated network and WordPress latency
+        if self.server.latency_seconds:
+            time.sleep(self.server.latency_seconds)
+
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        catalog = self.server.catalog
+
+        body = None
+        if method in ('POST', 'PUT'):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length) or b'{}')
+
+        # Images
+        match = re.fullmatch(r'/images/(\d+)\.png', url.path)
+        if match and method == 'GET':
+            return self.response_send(200, image_png_create(int(match.group(1))), content_type='image/png')
+
+        if not url.path.startswith(API_PREFIX):
+            return self.response_send(404, {'code': 'rest_no_route', 'message': 'No route was found.'})
+
+        route = url.path[len(API_PREFIX) :].strip('/')
+
+        if route == 'products' and method == 'GET':
+            return self.listing_send(list(catalog.products.values()), query)
+
+        if route == 'products' and method == 'POST':
+            with catalog.lock:
+                product_id = (max(catalog.products, default=0) // 1000 + 1) * 1000
+                catalog.products[product_id] = {**catalog.product_create(product_id // 1000, 0), **body, 'id': product_id}
+            return self.response_send(201, catalog.products[product_id])
+
+        if route == 'products/batch' and method == 'POST':
+            updated = [catalog.record_update(catalog.products[item['id']], item) for item in body.get('update', []) if item.get('id') in catalog.products]
+            return self.response_send(200, {'create': [], 'update': updated, 'delete': []})
+
+        match = re.fullmatch(r'products/(\d+)', route)
+        if match:
+            product = catalog.products.get(int(match.group(1)))
+            if not product:
+                return self.response_send(404, {'code': 'woocommerce_rest_product_invalid_id', 'message': 'Invalid ID.'})
+            if method == 'PUT':
+                product = catalog.record_update(product, body)
+            return self.response_send(200, product)
+
+        match = re.fullmatch(r'products/(\d+)/variations(?:/(\d+|batch))?', route)
+        if match:
+            variations = catalog.variations.get(int(match.group(1)), {})
+            if match.group(2) is None and method == 'GET':
+                return self.listing_send(list(variations.values()), query)
+            if match.group(2) == 'batch' and method == 'POST':
+                updated = [catalog.record_update(variations[item['id']], item) for item in body.get('update', []) if item.get('id') in variations]
+                return self.response_send(200, {'create': [], 'update': updated, 'delete': []})
+            if match.group(2) and match.group(2) != 'batch':
+                variation = variations.get(int(match.group(2)))
+                if not variation:
+                    return self.response_send(404, {'code': 'woocommerce_rest_product_variation_invalid_id', 'message': 'Invalid ID.'})
+                if method == 'PUT':
+                    variation = catalog.record_update(variation, body)
+                return self.response_send(200, variation)
+
+        # Product attributes, brands, categories and tags
+        match = re.fullmatch(r'products/(attributes|brands|categories|tags)', route)
+        if match:
+            if method == 'POST':
+                return self.response_send(201, {'id': catalog.random.randint(1000, 9999), **body})
+            return self.listing_send([], query)
+
+        if route == 'customers' and method == 'GET':
+            return self.listing_send(list(catalog.customers.values()), query)
+
+        if route == 'orders' and method == 'GET':
+            return self.listing_send(list(catalog.orders.values()), query)
+
+        if route == 'taxes' and method == 'GET':
+            return self.listing_send(catalog.tax_rates, query)
+
+        match = re.fullmatch(r'settings/(\w+)', route)
+        if match and method == 'GET':
+            return self.response_send(200, catalog.settings_retrieve(match.group(1)))
+
+        return self.response_send(404, {'code': 'rest_no_route', 'message': 'No route was found matching the URL and request method.'})
+
+    def do_GET(self):
+        self.request_handle('GET')
+
+    def do_POST(self):
+        self.request_handle('POST')
+
+    def do_PUT(self):
+        self.request_handle('PUT')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WooCommerce REST API stand-in server for the Odoo-WooCommerce Sync benchmarks.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--products', type=int, default=100, help='Number of products (every second product is a variable product).')
+    parser.add_argument('--variations', type=int, default=3, help='Number of variations per variable product.')
+    parser.add_argument('--customers', type=int, default=100)
+    parser.add_argument('--orders', type=int, default=100)
+    parser.add_argument('--images', type=int, default=2, help='Number of images per product.')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latency added to every request, in milliseconds.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verbose', action='store_true')
+    arguments = parser.parse_args()
+
+    server = ThreadingHTTPServer((arguments.host, arguments.port), WoocommerceMockRequestHandler)
+    server.catalog = WoocommerceCatalog(
+        base_url=f'http://{arguments.host}:{arguments.port}',
+        products=arguments.products,
+        variations=arguments.variations,
+        customers=arguments.customers,
+        orders=arguments.orders,
+        images=arguments.images,
+        seed=arguments.seed,
+    )
+    server.latency_seconds = arguments.latency_ms / 1000
+    server.verbose = arguments.verbose
+
+    print(f'WooCommerce stand-in server listening on http://{arguments.host}:{arguments.port} ({arguments.products} products, {arguments.customers} customers, {arguments.orders} orders)', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+## Odoo-WooCommerce Sync Benchmarks - Sync stages timing
+# Last update: 2026-10-19
+
+# Runs 'woocommerce_sync' against the WooCommerce REST API stand-in server (woocommerce_mock_server.py) and reports, per sync stage, the wall and CPU time, WooCommerce REST API requests, SQL queries, throughput (records per second) and SQL queries per record, as recorded in 'woocommerce.sync.run.stage'.
+# The first run imports the whole catalog into the database (cold), the following runs only retrieve changed records (warm). Use a dedicated test database.
+
+# Usage (Odoo source directory in PYTHONPATH, see odoo-benchmark.sh): python3 woocommerce_sync_benchmark.py --config=/etc/odoo.conf --database benchmark_database
+# Environment variables:
+# WOOCOMMERCE_BENCHMARK_URL: WooCommerce stand-in server URL (default: 'http://127.0.0.1:8080')
+# WOOCOMMERCE_BENCHMARK_RUNS: number of sync runs (default: 2)
+# WOOCOMMERCE_BENCHMARK_ASYNC: '1' to enable the asynchronous transport (default: '0')
+# WOOCOMMERCE_BENCHMARK_OUTPUT: JSON output file path (optional)
+
+import json
+import os
+import sys
+
+import odoo
+import psycopg2
+import requests
+from odoo.exceptions import UserError
+
+
+def woocommerce_sync_benchmark_config_retrieve(env, woocommerce_url, async_transport):
+    """Create or update the benchmark WooCommerce configuration, pointing to the WooCommerce REST API stand-in server."""
+    values = {
+        'settings_woocommerce_connection_name': 'Benchmark',
+        'settings_woocommerce_connection_url': woocommerce_url,
+        'settings_woocommerce_consumer_key': 'ck_benchmark',
+        'settings_woocommerce_consumer_secret': 'cs_benchmark',
+        'settings_woocommerce_requests_per_second': 1000.0,
+        'settings_woocommerce_concurrency_max': 8,
+        'settings_woocommerce_async_transport': async_transport,
+        'settings_woocommerce_to_odoo_products_sync': True,
+        'settings_woocommerce_to_odoo_product_variations_sync': True,
+        'settings_woocommerce_to_odoo_customers_sync': True,
+        'settings_woocommerce_to_odoo_orders_sync': True,
+        'settings_odoo_to_woocommerce_products_sync': False,
+        'settings_woocommerce_changed_records_import': True,
+        'settings_woocommerce_products_stock_management': True,
+        'settings_woocommerce_sync_scheduled': False,
+    }
+
+    woocommerce_sync_config = env['woocommerce.configuration'].search([('settings_woocommerce_connection_url', '=', woocommerce_url)], limit=1)
+    if woocommerce_sync_config:
+        woocommerce_sync_config.write(values)
+    else:
+        woocommerce_sync_config = env['woocommerce.configuration'].create(values)
+
+    env.cr.commit()
+
+    return woocommerce_sync_config
+
+
+def woocommerce_sync_benchmark_stages(woocommerce_sync_run):
+    """Stage metrics of a sync run, with throughput and SQL queries per record."""
+    stages = []
+    for stage in woocommerce_sync_run.stage_ids.sorted('id'):
+        records = stage.records_created + stage.records_updated + stage.records_skipped + stage.records_failed
+        stages.append(
+            {
+                'stage': stage.stage,
+                'state': stage.state,
+                'wall_time': round(stage.wall_time, 3),
+                'cpu_time': round(stage.cpu_time, 3),
+                'http_requests': stage.http_requests,
+                'http_retries': stage.http_retries,
+                'http_bytes': stage.http_bytes,
+                'query_count': stage.query_count,
+                'records': records,
+                'records_failed': stage.records_failed,
+                'records_per_second': round(records / stage.wall_time, 1) if stage.wall_time else None,
+                'queries_per_record': round(stage.query_count / records, 1) if records else None,
+            },
+        )
+
+    return stages
+
+
+def woocommerce_sync_benchmark_print(run_label, stages):
+    columns = ('stage', 'wall_time', 'cpu_time', 'http_requests', 'query_count', 'records', 'records_per_second', 'queries_per_record')
+    print(f'\n{run_label}')
+    print(' '.join(f'{column:>18}' for column in columns))
+    for stage in stages:
+        print(' '.join(f'{"-" if stage[column] is None else stage[column]:>18}' for column in columns))
+
+
+def woocommerce_sync_benchmark(env):
+    woocommerce_url = os.environ.get('WOOCOMMERCE_BENCHMARK_URL', 'http://127.0.0.1:8080')
+    runs_count = int(os.environ.get('WOOCOMMERCE_BENCHMARK_RUNS', '2'))
+    async_transport = os.environ.get('WOOCOMMERCE_BENCHMARK_ASYNC', '0') == '1'
+    output_path = os.environ.get('WOOCOMMERCE_BENCHMARK_OUTPUT')
+
+    woocommerce_sync_config = woocommerce_sync_benchmark_config_retrieve(env, woocommerce_url, async_transport)
+
+    # Sync runs (the first run is cold, the following runs are warm)
+    benchmark_results = {'woocommerce_url': woocommerce_url, 'async_transport': async_transport, 'runs': []}
+    for run_index in range(runs_count):
+        try:
+            woocommerce_sync_config.woocommerce_sync()
+        except (UserError, requests.exceptions.RequestException, psycopg2.Error) as error:
+            # The failed stage is recorded in the sync run
+            print(f'Sync run failed: {error}')
+
+        woocommerce_sync_run = env['woocommerce.sync.run'].search([('woocommerce_configuration_id', '=', woocommerce_sync_config.id)], limit=1)
+        run_label = 'cold' if run_index == 0 else f'warm {run_index}'
+        stages = woocommerce_sync_benchmark_stages(woocommerce_sync_run)
+        benchmark_results['runs'].append({'run': run_label, 'state': woocommerce_sync_run.state, 'wall_time': round(woocommerce_sync_run.wall_time, 3), 'stages': stages})
+
+        woocommerce_sync_benchmark_print(f'Run: {run_label} ({woocommerce_sync_run.state}, {woocommerce_sync_run.wall_time:.1f} s)', stages)
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+        print(f'\nBenchmark results saved to {output_path}')
+
+    return benchmark_results
+
+
+def main():
+    odoo.tools.config.parse_config(sys.argv[1:])
+
+    with odoo.registry(odoo.tools.config['db_name']).cursor() as cr:
+        env = odoo.api.Environment(cr, odoo.SUPERUSER_ID, {})
+        woocommerce_sync_benchmark(env)
+
+
+if __name__ == '__main__':
+    main()
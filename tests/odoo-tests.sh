@@ -61,3 +61,11 @@ $website_root_directory/odoo/venv/bin/python3 $website_root_directory/odoo/odoo-
 	--database $database_name \
 	--update $odoo_addon_name \
 	--load=product
+
+# Run the WooCommerce Sync module tests (SQL queries and WooCommerce REST API requests per sync step, against recorded fixtures) on a dedicated test database
+# $website_root_directory/odoo/venv/bin/python3 $website_root_directory/odoo/odoo-bin \
+#     --config=$odoo_conf \
+#     --database ${database_name}_test \
+#     --init $odoo_addon_name \
+#     --test-tags /$odoo_addon_name \
+#     --stop-after-init
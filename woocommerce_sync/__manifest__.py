@@ -6,7 +6,7 @@
     'author': 'roboes',
     'website': 'https://github.com/roboes/odoo-woocommerce-sync',
     'category': 'Connectors',
-    'version': '1.0',
+    'version': '1.1',
     'depends': ['account', 'contacts', 'queue_job', 'product', 'sale_management', 'stock'],
     'data': [
         'security/ir.model.access.csv',
@@ -21,6 +21,7 @@
         'views/sale_order_form.xml',
         'views/sale_order_tree.xml',
         'views/views.xml',
+        'views/woocommerce_sync_run.xml',
     ],
     'assets': {
         'web.assets_backend': [
@@ -0,0 +1,58 @@
+import logging
+
+# Settings
+_logger = logging.getLogger(__name__)
+
+# Raw WooCommerce payload columns moved to 'woocommerce.payload.archive', by model
+WOOCOMMERCE_PAYLOAD_COLUMNS = {
+    'product.template': [
+        'woocommerce_product_downloads',
+        'woocommerce_product_categories',
+        'woocommerce_product_tags',
+        'woocommerce_product_attributes',
+        'woocommerce_product_default_attributes',
+        'woocommerce_product_variations',
+        'woocommerce_product_grouped_products',
+        'woocommerce_product_meta_data',
+        'woocommerce_product_brands',
+    ],
+    'product.product': ['woocommerce_product_variation_downloads', 'woocommerce_product_variation_attributes', 'woocommerce_product_variation_meta_data'],
+    'res.partner': ['woocommerce_customer_meta_data'],
+    'sale.order': [
+        'woocommerce_order_meta_data',
+        'woocommerce_order_line_items',
+        'woocommerce_order_tax_lines',
+        'woocommerce_order_shipping_lines',
+        'woocommerce_order_fee_lines',
+        'woocommerce_order_coupon_lines',
+        'woocommerce_order_refunds',
+    ],
+}
+
+
+def migrate(cr, version):
+    """Move the raw WooCommerce payload columns into 'woocommerce_payload_archive' and drop them. Run 'VACUUM FULL' on the affected tables afterwards to return the space to the operating system."""
+    for model_name, column_names in WOOCOMMERCE_PAYLOAD_COLUMNS.items():
+        table_name = model_name.replace('.', '_')
+
+        cr.execute('SELECT column_name FROM information_schema.columns WHERE table_name = %s AND column_name IN %s', (table_name, tuple(column_names)))
+        column_names_existing = [row[0] for row in cr.fetchall()]
+        if not column_names_existing:
+            continue
+
+        payload_expression = 'jsonb_strip_nulls(jsonb_build_object({}))'.format(', '.join(f"'{column_name}', {column_name}::jsonb" for column_name in column_names_existing))
+        payload_condition = ' OR '.join(f'{column_name} IS NOT NULL' for column_name in column_names_existing)
+
+        cr.execute(
+            f"""
+            INSERT INTO woocommerce_payload_archive (res_model, res_id, payload, create_uid, create_date, write_uid, write_date)
+            SELECT %s, id, {payload_expression}, 1, now() AT TIME ZONE 'UTC', 1, now() AT TIME ZONE 'UTC'
+            FROM {table_name}
+            WHERE {payload_condition}
+            ON CONFLICT (res_model, res_id) DO UPDATE SET payload = woocommerce_payload_archive.payload || EXCLUDED.payload
+            """,
+            (model_name,),
+        )
+        _logger.info(f'Archived the WooCommerce payloads of {cr.rowcount} {model_name} records.')
+
+        cr.execute(f'ALTER TABLE {table_name} {", ".join(f"DROP COLUMN {column_name}" for column_name in column_names_existing)}')
@@ -1,4 +1,6 @@
 from . import models
 from . import woocommerce_models
+from . import woocommerce_payload_archive
+from . import woocommerce_sync_run
 
-__all__ = ['models', 'woocommerce_models']
+__all__ = ['models', 'woocommerce_models', 'woocommerce_payload_archive', 'woocommerce_sync_run']
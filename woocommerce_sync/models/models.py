@@ -1,26 +1,251 @@
 from base64 import b64encode
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import hashlib
 from io import BytesIO
+import json
 import logging
 from PIL import Image
-import pytz
 import requests
+import time
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from odoo.tools import float_is_zero
 
-from woocommerce import API
+from ..tools.woocommerce_api import WoocommerceApi
+from ..tools.woocommerce_api_async import WoocommerceAsyncApi
 
 # Settings
 _logger = logging.getLogger(__name__)
 
+# WooCommerce REST API fields retrieved by each sync step ('_fields' parameter), so that unused data (e.g. '_links') is not downloaded
+WOOCOMMERCE_PRODUCT_FIELDS = (
+    'id',
+    'name',
+    'slug',
+    'permalink',
+    'date_created',
+    'date_created_gmt',
+    'date_modified',
+    'date_modified_gmt',
+    'type',
+    'status',
+    'featured',
+    'catalog_visibility',
+    'description',
+    'short_description',
+    'sku',
+    'price',
+    'regular_price',
+    'sale_price',
+    'date_on_sale_from',
+    'date_on_sale_from_gmt',
+    'date_on_sale_to',
+    'date_on_sale_to_gmt',
+    'price_html',
+    'on_sale',
+    'purchasable',
+    'total_sales',
+    'virtual',
+    'downloadable',
+    'downloads',
+    'download_limit',
+    'download_expiry',
+    'external_url',
+    'button_text',
+    'tax_status',
+    'tax_class',
+    'manage_stock',
+    'stock_quantity',
+    'stock_status',
+    'backorders',
+    'backorders_allowed',
+    'backordered',
+    'sold_individually',
+    'weight',
+    'dimensions',
+    'shipping_required',
+    'shipping_taxable',
+    'shipping_class',
+    'shipping_class_id',
+    'reviews_allowed',
+    'average_rating',
+    'rating_count',
+    'related_ids',
+    'upsell_ids',
+    'cross_sell_ids',
+    'parent_id',
+    'purchase_note',
+    'categories',
+    'tags',
+    'images',
+    'attributes',
+    'default_attributes',
+    'variations',
+    'grouped_products',
+    'menu_order',
+    'meta_data',
+    'brands',
+    'lang',
+)
+WOOCOMMERCE_PRODUCT_VARIATION_FIELDS = (
+    'id',
+    'name',
+    'type',
+    'permalink',
+    'date_created',
+    'date_created_gmt',
+    'date_modified',
+    'date_modified_gmt',
+    'status',
+    'description',
+    'sku',
+    'price',
+    'regular_price',
+    'sale_price',
+    'date_on_sale_from',
+    'date_on_sale_from_gmt',
+    'date_on_sale_to',
+    'date_on_sale_to_gmt',
+    'on_sale',
+    'purchasable',
+    'virtual',
+    'downloadable',
+    'downloads',
+    'download_limit',
+    'download_expiry',
+    'tax_status',
+    'tax_class',
+    'manage_stock',
+    'stock_quantity',
+    'stock_status',
+    'backorders',
+    'backorders_allowed',
+    'backordered',
+    'weight',
+    'dimensions',
+    'shipping_class',
+    'shipping_class_id',
+    'image',
+    'attributes',
+    'menu_order',
+    'meta_data',
+    'parent_id',
+)
+WOOCOMMERCE_PRODUCT_STOCK_FIELDS = ('id', 'stock_quantity', 'date_modified_gmt')
+
+# Maximum number of records per request of the WooCommerce REST API batch endpoints (e.g. 'products/batch')
+WOOCOMMERCE_BATCH_SIZE = 100
+
+WOOCOMMERCE_CUSTOMER_FIELDS = (
+    'id',
+    'date_created',
+    'date_created_gmt',
+    'date_modified',
+    'date_modified_gmt',
+    'email',
+    'first_name',
+    'last_name',
+    'role',
+    'username',
+    'is_paying_customer',
+    'avatar_url',
+    'meta_data',
+    'billing',
+    'shipping',
+)
+WOOCOMMERCE_ORDER_FIELDS = (
+    'id',
+    'parent_id',
+    'number',
+    'order_key',
+    'created_via',
+    'version',
+    'status',
+    'currency',
+    'date_created',
+    'date_created_gmt',
+    'date_modified',
+    'date_modified_gmt',
+    'discount_total',
+    'discount_tax',
+    'shipping_total',
+    'shipping_tax',
+    'cart_tax',
+    'total',
+    'total_tax',
+    'prices_include_tax',
+    'customer_id',
+    'customer_ip_address',
+    'customer_user_agent',
+    'customer_note',
+    'billing',
+    'shipping',
+    'payment_method',
+    'payment_method_title',
+    'transaction_id',
+    'date_paid',
+    'date_paid_gmt',
+    'date_completed',
+    'date_completed_gmt',
+    'cart_hash',
+    'meta_data',
+    'line_items',
+    'tax_lines',
+    'shipping_lines',
+    'fee_lines',
+    'coupon_lines',
+    'refunds',
+    'lang',
+)
+
+
+# WooCommerce REST API fields excluded from the payload hash, as they change without any content change (e.g. stock decrements touch the modified dates, stock is synced separately)
+WOOCOMMERCE_PAYLOAD_HASH_EXCLUDED_FIELDS = ('_links', 'date_modified', 'date_modified_gmt', 'stock_quantity', 'stock_status', 'total_sales')
+
+# Payload hash fields, by model, cleared when the payload fingerprint of a WooCommerce configuration changes
+WOOCOMMERCE_PAYLOAD_HASH_FIELD_PREFIXES = {
+    'product.template': 'woocommerce_product',
+    'product.product': 'woocommerce_product_variation',
+    'res.partner': 'woocommerce_customer',
+    'sale.order': 'woocommerce_order',
+}
+
+# WooCommerce configuration settings affecting how WooCommerce payloads are imported, part of the payload fingerprint
+WOOCOMMERCE_PAYLOAD_FINGERPRINT_SETTINGS = (
+    'settings_woocommerce_user_responsible',
+    'settings_woocommerce_images_sync',
+    'settings_woocommerce_products_stock_management',
+    'settings_woocommerce_products_warehouse_location',
+    'settings_woocommerce_to_odoo_products_language_code',
+    'settings_woocommerce_orders_customers_map',
+    'settings_woocommerce_order_line_items_product_map',
+)
+
+
+# Sync steps locked separately (PostgreSQL advisory locks) for each WooCommerce configuration
+WOOCOMMERCE_SYNC_LOCK_ENTITIES = ('products', 'product_variations', 'products_related_ids', 'customers', 'orders', 'odoo_products', 'stock')
+
 
 class WoocommerceSyncLog(models.Model):
     _name = 'woocommerce.sync.log'
     _description = 'WooCommerce Sync Log'
 
+    woocommerce_configuration_id = fields.Many2one(comodel_name='woocommerce.configuration', string='WooCommerce Configuration', ondelete='cascade', index=True)
     woocommerce_last_synced = fields.Datetime(string='Sync Date', readonly=True)
 
+    # Most recent WooCommerce 'date_modified_gmt' imported for each entity (GMT), used for the 'modified_after' WooCommerce REST API parameter
+    woocommerce_products_watermark = fields.Datetime(string='Products Watermark', readonly=True)
+    woocommerce_product_variations_watermark = fields.Datetime(string='Product Variations Watermark', readonly=True)
+    woocommerce_customers_watermark = fields.Datetime(string='Customers Watermark', readonly=True)
+    woocommerce_orders_watermark = fields.Datetime(string='Orders Watermark', readonly=True)
+
+    # Fingerprint of the store settings and sync settings the stored payload hashes were computed with
+    woocommerce_payload_fingerprint = fields.Char(string='Payload Fingerprint', readonly=True)
+
 
 class WoocommerceConnector(models.Model):
     _name = 'woocommerce.configuration'
@@ -35,6 +260,22 @@ class WoocommerceConnector(models.Model):
     settings_woocommerce_consumer_key = fields.Char(string='Consumer Key')
     settings_woocommerce_consumer_secret = fields.Char(string='Consumer Secret')
     settings_woocommerce_timeout = fields.Integer(string='Timeout', default=30)
+    settings_woocommerce_requests_per_second = fields.Float(string='Requests per Second', default=5.0, help='Maximum average number of WooCommerce REST API requests per second.')
+    settings_woocommerce_concurrency_max = fields.Integer(
+        string='Maximum Concurrent Requests',
+        default=4,
+        help='Upper limit of concurrent WooCommerce REST API requests. The number of concurrent requests grows up to this limit while the store responds normally and is halved when it throttles.',
+    )
+    settings_woocommerce_retries_max = fields.Integer(
+        string='Maximum Retries',
+        default=5,
+        help="Number of retries, with exponential backoff, of throttled (HTTP 429/503) or timed out WooCommerce REST API requests. The 'Retry-After' header is honored.",
+    )
+    settings_woocommerce_async_transport = fields.Boolean(
+        string='Concurrent Requests (asyncio)',
+        default=False,
+        help="If enabled, listing pages, changed records, stock updates and image downloads are requested concurrently using an asynchronous transport. Requires the 'httpx' Python package.",
+    )
 
     # Sync items settings
     settings_woocommerce_to_odoo_products_sync = fields.Boolean(default=True)
@@ -56,6 +297,16 @@ class WoocommerceConnector(models.Model):
         help="If enabled, only records modified since the last import will be retrieved from WooCommerce using the 'modified_after' WooCommerce REST API parameter. Only enable this option after the first import.",
         default=False,
     )
+    settings_woocommerce_modified_records_overlap_minutes = fields.Integer(
+        string='Modified records overlap (minutes)',
+        help='Records modified up to this number of minutes before the last imported record are retrieved again, so that records saved while the previous import was running are not missed.',
+        default=10,
+    )
+    settings_woocommerce_changed_records_import = fields.Boolean(
+        string='Download only changed records?',
+        help="If enabled, the IDs and modified dates of all WooCommerce records are listed first and compared with the dates stored in Odoo, and only the changed records are then fully downloaded using the 'include' WooCommerce REST API parameter.",
+        default=False,
+    )
     settings_woocommerce_images_sync = fields.Boolean(string='Sync images?', default=True)
 
     # WooCommerce to Odoo products import settings
@@ -66,6 +317,16 @@ class WoocommerceConnector(models.Model):
         default=lambda self: self.env.ref('stock.stock_location_stock'),
         help='Warehouse location for syncing WooCommerce products stock quantity.',
     )
+    settings_woocommerce_stock_push = fields.Boolean(
+        string='Push Odoo stock changes immediately?',
+        help='If enabled, the stock quantity levels of products changed by validated stock moves (e.g. receipts, deliveries, inventory adjustments) are pushed to WooCommerce in the background (requires queue_job add-on), without waiting for the next stock sync.',
+        default=False,
+    )
+    settings_woocommerce_stock_push_delay_seconds = fields.Integer(
+        string='Stock Push Delay (in Seconds)',
+        default=30,
+        help='Stock changes are pushed this number of seconds after the first change, so that bursts of stock moves (e.g. a receipt with hundreds of lines) are pushed together in batches.',
+    )
     settings_woocommerce_products_related_ids_map = fields.Boolean(string='Map related products?', help="Automatically map WooCommerce 'related_ids' products to their Odoo equivalents.", default=False)
     settings_woocommerce_to_odoo_products_language_code = fields.Char(string='Filter WooCommerce products by language (requires Polylang)', help="2-digit language code (ISO 639-1) (e.g. 'en').")
 
@@ -92,13 +353,40 @@ class WoocommerceConnector(models.Model):
     settings_woocommerce_sync_scheduled_interval_minutes = fields.Integer(string='Interval (in Minutes)', default=5)
     ir_cron_id = fields.Many2one(comodel_name='ir.cron', string='Scheduled Cron Job', ondelete='cascade')
 
+    # Debug settings
+    settings_woocommerce_debug_profiling = fields.Selection(
+        selection=[('none', 'Disabled'), ('cprofile', 'cProfile (deterministic)'), ('sampling', 'Sampling (flame graph)')],
+        string='Profile Sync Stages',
+        default='none',
+        required=True,
+        help="Debug mode: profile each sync stage and save the output as attachments of the sync run. 'cProfile' saves a '.prof' file and a text report sorted by cumulative time (with noticeable overhead); 'Sampling' saves collapsed stacks, ready to be rendered as a flame graph (with low overhead, suitable for production workloads).",
+    )
+
+    # Sync locks
+    settings_woocommerce_sync_lock_timeout_seconds = fields.Integer(
+        string='Sync Lock Wait (in Seconds)',
+        default=0,
+        help='Each sync step (e.g. products, orders) of a WooCommerce configuration runs at most once at a time. If a step is already running (e.g. the previous scheduled sync, a manual sync or a queue job), wait up to this number of seconds for it to finish, then skip it. 0 skips immediately.',
+    )
+    woocommerce_sync_lock_holders = fields.Text(string='Running Sync Steps', compute='woocommerce_sync_lock_holders_compute', store=False, readonly=True)
+
+    # WooCommerce store settings cache (currency, measurement units, taxes)
+    settings_woocommerce_store_settings_ttl_minutes = fields.Integer(
+        string='Store Settings Cache (in Minutes)',
+        default=60,
+        help='WooCommerce store settings (currency, measurement units, taxes) are cached for this number of minutes. Once expired, the cached settings are still used while they are refreshed in the background (requires queue_job add-on).',
+    )
+    woocommerce_store_settings = fields.Json(string='Store Settings', readonly=True, copy=False)
+    woocommerce_store_settings_date = fields.Datetime(string='Store Settings Updated', readonly=True, copy=False)
+
     # Last synced
     woocommerce_last_synced = fields.Datetime(string='Last Synced', compute='woocommerce_last_synced_retrieve', store=False, readonly=True)
 
     def woocommerce_last_synced_retrieve(self):
-        sync_log = self.env['woocommerce.sync.log'].search([], limit=1)
+        sync_logs = self.env['woocommerce.sync.log'].search([('woocommerce_configuration_id', 'in', self.ids)])
+        sync_logs_map = {sync_log.woocommerce_configuration_id.id: sync_log for sync_log in sync_logs}
         for record in self:
-            record.woocommerce_last_synced = sync_log.woocommerce_last_synced if sync_log else False
+            record.woocommerce_last_synced = sync_logs_map[record.id].woocommerce_last_synced if record.id in sync_logs_map else False
 
     @api.model
     def create(self, values):
@@ -114,23 +402,27 @@ class WoocommerceConnector(models.Model):
             return super().write(values)
 
         res = super().write(values)
-        for rec in self:
-            rec.cron_job_update()
+
+        # Update the cron job only if a scheduling-related setting changed (e.g. not when caching store settings)
+        if values.keys() & {'settings_woocommerce_sync_scheduled', 'settings_woocommerce_sync_scheduled_interval_minutes', 'settings_woocommerce_connection_url'}:
+            for rec in self:
+                rec.cron_job_update()
         return res
 
     def cron_job_update(self):
-        # Odoo-WooCommerce settings
-        woocommerce_sync_config = self.env['woocommerce.configuration'].search([], limit=1)
+        self.ensure_one()
+
+        # Each WooCommerce configuration has its own cron job, interval and queue job (a new queue job is not enqueued while one for the same store is still pending)
         cron_values = {
             'name': f'WooCommerce Auto-Sync - {self.settings_woocommerce_connection_url}',
             'model_id': self.env['ir.model']._get(self._name).id,
             'code': (
-                f'model.with_context(cron_running=True).browse({self.id}).with_delay().woocommerce_sync()'
+                f"model.with_context(cron_running=True).browse({self.id}).with_delay(identity_key='woocommerce_sync_{self.id}', description='WooCommerce Sync - {self.woocommerce_connection_sequence}').woocommerce_sync()"
                 if self.env['ir.module.module'].search([('name', '=', 'queue_job'), ('state', '=', 'installed')], limit=1)
                 else f'model.with_context(cron_running=True).browse({self.id}).woocommerce_sync()'
             ),
             'active': self.settings_woocommerce_sync_scheduled,
-            'interval_number': woocommerce_sync_config.settings_woocommerce_sync_scheduled_interval_minutes,
+            'interval_number': self.settings_woocommerce_sync_scheduled_interval_minutes,
             'interval_type': 'minutes',
             'numbercall': -1,
         }
@@ -148,7 +440,7 @@ class WoocommerceConnector(models.Model):
 
         # Run woocommerce_sync in the background (requires 'queue_job' add-on)
         if self.env['ir.module.module'].search([('name', '=', 'queue_job'), ('state', '=', 'installed')], limit=1):
-            self.with_delay().woocommerce_sync()
+            self.with_delay(identity_key=f'woocommerce_sync_{self.id}', description=f'WooCommerce Sync - {self.woocommerce_connection_sequence}').woocommerce_sync()
 
             return {
                 'type': 'ir.actions.client',
@@ -179,8 +471,24 @@ class WoocommerceConnector(models.Model):
             _logger.warning('No WooCommerce configuration records found for sync.')
             return
 
+        # Each WooCommerce configuration (store) is synced with its own settings, WooCommerce REST API client and watermarks
+        for woocommerce_sync_config in self:
+            try:
+                woocommerce_sync_config.woocommerce_sync_store()
+
+            except Exception as error:
+                if len(self) == 1:
+                    raise
+
+                # Roll back changes and continue with the next store
+                self.env.cr.rollback()
+                _logger.exception(f'Error syncing WooCommerce store {woocommerce_sync_config.settings_woocommerce_connection_url}: {error}')
+
+    def woocommerce_sync_store(self):
+        self.ensure_one()
+
         # Odoo-WooCommerce settings
-        woocommerce_sync_config = self.env['woocommerce.configuration'].search([], limit=1)
+        woocommerce_sync_config = self
 
         # WooCommerce REST API
         woocommerce_api = self.woocommerce_api_get(woocommerce_sync_config)
@@ -191,23 +499,54 @@ class WoocommerceConnector(models.Model):
             _logger.error(error_message)
             raise UserError(_(error_message))
 
+        # Sync run (stage metrics)
+        woocommerce_sync_run = self.env['woocommerce.sync.run'].run_start(woocommerce_sync_config)
+
+        try:
+            self.woocommerce_sync_store_steps(woocommerce_sync_config, woocommerce_api, woocommerce_sync_run)
+
+        except Exception as error:
+            self.env.cr.rollback()
+            woocommerce_sync_run.run_finish(error=error)
+            raise
+
+        woocommerce_sync_run.run_finish()
+
+        # Store 'woocommerce_last_synced'
+        self.woocommerce_sync_log_retrieve(woocommerce_sync_config).write({'woocommerce_last_synced': fields.Datetime.now()})
+
+    def woocommerce_sync_store_steps(self, woocommerce_sync_config, woocommerce_api, woocommerce_sync_run):
+        # WooCommerce store settings (cached)
+        with woocommerce_sync_run.stage_measure('store_settings', woocommerce_api):
+            woocommerce_store_settings = self.woocommerce_store_settings_retrieve(woocommerce_sync_config, woocommerce_api)
+
+        # Payload hashes computed with other store settings or import settings are cleared
+        self.woocommerce_payload_fingerprint_check(woocommerce_sync_config, woocommerce_store_settings)
+
         # WooCommerce to Odoo
 
         ### WooCommerce currency
-        woocommerce_currency = woocommerce_api.get(endpoint='settings/general/woocommerce_currency').json()['value']
+        woocommerce_currency = woocommerce_store_settings['currency']
 
         ### WooCommerce measurements
-        woocommerce_weight_unit = woocommerce_api.get(endpoint='settings/products/woocommerce_weight_unit').json()['value']
-        woocommerce_dimension_unit = woocommerce_api.get(endpoint='settings/products/woocommerce_dimension_unit').json()['value']
+        woocommerce_weight_unit = woocommerce_store_settings['weight_unit']
+        woocommerce_dimension_unit = woocommerce_store_settings['dimension_unit']
 
         ### WooCommerce taxes
-        woocommerce_product_prices_include_tax = True if woocommerce_api.get(endpoint='settings/tax/woocommerce_prices_include_tax').json()['value'].lower() == 'yes' else False
-        woocommerce_tax_rates = woocommerce_api.get(endpoint='taxes').json()
-        woocommerce_tax_rates = {woocommerce_tax_rate['class']: float(woocommerce_tax_rate['rate']) for woocommerce_tax_rate in woocommerce_tax_rates}
+        woocommerce_product_prices_include_tax = woocommerce_store_settings['prices_include_tax']
+        woocommerce_tax_rates_index = self.woocommerce_tax_rates_index_build(woocommerce_store_settings['tax_rates'])
+
+        # Tax rates by tax class for the store base location, used for product prices
+        woocommerce_tax_rates = self.woocommerce_tax_rates_location_retrieve(woocommerce_tax_rates_index, woocommerce_store_settings.get('default_country'))
 
         ## Products
         if woocommerce_sync_config.settings_woocommerce_to_odoo_products_sync:
-            self.woocommerce_to_odoo_products_sync(
+            self.woocommerce_sync_step_run(
+                woocommerce_sync_run,
+                woocommerce_sync_config,
+                'products',
+                woocommerce_api,
+                self.woocommerce_to_odoo_products_sync,
                 woocommerce_sync_config,
                 woocommerce_api,
                 woocommerce_currency,
@@ -219,7 +558,12 @@ class WoocommerceConnector(models.Model):
 
         ## Product variations
         if woocommerce_sync_config.settings_woocommerce_to_odoo_products_sync and woocommerce_sync_config.settings_woocommerce_to_odoo_product_variations_sync:
-            self.woocommerce_to_odoo_products_variations_sync(
+            self.woocommerce_sync_step_run(
+                woocommerce_sync_run,
+                woocommerce_sync_config,
+                'product_variations',
+                woocommerce_api,
+                self.woocommerce_to_odoo_products_variations_sync,
                 woocommerce_sync_config,
                 woocommerce_api,
                 woocommerce_currency,
@@ -231,21 +575,36 @@ class WoocommerceConnector(models.Model):
 
         ## Products related ids map
         if woocommerce_sync_config.settings_woocommerce_products_related_ids_map:
-            self.woocommerce_to_odoo_product_related_ids(woocommerce_sync_config)
+            self.woocommerce_sync_step_run(woocommerce_sync_run, woocommerce_sync_config, 'products_related_ids', woocommerce_api, self.woocommerce_to_odoo_product_related_ids, woocommerce_sync_config)
 
         ## Customers
         if woocommerce_sync_config.settings_woocommerce_to_odoo_customers_sync:
-            self.woocommerce_to_odoo_customers_sync(woocommerce_sync_config, woocommerce_api)
+            self.woocommerce_sync_step_run(woocommerce_sync_run, woocommerce_sync_config, 'customers', woocommerce_api, self.woocommerce_to_odoo_customers_sync, woocommerce_sync_config, woocommerce_api)
 
         ## Orders
         if woocommerce_sync_config.settings_woocommerce_to_odoo_orders_sync:
-            self.woocommerce_to_odoo_orders_sync(woocommerce_sync_config, woocommerce_api, woocommerce_tax_rates, woocommerce_weight_unit)
+            self.woocommerce_sync_step_run(
+                woocommerce_sync_run,
+                woocommerce_sync_config,
+                'orders',
+                woocommerce_api,
+                self.woocommerce_to_odoo_orders_sync,
+                woocommerce_sync_config,
+                woocommerce_api,
+                woocommerce_tax_rates_index,
+                woocommerce_weight_unit,
+            )
 
         # Odoo to WooCommerce
 
         ## Products
         if woocommerce_sync_config.settings_odoo_to_woocommerce_products_sync:
-            self.odoo_to_woocommerce_products_sync(
+            self.woocommerce_sync_step_run(
+                woocommerce_sync_run,
+                woocommerce_sync_config,
+                'odoo_products',
+                woocommerce_api,
+                self.odoo_to_woocommerce_products_sync,
                 woocommerce_sync_config,
                 woocommerce_api,
                 woocommerce_currency,
@@ -257,34 +616,115 @@ class WoocommerceConnector(models.Model):
 
         # Stock
         if woocommerce_sync_config.settings_woocommerce_products_stock_management:
-            self.product_stock_quantity_create_or_update(woocommerce_sync_config, woocommerce_api)
+            self.woocommerce_sync_step_run(woocommerce_sync_run, woocommerce_sync_config, 'stock', woocommerce_api, self.product_stock_quantity_create_or_update, woocommerce_sync_config, woocommerce_api)
 
-        # Store 'woocommerce_last_synced'
-        woocommerce_sync_log = self.env['woocommerce.sync.log'].search([], limit=1)
+    @staticmethod
+    def woocommerce_sync_lock_key(woocommerce_sync_config_id, entity):
+        """PostgreSQL advisory lock key (signed 64-bit integer) of a WooCommerce configuration and entity."""
+        return int.from_bytes(hashlib.sha256(f'woocommerce_sync:{woocommerce_sync_config_id}:{entity}'.encode()).digest()[:8], 'big', signed=True)
+
+    def woocommerce_sync_lock_holders_retrieve(self, lock_key):
+        """Retrieve the PostgreSQL sessions holding an advisory lock."""
+        # A bigint advisory lock key is stored in 'pg_locks' as two 32-bit halves ('classid': high, 'objid': low) with 'objsubid' 1
+        self.env.cr.execute(
+            """
+            SELECT activity.pid, activity.application_name, activity.client_addr, activity.backend_start, activity.xact_start, activity.state
+            FROM pg_locks AS locks
+            JOIN pg_stat_activity AS activity ON activity.pid = locks.pid
+            WHERE locks.locktype = 'advisory' AND locks.granted AND locks.objsubid = 1 AND locks.classid::bigint = %s AND locks.objid::bigint = %s
+            """,
+            ((lock_key >> 32) & 0xFFFFFFFF, lock_key & 0xFFFFFFFF),
+        )
+        return self.env.cr.dictfetchall()
 
-        if woocommerce_sync_log:
-            woocommerce_sync_log.write({'woocommerce_last_synced': fields.Datetime.now()})
-        else:
-            self.env['woocommerce.sync.log'].create({'woocommerce_last_synced': fields.Datetime.now()})
+    @contextmanager
+    def woocommerce_sync_lock(self, woocommerce_sync_config, entity):
+        """Acquire the session-level PostgreSQL advisory lock of a WooCommerce configuration and entity (session-level, since sync steps commit per record). Waits up to the configured timeout and yields whether the lock was acquired."""
+        lock_key = self.woocommerce_sync_lock_key(woocommerce_sync_config.id, entity)
+        lock_deadline = time.monotonic() + max(woocommerce_sync_config.settings_woocommerce_sync_lock_timeout_seconds, 0)
+
+        while True:
+            self.env.cr.execute('SELECT pg_try_advisory_lock(%s)', (lock_key,))
+            if self.env.cr.fetchone()[0]:
+                break
+
+            if time.monotonic() >= lock_deadline:
+                lock_holders = ', '.join(
+                    f'PID {holder["pid"]} ({holder["application_name"] or "unknown"}, started {holder["xact_start"] or holder["backend_start"]})' for holder in self.woocommerce_sync_lock_holders_retrieve(lock_key)
+                )
+                _logger.warning(f"WooCommerce sync of '{entity}' for {woocommerce_sync_config.settings_woocommerce_connection_url} is already running (held by {lock_holders or 'another session'}), skipping.")
+                yield False
+                return
+
+            time.sleep(min(5.0, max(lock_deadline - time.monotonic(), 0.1)))
+
+        try:
+            yield True
+        except Exception:
+            # Leave the cursor usable for releasing the lock
+            self.env.cr.rollback()
+            raise
+        finally:
+            self.env.cr.execute('SELECT pg_advisory_unlock(%s)', (lock_key,))
+
+    def woocommerce_sync_step_run(self, woocommerce_sync_run, woocommerce_sync_config, entity, woocommerce_api, step_method, *args):
+        """Run a sync step while holding the advisory lock of its WooCommerce configuration and entity, and record its metrics as a stage of the sync run. The step is skipped if the lock cannot be acquired (e.g. the previous scheduled sync, a manual sync or a queue job is still running it)."""
+        with self.woocommerce_sync_lock(woocommerce_sync_config, entity) as woocommerce_sync_lock_acquired:
+            if not woocommerce_sync_lock_acquired:
+                woocommerce_sync_run.stage_record(entity, state='skipped')
+                return None
+
+            with woocommerce_sync_run.stage_measure(entity, woocommerce_api) as woocommerce_sync_stage:
+                woocommerce_sync_stage['counts'] = step_method(*args)
+
+            return woocommerce_sync_stage['counts']
+
+    @staticmethod
+    def woocommerce_sync_counts_complete(woocommerce_sync_counts, woocommerce_records_count, woocommerce_records_failed_count):
+        """Complete the record counts of a sync step: records neither created, updated nor failed were skipped (unchanged)."""
+        woocommerce_sync_counts['failed'] = woocommerce_records_failed_count
+        woocommerce_sync_counts['skipped'] = max(woocommerce_records_count - woocommerce_sync_counts['created'] - woocommerce_sync_counts['updated'] - woocommerce_records_failed_count, 0)
+        return woocommerce_sync_counts
+
+    def woocommerce_sync_lock_holders_compute(self):
+        for record in self:
+            woocommerce_sync_lock_holders = []
+            if record.id:
+                for entity in WOOCOMMERCE_SYNC_LOCK_ENTITIES:
+                    for holder in self.woocommerce_sync_lock_holders_retrieve(self.woocommerce_sync_lock_key(record.id, entity)):
+                        woocommerce_sync_lock_holders.append(
+                            f'{entity}: PID {holder["pid"]} ({holder["application_name"] or "unknown"}, {holder["client_addr"] or "local"}), started {holder["xact_start"] or holder["backend_start"]}, {holder["state"]}',
+                        )
+            record.woocommerce_sync_lock_holders = '\n'.join(woocommerce_sync_lock_holders) or False
 
     @api.depends('settings_woocommerce_connection_url', 'settings_woocommerce_consumer_key', 'settings_woocommerce_consumer_secret', 'settings_woocommerce_timeout')
     @api.returns('woocommerce.api')
     def woocommerce_api_get(self, woocommerce_sync_config):
         """Retrieves WooCommerce REST API instance."""
 
-        woocommerce_api = API(
+        woocommerce_api = WoocommerceApi(
             url=woocommerce_sync_config.settings_woocommerce_connection_url,
             consumer_key=woocommerce_sync_config.settings_woocommerce_consumer_key,
             consumer_secret=woocommerce_sync_config.settings_woocommerce_consumer_secret,
+            requests_per_second=woocommerce_sync_config.settings_woocommerce_requests_per_second,
+            concurrency_max=woocommerce_sync_config.settings_woocommerce_concurrency_max,
+            retries_max=woocommerce_sync_config.settings_woocommerce_retries_max,
             version='wc/v3',
             timeout=woocommerce_sync_config.settings_woocommerce_timeout,
             # query_string_auth=False,
             user_agent='Odoo-Woocommerce Sync',
         )
 
-        # Test WooCommerce REST API Connection
+        # Asynchronous transport
+        if woocommerce_sync_config.settings_woocommerce_async_transport:
+            if WoocommerceAsyncApi.is_available():
+                woocommerce_api.async_transport = WoocommerceAsyncApi(woocommerce_api)
+            else:
+                _logger.warning("The 'httpx' Python package is not installed, falling back to sequential WooCommerce REST API requests.")
+
+        # Test WooCommerce REST API Connection (using a cheap request, as 'system_status' is one of the most expensive WooCommerce REST API endpoints)
         try:
-            response = woocommerce_api.get(endpoint='system_status')
+            response = woocommerce_api.get(endpoint='products', params={'per_page': 1, '_fields': 'id'})
             if response.status_code == 200:
                 _logger.info('WooCommerce REST API connection successful.')
                 return woocommerce_api
@@ -295,8 +735,89 @@ class WoocommerceConnector(models.Model):
             _logger.error(f'WooCommerce REST API connection failed: {error}')
             return False
 
+    def woocommerce_store_settings_fetch(self, woocommerce_api):
+        """Retrieve the WooCommerce store settings used by the sync (currency, measurement units, taxes), requesting each settings group once."""
+        woocommerce_settings = {}
+        for settings_group in ('general', 'products', 'tax'):
+            response = woocommerce_api.get(endpoint=f'settings/{settings_group}')
+            if response.status_code != 200:
+                raise UserError(_(f"WooCommerce REST API endpoint 'settings/{settings_group}' returned status {response.status_code}: {response.text[:500]}"))
+            woocommerce_settings.update({setting['id']: setting.get('value') for setting in response.json()})
+
+        return {
+            'currency': woocommerce_settings.get('woocommerce_currency'),
+            'weight_unit': woocommerce_settings.get('woocommerce_weight_unit'),
+            'dimension_unit': woocommerce_settings.get('woocommerce_dimension_unit'),
+            'prices_include_tax': (woocommerce_settings.get('woocommerce_prices_include_tax') or '').lower() == 'yes',
+            'default_country': woocommerce_settings.get('woocommerce_default_country'),
+            'tax_rates': self.woocommerce_api_get_all_items(woocommerce_api, endpoint='taxes', fields=('id', 'country', 'state', 'rate', 'priority', 'order', 'class')),
+        }
+
+    def woocommerce_store_settings_refresh(self, woocommerce_api=None):
+        """Refresh the cached WooCommerce store settings."""
+        for woocommerce_sync_config in self:
+            woocommerce_api_config = woocommerce_api or woocommerce_sync_config.woocommerce_api_get(woocommerce_sync_config)
+            if not woocommerce_api_config:
+                _logger.error('WooCommerce REST API connection failed. Store settings were not refreshed.')
+                continue
+
+            woocommerce_sync_config.write({'woocommerce_store_settings': self.woocommerce_store_settings_fetch(woocommerce_api_config), 'woocommerce_store_settings_date': fields.Datetime.now()})
+
+            # Commit changes
+            self.env.cr.commit()
+
+    def woocommerce_store_settings_retrieve(self, woocommerce_sync_config, woocommerce_api):
+        """Return the cached WooCommerce store settings. Missing settings are retrieved synchronously; expired settings are used as-is while they are refreshed in the background (requires 'queue_job' add-on), or retrieved synchronously otherwise."""
+        woocommerce_store_settings_expired = not woocommerce_sync_config.woocommerce_store_settings_date or (
+            fields.Datetime.now() - woocommerce_sync_config.woocommerce_store_settings_date > timedelta(minutes=woocommerce_sync_config.settings_woocommerce_store_settings_ttl_minutes)
+        )
+
+        if not woocommerce_sync_config.woocommerce_store_settings:
+            woocommerce_sync_config.woocommerce_store_settings_refresh(woocommerce_api)
+
+        elif woocommerce_store_settings_expired:
+            if self.env['ir.module.module'].search([('name', '=', 'queue_job'), ('state', '=', 'installed')], limit=1):
+                woocommerce_sync_config.with_delay(identity_key=f'woocommerce_store_settings_refresh_{woocommerce_sync_config.id}').woocommerce_store_settings_refresh()
+            else:
+                woocommerce_sync_config.woocommerce_store_settings_refresh(woocommerce_api)
+
+        return woocommerce_sync_config.woocommerce_store_settings
+
+    def woocommerce_store_settings_refresh_action(self):
+        self.ensure_one()
+        self.woocommerce_store_settings_refresh()
+
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Store Settings Refreshed'),
+                'message': _('WooCommerce store settings (currency, measurement units, taxes) have been refreshed.'),
+                'sticky': False,
+            },
+        }
+
+    @staticmethod
+    def woocommerce_api_response_records(endpoint, response, page=1):
+        """Return the records of a WooCommerce REST API listing response. Raises instead of importing a partial listing (retries for throttled requests are handled by the WooCommerce REST API client)."""
+        if response.status_code != 200:
+            raise UserError(_(f"WooCommerce REST API endpoint '{endpoint}' returned status {response.status_code} on page {page}: {response.text[:500]}"))
+
+        records = response.json()
+        if not isinstance(records, list):
+            raise UserError(_(f"WooCommerce REST API endpoint '{endpoint}' returned an unexpected response on page {page}: {response.text[:500]}"))
+
+        return records
+
     @staticmethod
-    def woocommerce_api_get_all_items(woocommerce_api, endpoint, search_parameters={}, test_mode=False):
+    def woocommerce_api_get_all_items(woocommerce_api, endpoint, search_parameters=None, test_mode=False, fields=None):
+        if search_parameters is None:
+            search_parameters = {}
+
+        # Retrieve only the given fields
+        if fields:
+            search_parameters['_fields'] = ','.join(fields)
+
         # Set default records per page if not already provided
         search_parameters.setdefault('per_page', 100)
 
@@ -305,30 +826,126 @@ class WoocommerceConnector(models.Model):
             search_parameters['per_page'] = 10
 
         records_all = []
-        page = 1
-        while True:
-            # Update the page number for each request
-            search_parameters['page'] = page
-            records = woocommerce_api.get(endpoint=endpoint, params=search_parameters).json()
 
-            records_all.extend(records)
+        # Asynchronous transport: retrieve the first page, then all remaining pages concurrently
+        if getattr(woocommerce_api, 'async_transport', None) and not test_mode:
+            search_parameters.pop('page', None)
+            for page, response in enumerate(woocommerce_api.async_transport.get_pages(endpoint, search_parameters), start=1):
+                records_all.extend(WoocommerceConnector.woocommerce_api_response_records(endpoint, response, page))
 
-            # If no records are returned, or test_mode is enabled (fetch only first page), break the loop
-            if not records or test_mode:
-                break
+        else:
+            page = 1
+            while True:
+                # Update the page number for each request
+                search_parameters['page'] = page
+                response = woocommerce_api.get(endpoint=endpoint, params=search_parameters)
+                records = WoocommerceConnector.woocommerce_api_response_records(endpoint, response, page)
 
-            page += 1
+                records_all.extend(records)
 
-        return records_all
+                # If no records are returned, the last page was reached ('X-WP-TotalPages' header), or test_mode is enabled (fetch only first page), break the loop
+                woocommerce_total_pages = response.headers.get('X-WP-TotalPages')
+                if not records or test_mode or (woocommerce_total_pages and woocommerce_total_pages.isdigit() and page >= int(woocommerce_total_pages)):
+                    break
+
+                page += 1
 
-    def woocommerce_last_execution_datetime(self):
-        woocommerce_sync_log = self.env['woocommerce.sync.log'].search([], limit=1)
+        # Remove duplicate records (records modified while paginating can shift between pages), keeping the last occurrence
+        if all(isinstance(record, dict) and 'id' in record for record in records_all):
+            records_all = list({record['id']: record for record in records_all}.values())
 
-        if woocommerce_sync_log.woocommerce_last_synced:
-            return woocommerce_sync_log.woocommerce_last_synced.astimezone(pytz.timezone(self.env.user.tz or 'UTC')).replace(tzinfo=None)
+        return records_all
+
+    def woocommerce_api_get_changed_items(self, woocommerce_api, endpoint, search_parameters, odoo_dates_modified, fields=None):
+        """Retrieve only the WooCommerce records that changed since they were last imported into Odoo. A first pass lists the 'id' and 'date_modified_gmt' of all records, which are compared in bulk with the modified dates stored in Odoo. Full records are then retrieved only for the changed IDs, using the 'include' parameter."""
+        # First pass: list IDs and modified dates only (the WooCommerce REST API allows up to 100 records per page)
+        woocommerce_records = self.woocommerce_api_get_all_items(woocommerce_api, endpoint=endpoint, search_parameters={**search_parameters, 'per_page': 100}, fields=('id', 'date_modified_gmt'))
+
+        woocommerce_records_changed_ids = [
+            woocommerce_record['id']
+            for woocommerce_record in woocommerce_records
+            if not odoo_dates_modified.get(str(woocommerce_record['id'])) or self.datetime_convert(woocommerce_record['date_modified_gmt']) > odoo_dates_modified[str(woocommerce_record['id'])]
+        ]
+
+        _logger.info(f"WooCommerce endpoint '{endpoint}': {len(woocommerce_records_changed_ids)} of {len(woocommerce_records)} records changed.")
+
+        # Second pass: retrieve full records for the changed IDs
+        woocommerce_records_changed = []
+        woocommerce_records_changed_parameters = [
+            {**search_parameters, 'per_page': 100, 'include': ','.join(str(record_id) for record_id in woocommerce_records_changed_ids[index : index + 100])}
+            for index in range(0, len(woocommerce_records_changed_ids), 100)
+        ]
+        if fields:
+            for parameters in woocommerce_records_changed_parameters:
+                parameters['_fields'] = ','.join(fields)
+
+        # Asynchronous transport: request all chunks concurrently
+        if getattr(woocommerce_api, 'async_transport', None):
+            responses = woocommerce_api.async_transport.get_many([(endpoint, parameters) for parameters in woocommerce_records_changed_parameters])
+            for response in responses:
+                woocommerce_records_changed.extend(self.woocommerce_api_response_records(endpoint, response))
 
         else:
-            False
+            for parameters in woocommerce_records_changed_parameters:
+                woocommerce_records_changed.extend(self.woocommerce_api_get_all_items(woocommerce_api, endpoint=endpoint, search_parameters=parameters))
+
+        return woocommerce_records_changed
+
+    def odoo_dates_modified_retrieve(self, woocommerce_sync_config, model_name, field_prefix, active_only=True):
+        """Retrieve the WooCommerce modified dates stored in Odoo, keyed by WooCommerce ID. The '<field_prefix>_site_url', '<field_prefix>_id' and '<field_prefix>_date_modified_gmt' fields are read from the given model."""
+        search_conditions = [(f'{field_prefix}_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), (f'{field_prefix}_id', '!=', False)]
+        if active_only:
+            search_conditions.append(('active', '=', True))
+
+        odoo_records = self.env[model_name].search_read(search_conditions, fields=[f'{field_prefix}_id', f'{field_prefix}_date_modified_gmt'])
+
+        return {odoo_record[f'{field_prefix}_id']: odoo_record[f'{field_prefix}_date_modified_gmt'] for odoo_record in odoo_records}
+
+    def woocommerce_sync_log_retrieve(self, woocommerce_sync_config):
+        """Retrieve the WooCommerce sync log of a WooCommerce configuration, creating it if it does not exist yet."""
+        woocommerce_sync_log = self.env['woocommerce.sync.log'].search([('woocommerce_configuration_id', '=', woocommerce_sync_config.id)], limit=1)
+
+        if not woocommerce_sync_log:
+            # Sync logs created before multi-store support are not linked to a WooCommerce configuration: assign it to the first configuration retrieving it
+            woocommerce_sync_log = self.env['woocommerce.sync.log'].search([('woocommerce_configuration_id', '=', False)], limit=1)
+            if woocommerce_sync_log:
+                woocommerce_sync_log.write({'woocommerce_configuration_id': woocommerce_sync_config.id})
+            else:
+                woocommerce_sync_log = self.env['woocommerce.sync.log'].create({'woocommerce_configuration_id': woocommerce_sync_config.id})
+
+        return woocommerce_sync_log
+
+    def woocommerce_modified_after_parameters(self, woocommerce_sync_config, entity):
+        """Return the WooCommerce REST API parameters to retrieve only the records modified after the watermark of the given entity (e.g. 'products') minus the configured overlap window. Dates are compared in GMT."""
+        woocommerce_watermark = self.woocommerce_sync_log_retrieve(woocommerce_sync_config)[f'woocommerce_{entity}_watermark']
+
+        if not woocommerce_watermark:
+            return {}
+
+        woocommerce_modified_after = woocommerce_watermark - timedelta(minutes=woocommerce_sync_config.settings_woocommerce_modified_records_overlap_minutes)
+
+        return {'modified_after': woocommerce_modified_after.strftime('%Y-%m-%dT%H:%M:%S'), 'dates_are_gmt': 'true'}  # ISO 8601 date format
+
+    def woocommerce_watermark_update(self, woocommerce_sync_config, entity, woocommerce_records, woocommerce_records_failed=None):
+        """Advance the watermark of the given entity (e.g. 'products') to the most recent 'date_modified_gmt' of the retrieved records. If records failed to sync, the watermark stops right before the oldest of them, so that they are retrieved again in the next run."""
+        woocommerce_dates_modified = [self.datetime_convert(record['date_modified_gmt']) for record in woocommerce_records if record.get('date_modified_gmt')]
+        woocommerce_dates_modified_failed = [self.datetime_convert(record['date_modified_gmt']) for record in woocommerce_records_failed or [] if record.get('date_modified_gmt')]
+
+        if not woocommerce_dates_modified:
+            return
+
+        woocommerce_watermark = max(woocommerce_dates_modified)
+        if woocommerce_dates_modified_failed:
+            woocommerce_watermark = min(woocommerce_watermark, min(woocommerce_dates_modified_failed) - timedelta(seconds=1))
+
+        woocommerce_sync_log = self.woocommerce_sync_log_retrieve(woocommerce_sync_config)
+
+        # The watermark never moves backwards
+        if not woocommerce_sync_log[f'woocommerce_{entity}_watermark'] or woocommerce_watermark > woocommerce_sync_log[f'woocommerce_{entity}_watermark']:
+            woocommerce_sync_log.write({f'woocommerce_{entity}_watermark': woocommerce_watermark})
+
+            # Commit changes
+            self.env.cr.commit()
 
     @staticmethod
     def datetime_convert(date_string):
@@ -342,6 +959,82 @@ class WoocommerceConnector(models.Model):
                 raise ValidationError(f'Invalid WooCommerce date format: {date_string}')
         return False
 
+    @staticmethod
+    def odoo_record_values_changed(odoo_record, values):
+        """Return the subset of values that differ from the current field values of an Odoo record, so that unchanged fields are not rewritten."""
+        values_changed = {}
+        for field_name, value in values.items():
+            try:
+                field = odoo_record._fields[field_name]
+                value_new = field.convert_to_record(field.convert_to_cache(value, odoo_record), odoo_record)
+                if value_new == odoo_record[field_name]:
+                    continue
+            except (KeyError, TypeError, ValueError):
+                # Keep values that cannot be compared, the write will handle them
+                pass
+
+            values_changed[field_name] = value
+
+        return values_changed
+
+    @staticmethod
+    def woocommerce_payload_hash(woocommerce_payload):
+        """Return a hash of a normalized WooCommerce payload, used to detect payloads that did not change since their last import."""
+        woocommerce_payload = {key: value for key, value in woocommerce_payload.items() if key not in WOOCOMMERCE_PAYLOAD_HASH_EXCLUDED_FIELDS}
+        return hashlib.sha256(json.dumps(woocommerce_payload, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')).hexdigest()
+
+    def woocommerce_payload_fingerprint_check(self, woocommerce_sync_config, woocommerce_store_settings):
+        """Clear the payload hashes of a WooCommerce configuration when its store settings (currency, measurement units, tax rates) or import settings changed since the last sync, so that unchanged payloads are imported again with the new settings."""
+        woocommerce_payload_fingerprint = self.woocommerce_payload_hash(
+            {
+                'store_settings': woocommerce_store_settings,
+                'sync_settings': woocommerce_sync_config.read(list(WOOCOMMERCE_PAYLOAD_FINGERPRINT_SETTINGS), load=None)[0],
+            },
+        )
+
+        woocommerce_sync_log = self.woocommerce_sync_log_retrieve(woocommerce_sync_config)
+        if woocommerce_sync_log.woocommerce_payload_fingerprint == woocommerce_payload_fingerprint:
+            return
+
+        if woocommerce_sync_log.woocommerce_payload_fingerprint:
+            _logger.info('WooCommerce store settings or import settings changed, clearing the payload hashes.')
+
+        self.env.flush_all()
+        for model_name, field_prefix in WOOCOMMERCE_PAYLOAD_HASH_FIELD_PREFIXES.items():
+            self.env.cr.execute(
+                f'UPDATE {self.env[model_name]._table} SET {field_prefix}_payload_hash = NULL WHERE {field_prefix}_site_url = %s AND {field_prefix}_payload_hash IS NOT NULL',
+                (woocommerce_sync_config.settings_woocommerce_connection_url,),
+            )
+        self.env.invalidate_all()
+
+        woocommerce_sync_log.write({'woocommerce_payload_fingerprint': woocommerce_payload_fingerprint})
+
+        # Commit changes
+        self.env.cr.commit()
+
+    def odoo_record_payload_newer(self, odoo_record, field_prefix, woocommerce_payload):
+        """Check whether a WooCommerce payload is at least as recent as the one last imported into an Odoo record, by comparing its 'date_modified_gmt' with the '<field_prefix>_date_modified_gmt' field (not with 'write_date', so that edits made in Odoo do not discard WooCommerce changes)."""
+        odoo_record_date_modified_gmt = odoo_record[f'{field_prefix}_date_modified_gmt'] if odoo_record else False
+        woocommerce_payload_date_modified_gmt = self.datetime_convert(woocommerce_payload.get('date_modified_gmt'))
+        return not odoo_record_date_modified_gmt or not woocommerce_payload_date_modified_gmt or woocommerce_payload_date_modified_gmt >= odoo_record_date_modified_gmt
+
+    def odoo_record_payload_unchanged(self, odoo_record, field_prefix, woocommerce_payload):
+        """Check whether the WooCommerce payload of an Odoo record is unchanged, by comparing its hash with the one stored in the '<field_prefix>_payload_hash' field. If unchanged, only the WooCommerce modified dates are updated."""
+        if not odoo_record or odoo_record[f'{field_prefix}_payload_hash'] != self.woocommerce_payload_hash(woocommerce_payload):
+            return False
+
+        dates_modified_values = self.odoo_record_values_changed(
+            odoo_record,
+            {
+                f'{field_prefix}_date_modified': self.datetime_convert(woocommerce_payload.get('date_modified')),
+                f'{field_prefix}_date_modified_gmt': self.datetime_convert(woocommerce_payload.get('date_modified_gmt')),
+            },
+        )
+        if dates_modified_values:
+            odoo_record.write(dates_modified_values)
+
+        return True
+
     @api.model
     def image_download_file_to_base64(self, woocommerce_product_images):
         """Downloads the featured image file from WooCommerce and returns it as a base64-encoded string."""
@@ -358,15 +1051,7 @@ class WoocommerceConnector(models.Model):
             # Ensure the request was successful
             response.raise_for_status()
 
-            # Open image with PIL
-            img = Image.open(BytesIO(response.content))
-
-            # Convert to base64 encoding
-            buffered = BytesIO()
-            img.save(buffered, format='PNG')
-            img_base64 = b64encode(buffered.getvalue()).decode('utf-8')
-
-            return img_base64
+            return self.image_content_to_base64(response.content)
 
         except requests.exceptions.RequestException as error:
             _logger.error(f'Failed to download image from {image_url}: {error}')
@@ -374,6 +1059,40 @@ class WoocommerceConnector(models.Model):
             _logger.error(f'Error processing the image from {image_url}: {error}')
         return None
 
+    @staticmethod
+    def image_content_to_base64(image_content):
+        """Converts image file content to a base64-encoded PNG string."""
+        # Open image with PIL
+        img = Image.open(BytesIO(image_content))
+
+        # Convert to base64 encoding
+        buffered = BytesIO()
+        img.save(buffered, format='PNG')
+        return b64encode(buffered.getvalue()).decode('utf-8')
+
+    @api.model
+    def image_download_files_to_base64(self, image_urls, max_workers=8, woocommerce_api=None):
+        """Downloads image files concurrently and returns a map of base64-encoded strings keyed by image URL. Each distinct URL is only downloaded once."""
+        image_urls = list({image_url for image_url in image_urls if image_url})
+        if not image_urls:
+            return {}
+
+        # Asynchronous transport
+        if woocommerce_api and getattr(woocommerce_api, 'async_transport', None):
+            images_base64 = {}
+            for image_url, image_content in woocommerce_api.async_transport.download_many(image_urls).items():
+                try:
+                    images_base64[image_url] = self.image_content_to_base64(image_content) if image_content else None
+                except Exception as error:
+                    _logger.error(f'Error processing the image from {image_url}: {error}')
+                    images_base64[image_url] = None
+            return images_base64
+
+        # Downloads do not access the Odoo environment, so they can run in worker threads
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_urls))) as executor:
+            images_base64 = executor.map(lambda image_url: self.image_download_file_to_base64({'src': image_url}), image_urls)
+            return dict(zip(image_urls, images_base64))
+
     @api.model
     def image_process_attachments(self, woocommerce_product_images, product):
         """Downloads images from WooCommerce, converts them to base64 encoding, and stores them as attachments. Returns a list of attachment IDs."""
@@ -430,18 +1149,70 @@ class WoocommerceConnector(models.Model):
             return False
 
     @api.returns('account.tax')
-    def odoo_tax_create_or_retrieve(self, tax_rate, price_include_flag=False):
-        """Create or retrieve an Odoo tax."""
+    def odoo_tax_create_or_retrieve(self, tax_rate, price_include_flag=False, odoo_taxes_map=None):
+        """Create or retrieve an Odoo tax. If an Odoo taxes map (see 'odoo_taxes_map_build') is given, the tax is looked up in (and, if created, added to) the map instead of searched."""
         if tax_rate is None or tax_rate == 0.0:
             return False
 
+        if odoo_taxes_map is not None and (float(tax_rate), bool(price_include_flag)) in odoo_taxes_map:
+            return odoo_taxes_map[(float(tax_rate), bool(price_include_flag))]
+
         odoo_tax = self.env['account.tax'].search([('active', '=', True), ('name', '=', f'{tax_rate}%'), ('amount', '=', tax_rate), ('type_tax_use', '=', 'sale'), ('price_include', '=', price_include_flag)], limit=1)
 
         if not odoo_tax:
             odoo_tax = self.env['account.tax'].create({'name': f'{tax_rate}%', 'amount': tax_rate, 'type_tax_use': 'sale', 'price_include': price_include_flag})
 
+        if odoo_taxes_map is not None:
+            odoo_taxes_map[(float(tax_rate), bool(price_include_flag))] = odoo_tax
+
         return odoo_tax
 
+    def odoo_taxes_map_build(self):
+        """Build a map of the Odoo sale taxes created by the sync, keyed by (amount, price_include)."""
+        odoo_taxes_map = {}
+        for odoo_tax in self.env['account.tax'].search([('active', '=', True), ('type_tax_use', '=', 'sale')]):
+            if odoo_tax.name == f'{odoo_tax.amount}%':
+                odoo_taxes_map.setdefault((float(odoo_tax.amount), bool(odoo_tax.price_include)), odoo_tax)
+
+        return odoo_taxes_map
+
+    @staticmethod
+    def woocommerce_tax_rates_index_build(woocommerce_tax_rates):
+        """Build an index of WooCommerce tax rates keyed by (tax class, country, state), plus a map of tax rates keyed by WooCommerce tax rate ID. Empty country or state means the rate applies to all countries or states. For each key, the first rate (WooCommerce 'priority' and 'order') is kept."""
+        woocommerce_tax_rates_index = {}
+        woocommerce_tax_rates_by_id = {}
+
+        for woocommerce_tax_rate in sorted(woocommerce_tax_rates, key=lambda tax_rate: (tax_rate.get('priority') or 0, tax_rate.get('order') or 0)):
+            tax_class = woocommerce_tax_rate.get('class') or 'standard'
+            tax_rate = float(woocommerce_tax_rate['rate'])
+            country = (woocommerce_tax_rate.get('country') or '').upper()
+            state = (woocommerce_tax_rate.get('state') or '').upper()
+
+            woocommerce_tax_rates_index.setdefault((tax_class, country, state), tax_rate)
+            woocommerce_tax_rates_by_id[woocommerce_tax_rate['id']] = tax_rate
+
+        return {'index': woocommerce_tax_rates_index, 'by_id': woocommerce_tax_rates_by_id}
+
+    @staticmethod
+    def woocommerce_tax_rate_retrieve(woocommerce_tax_rates_index, tax_class, country=None, state=None):
+        """Retrieve the WooCommerce tax rate of a tax class for a location, falling back to the country-wide rate and the rate for all countries. Returns None if no rate of the tax class applies to the location (e.g. exports), instead of the rate of another location."""
+        tax_class = tax_class or 'standard'
+        country = (country or '').upper()
+        state = (state or '').upper()
+
+        for key in ((tax_class, country, state), (tax_class, country, ''), (tax_class, '', '')):
+            if key in woocommerce_tax_rates_index['index']:
+                return woocommerce_tax_rates_index['index'][key]
+
+        return None
+
+    def woocommerce_tax_rates_location_retrieve(self, woocommerce_tax_rates_index, woocommerce_location):
+        """Return the WooCommerce tax rates keyed by tax class for a location in the WooCommerce 'woocommerce_default_country' format (e.g. 'DE' or 'US:CA')."""
+        country, _separator, state = (woocommerce_location or '').partition(':')
+        tax_classes = {tax_class for tax_class, _country, _state in woocommerce_tax_rates_index['index']}
+
+        return {tax_class: self.woocommerce_tax_rate_retrieve(woocommerce_tax_rates_index, tax_class, country, state) for tax_class in tax_classes}
+
     @api.returns('product.brand')
     def odoo_brand_create_or_retrieve(self, brand_name):
         """Create or retrieve an Odoo brand."""
@@ -565,7 +1336,7 @@ class WoocommerceConnector(models.Model):
     def product_stock_quantity_create_or_update(self, woocommerce_sync_config, woocommerce_api):
         """Synchronize stock quantity levels between WooCommerce and Odoo using 'product.product records'. In WooCommerce, if a stock quantity level changes due to a purchase, the 'date_modified_gmt' field is updated accordingly."""
         # Retrieve WooCommerce products with stock management enabled
-        woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters={'status': 'publish', 'manage_stock': 'true'})
+        woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters={'status': 'publish', 'manage_stock': 'true'}, fields=WOOCOMMERCE_PRODUCT_STOCK_FIELDS)
         woocommerce_products_stock_map = {product['id']: product for product in woocommerce_products}
 
         # Fetch all Odoo 'product.product' records linked to WooCommerce
@@ -578,11 +1349,33 @@ class WoocommerceConnector(models.Model):
             ],
         )
 
+        # Odoo stock quantity levels of all products, computed at once before any stock is updated
+        odoo_products_qty_available = {product['id']: product['qty_available'] for product in odoo_products.read(['qty_available'])}
+
+        # WooCommerce product variations stock info, retrieved once per parent product and keyed by 'woocommerce_product_variation_parent_id'
+        woocommerce_product_variations_stock_maps = {}
+
+        # Odoo stock updates, as {product: stock quantity} and {product: stock date updated}
+        odoo_stock_quantities = {}
+        odoo_products_stock_dates = {}
+
+        # WooCommerce stock updates, as (product, endpoint, data) tuples
+        woocommerce_stock_updates = []
+
+        # Products with WooCommerce stock info, and WooCommerce stock updates that failed
+        woocommerce_stock_records_count = 0
+        woocommerce_stock_updates_failed_count = 0
+
         for product in odoo_products:
             # Determine the corresponding WooCommerce stock info
             if product.woocommerce_product_variation_id:
                 # For variations, retrieve the specific variation stock
-                woocommerce_stock_info = self.product_variations_stock_retrieve(woocommerce_sync_config, woocommerce_api, product)
+                woocommerce_product_variation_parent_id = product.woocommerce_product_variation_parent_id
+                if woocommerce_product_variation_parent_id not in woocommerce_product_variations_stock_maps:
+                    woocommerce_product_variations_stock_maps[woocommerce_product_variation_parent_id] = self.product_variations_stock_retrieve(
+                        woocommerce_sync_config, woocommerce_api, woocommerce_product_variation_parent_id
+                    )
+                woocommerce_stock_info = woocommerce_product_variations_stock_maps[woocommerce_product_variation_parent_id].get(int(product.woocommerce_product_variation_id))
             else:
                 # For simple products, get the stock from the parent product
                 woocommerce_stock_info = woocommerce_products_stock_map.get(int(product.woocommerce_product_id))
@@ -590,62 +1383,238 @@ class WoocommerceConnector(models.Model):
             if not woocommerce_stock_info:
                 continue
 
+            woocommerce_stock_records_count += 1
             woocommerce_product_date_modified_gmt = self.datetime_convert(woocommerce_stock_info['date_modified_gmt'])
             woocommerce_product_stock_quantity = float(woocommerce_stock_info['stock_quantity'])
+            odoo_product_qty_available = odoo_products_qty_available[product.id]
 
             # If the WooCommerce stock quantity level is newer or has never been synced, update the stock information in Odoo
-            if not product.product_stock_date_updated or (woocommerce_product_date_modified_gmt >= product.product_stock_date_updated and woocommerce_product_stock_quantity != product.qty_available):
-                odoo_product_stock_quantity = self.env['stock.quant'].search(
-                    [
-                        ('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
-                        ('product_id', '=', product.id),
-                        ('location_id', '=', woocommerce_sync_config.settings_woocommerce_products_warehouse_location.id),
-                    ],
-                    limit=1,
-                )
-
-                if odoo_product_stock_quantity:
-                    odoo_product_stock_quantity.with_company(self.env.company).write({'quantity': woocommerce_product_stock_quantity})
-                else:
-                    self.env['stock.quant'].create(
-                        {
-                            'woocommerce_product_site_url': woocommerce_sync_config.settings_woocommerce_connection_url,
-                            'product_id': product.id,
-                            'quantity': woocommerce_product_stock_quantity,
-                            'location_id': woocommerce_sync_config.settings_woocommerce_products_warehouse_location.id,
-                        },
-                    )
-
-                # Update the stock date updated
-                product.write({'product_stock_date_updated': woocommerce_product_date_modified_gmt})
+            if not product.product_stock_date_updated or (woocommerce_product_date_modified_gmt >= product.product_stock_date_updated and woocommerce_product_stock_quantity != odoo_product_qty_available):
+                odoo_stock_quantities[product] = woocommerce_product_stock_quantity
+                odoo_products_stock_dates[product] = woocommerce_product_date_modified_gmt
 
             # Otherwise, if the Odoo stock quantity level is newer, update the stock information in WooCommerce
-            elif woocommerce_product_date_modified_gmt < product.product_stock_date_updated and woocommerce_product_stock_quantity != product.qty_available:
+            elif woocommerce_product_date_modified_gmt < product.product_stock_date_updated and woocommerce_product_stock_quantity != odoo_product_qty_available:
                 if product.woocommerce_product_variation_id:
-                    woocommerce_product = woocommerce_api.put(
-                        f'products/{product.woocommerce_product_variation_parent_id}/variations/{product.woocommerce_product_variation_id}',
-                        data={'stock_quantity': product.qty_available},
-                    ).json()
+                    woocommerce_stock_updates.append(
+                        (product, f'products/{product.woocommerce_product_variation_parent_id}/variations/{product.woocommerce_product_variation_id}', {'stock_quantity': odoo_product_qty_available})
+                    )
                 elif product.woocommerce_product_id:
-                    woocommerce_product = woocommerce_api.put(f'products/{product.woocommerce_product_id}', data={'stock_quantity': product.qty_available}).json()
+                    woocommerce_stock_updates.append((product, f'products/{product.woocommerce_product_id}', {'stock_quantity': odoo_product_qty_available}))
+
+        # Update the stock information in Odoo
+        self.odoo_stock_quants_apply(woocommerce_sync_config, odoo_stock_quantities)
+
+        # Update the stock information in WooCommerce (concurrently, if the asynchronous transport is enabled)
+        if getattr(woocommerce_api, 'async_transport', None):
+            responses = woocommerce_api.async_transport.put_many([(endpoint, data) for _product, endpoint, data in woocommerce_stock_updates])
+        else:
+            responses = [woocommerce_api.put(endpoint, data=data) for _product, endpoint, data in woocommerce_stock_updates]
+
+        for (product, endpoint, _data), response in zip(woocommerce_stock_updates, responses):
+            if response.status_code != 200:
+                _logger.error(f"Error updating WooCommerce stock of '{endpoint}': {response.text}")
+                woocommerce_stock_updates_failed_count += 1
+                continue
+
+            odoo_products_stock_dates[product] = self.datetime_convert(response.json()['date_modified_gmt'])
+
+        # Update the stock date updated
+        self.odoo_products_stock_date_updated_write(odoo_products_stock_dates)
+
+        # Stock quantity levels updated in Odoo or pushed to WooCommerce
+        woocommerce_sync_counts = Counter({'updated': len(odoo_stock_quantities) + len(woocommerce_stock_updates) - woocommerce_stock_updates_failed_count})
+
+        return self.woocommerce_sync_counts_complete(woocommerce_sync_counts, woocommerce_stock_records_count, woocommerce_stock_updates_failed_count)
+
+    def odoo_stock_quants_apply(self, woocommerce_sync_config, odoo_stock_quantities):
+        """Set the stock quantity levels of a batch of products ({product: stock quantity}) in the WooCommerce warehouse location. The quantities of all quants of the location (tagged with the WooCommerce site URL or not, child locations excluded) are summed per product in a single query, and the differences are applied as a single batch of validated inventory adjustment moves."""
+        if not odoo_stock_quantities:
+            return
+
+        woocommerce_warehouse_location = woocommerce_sync_config.settings_woocommerce_products_warehouse_location
+        odoo_products = self.env['product.product'].union(*odoo_stock_quantities)
+
+        # Odoo updates the quants of the location in removal order ('_gather'), regardless of their WooCommerce site URL, so the difference is computed against their sum
+        odoo_quants_quantities = {
+            quant_group['product_id'][0]: quant_group['quantity']
+            for quant_group in self.env['stock.quant'].read_group(
+                [('product_id', 'in', odoo_products.ids), ('location_id', '=', woocommerce_warehouse_location.id)],
+                ['quantity:sum'],
+                ['product_id'],
+                lazy=False,
+            )
+        }
+
+        # Compute the differences in memory
+        stock_move_values = []
+        for product, stock_quantity in odoo_stock_quantities.items():
+            stock_quantity_difference = stock_quantity - odoo_quants_quantities.get(product.id, 0.0)
+            if float_is_zero(stock_quantity_difference, precision_rounding=product.uom_id.rounding):
+                continue
+
+            # Unsaved quant, only used to build the inventory adjustment move values (no empty quant is created)
+            odoo_quant = self.env['stock.quant'].new({'product_id': product.id, 'location_id': woocommerce_warehouse_location.id, 'company_id': (woocommerce_warehouse_location.company_id or self.env.company).id})
+            inventory_location = product.with_company(odoo_quant.company_id).property_stock_inventory
+            if stock_quantity_difference > 0:
+                stock_move_values.append(odoo_quant._get_inventory_move_values(stock_quantity_difference, inventory_location, woocommerce_warehouse_location))
+            else:
+                stock_move_values.append(odoo_quant._get_inventory_move_values(-stock_quantity_difference, woocommerce_warehouse_location, inventory_location))
+
+        if stock_move_values:
+            stock_moves = self.env['stock.move'].with_context(inventory_mode=False).create(stock_move_values)
+
+            # The stock imported from WooCommerce is not pushed back to WooCommerce
+            stock_moves.with_context(woocommerce_stock_sync=True)._action_done()
+
+    def odoo_products_stock_date_updated_write(self, odoo_products_stock_dates):
+        """Write the 'product_stock_date_updated' of a batch of products ({product: stock date updated}), with a single write per distinct date."""
+        odoo_product_ids_by_date = {}
+        for product, product_stock_date_updated in odoo_products_stock_dates.items():
+            odoo_product_ids_by_date.setdefault(product_stock_date_updated, []).append(product.id)
+
+        for product_stock_date_updated, odoo_product_ids in odoo_product_ids_by_date.items():
+            self.env['product.product'].browse(odoo_product_ids).write({'product_stock_date_updated': product_stock_date_updated})
+
+    @api.model
+    def woocommerce_stock_push_enqueue(self, odoo_products):
+        """Flag the products linked to WooCommerce whose stock changed in Odoo, and enqueue a delayed stock push for each WooCommerce configuration with the stock push enabled (requires 'queue_job' add-on). A new queue job is not enqueued while one for the same store is still pending, so that bursts of stock moves are pushed together."""
+        odoo_products = odoo_products.filtered(lambda product: product.woocommerce_product_site_url and product.detailed_type == 'product')
+        if not odoo_products or not self.env['ir.module.module'].sudo().search([('name', '=', 'queue_job'), ('state', '=', 'installed')], limit=1):
+            return
+
+        woocommerce_sync_configs = self.sudo().search(
+            [
+                ('settings_woocommerce_connection_url', 'in', list(set(odoo_products.mapped('woocommerce_product_site_url')))),
+                ('settings_woocommerce_products_stock_management', '=', True),
+                ('settings_woocommerce_stock_push', '=', True),
+            ],
+        )
+        if not woocommerce_sync_configs:
+            return
+
+        woocommerce_connection_urls = set(woocommerce_sync_configs.mapped('settings_woocommerce_connection_url'))
+        odoo_products.filtered(lambda product: product.woocommerce_product_site_url in woocommerce_connection_urls and not product.woocommerce_stock_push_pending).sudo().write({'woocommerce_stock_push_pending': True})
+
+        for woocommerce_sync_config in woocommerce_sync_configs:
+            woocommerce_sync_config.with_delay(
+                eta=max(woocommerce_sync_config.settings_woocommerce_stock_push_delay_seconds, 0),
+                identity_key=f'woocommerce_stock_push_{woocommerce_sync_config.id}',
+                description=f'WooCommerce Stock Push - {woocommerce_sync_config.woocommerce_connection_sequence}',
+            ).woocommerce_stock_push()
+
+    def woocommerce_stock_push(self):
+        """Push the stock quantity levels of the products flagged by 'woocommerce_stock_push_enqueue' to WooCommerce, while holding the stock sync lock of the WooCommerce configuration."""
+        for woocommerce_sync_config in self:
+            with self.woocommerce_sync_lock(woocommerce_sync_config, 'stock') as woocommerce_sync_lock_acquired:
+                if not woocommerce_sync_lock_acquired:
+                    # The stock sync is running, push the flagged products later
+                    woocommerce_sync_config.with_delay(
+                        eta=max(woocommerce_sync_config.settings_woocommerce_stock_push_delay_seconds, 0),
+                        identity_key=f'woocommerce_stock_push_{woocommerce_sync_config.id}',
+                        description=f'WooCommerce Stock Push - {woocommerce_sync_config.woocommerce_connection_sequence}',
+                    ).woocommerce_stock_push()
+                    continue
+
+                woocommerce_api = woocommerce_sync_config.woocommerce_api_get(woocommerce_sync_config)
+                if not woocommerce_api:
+                    _logger.error('WooCommerce REST API connection failed. Stock changes were not pushed.')
+                    continue
+
+                self.odoo_to_woocommerce_stock_push(woocommerce_sync_config, woocommerce_api)
+
+    def odoo_to_woocommerce_stock_push(self, woocommerce_sync_config, woocommerce_api):
+        """Push the stock quantity levels of the flagged products to WooCommerce in batches (one 'products/batch' request per 100 products and one 'products/<id>/variations/batch' request per parent product). Products not pushed (failed updates or errors, also when the job is aborted) are flagged again, to be retried by the next stock push."""
+        odoo_products = self.env['product.product'].search(
+            [
+                ('woocommerce_stock_push_pending', '=', True),
+                ('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
+                ('active', '=', True),
+            ],
+        )
+        if not odoo_products:
+            return {'updated': 0, 'failed': 0}
+
+        # Clear the flags before reading the stock, so that stock changes made while pushing enqueue a new stock push
+        odoo_products.write({'woocommerce_stock_push_pending': False})
+
+        # Commit changes
+        self.env.cr.commit()
+
+        odoo_products_stock_dates = {}
+        try:
+            odoo_products_qty_available = {product['id']: product['qty_available'] for product in odoo_products.read(['qty_available'])}
+
+            # WooCommerce stock updates, as {batch endpoint: [(product, data)]}
+            woocommerce_stock_updates = {}
+            for product in odoo_products:
+                try:
+                    if product.woocommerce_product_variation_id:
+                        endpoint = f'products/{product.woocommerce_product_variation_parent_id}/variations/batch'
+                        woocommerce_record_id = int(product.woocommerce_product_variation_id)
+                    else:
+                        endpoint = 'products/batch'
+                        woocommerce_record_id = int(product.woocommerce_product_id)
+                except ValueError:
+                    _logger.error(f"Invalid WooCommerce ID of product '{product.display_name}' (ID {product.id}), stock not pushed.")
+                    continue
+
+                woocommerce_stock_updates.setdefault(endpoint, []).append((product, {'id': woocommerce_record_id, 'stock_quantity': odoo_products_qty_available[product.id]}))
+
+            for endpoint, woocommerce_stock_updates_endpoint in woocommerce_stock_updates.items():
+                for batch_start in range(0, len(woocommerce_stock_updates_endpoint), WOOCOMMERCE_BATCH_SIZE):
+                    woocommerce_stock_updates_batch = woocommerce_stock_updates_endpoint[batch_start : batch_start + WOOCOMMERCE_BATCH_SIZE]
+                    try:
+                        response = woocommerce_api.post(endpoint, data={'update': [data for _product, data in woocommerce_stock_updates_batch]})
+                        if response.status_code not in (200, 201):
+                            _logger.error(f"Error updating WooCommerce stock of '{endpoint}': {response.text}")
+                            continue
+
+                        woocommerce_records_updated = {record.get('id'): record for record in response.json().get('update', [])}
+                    except (requests.exceptions.RequestException, ValueError) as error:
+                        _logger.error(f"Error updating WooCommerce stock of '{endpoint}': {error}")
+                        continue
 
-                # Update the stock date updated
-                product.write({'product_stock_date_updated': self.datetime_convert(woocommerce_product['date_modified_gmt'])})
+                    for product, data in woocommerce_stock_updates_batch:
+                        woocommerce_record_updated = woocommerce_records_updated.get(data['id'])
+                        if not woocommerce_record_updated or woocommerce_record_updated.get('error'):
+                            _logger.error(f"Error updating WooCommerce stock of '{endpoint}' (ID {data['id']}): {(woocommerce_record_updated or {}).get('error')}")
+                            continue
+
+                        odoo_products_stock_dates[product] = self.datetime_convert(woocommerce_record_updated['date_modified_gmt'])
+
+        except Exception:
+            # Leave the cursor usable for flagging the products again
+            self.env.cr.rollback()
+            raise
+
+        finally:
+            # Update the stock date updated of the pushed products
+            self.odoo_products_stock_date_updated_write(odoo_products_stock_dates)
+
+            # Flag the products not pushed (failed, or not reached because of an error) again, so that they are retried
+            odoo_products_failed_ids = [product.id for product in odoo_products if product not in odoo_products_stock_dates]
+            if odoo_products_failed_ids:
+                self.env['product.product'].browse(odoo_products_failed_ids).write({'woocommerce_stock_push_pending': True})
+
+            # Commit changes
+            self.env.cr.commit()
+
+        return {'updated': len(odoo_products_stock_dates), 'failed': len(odoo_products_failed_ids)}
 
-    def product_variations_stock_retrieve(self, woocommerce_sync_config, woocommerce_api, product):
-        """Retrieve WooCommerce stock info for a product variation."""
+    def product_variations_stock_retrieve(self, woocommerce_sync_config, woocommerce_api, woocommerce_product_variation_parent_id):
+        """Retrieve WooCommerce stock info of the product variations of a parent product, keyed by product variation ID."""
         try:
             variations = self.woocommerce_api_get_all_items(
                 woocommerce_api,
-                endpoint=f'products/{product.woocommerce_product_variation_parent_id}/variations',
+                endpoint=f'products/{woocommerce_product_variation_parent_id}/variations',
                 search_parameters={'status': 'publish', 'manage_stock': 'true'},
+                fields=WOOCOMMERCE_PRODUCT_STOCK_FIELDS,
             )
-            for variation in variations:
-                if variation['id'] == int(product.woocommerce_product_variation_id):
-                    return {'stock_quantity': variation['stock_quantity'], 'date_modified_gmt': variation['date_modified_gmt']}
+            return {variation['id']: {'stock_quantity': variation['stock_quantity'], 'date_modified_gmt': variation['date_modified_gmt']} for variation in variations}
         except Exception as error:
-            _logger.error(f'Error retrieving variation stock for product {product.id}: {error}')
-        return None
+            _logger.error(f'Error retrieving variations stock of WooCommerce product {woocommerce_product_variation_parent_id}: {error}')
+        return {}
 
     def woocommerce_product_fields(self, woocommerce_sync_config, woocommerce_product, woocommerce_currency=None, woocommerce_weight_unit=None, woocommerce_dimension_unit=None, woocommerce_tax_rates=None):
         # WooCommerce site URL field
@@ -740,6 +1709,7 @@ class WoocommerceConnector(models.Model):
                 'woocommerce_product_weight_unit': woocommerce_weight_unit if woocommerce_weight_unit else None,
                 'woocommerce_product_dimension_unit': woocommerce_dimension_unit if woocommerce_dimension_unit else None,
                 'woocommerce_product_tax_rate': woocommerce_tax_rates.get(woocommerce_product['tax_class'] if woocommerce_product['tax_class'] else 'standard') if woocommerce_tax_rates else None,
+                'woocommerce_product_payload_hash': self.woocommerce_payload_hash(woocommerce_product),
             },
         )
 
@@ -783,24 +1753,36 @@ class WoocommerceConnector(models.Model):
         search_parameters = {'status': 'publish'}
 
         if woocommerce_sync_config.settings_woocommerce_modified_records_import:
-            woocommerce_last_execution_datetime = self.woocommerce_last_execution_datetime()
-            if woocommerce_last_execution_datetime:
-                search_parameters['modified_after'] = woocommerce_last_execution_datetime.strftime('%Y-%m-%dT%H:%M:%S')  # ISO 8601 date format
+            search_parameters.update(self.woocommerce_modified_after_parameters(woocommerce_sync_config, 'products'))
 
         if woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code:
             search_parameters['lang'] = woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code
 
         # WooCommerce woocommerce_products
-        woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters)
+        if woocommerce_sync_config.settings_woocommerce_changed_records_import:
+            woocommerce_products = self.woocommerce_api_get_changed_items(
+                woocommerce_api,
+                endpoint='products',
+                search_parameters=search_parameters,
+                odoo_dates_modified=self.odoo_dates_modified_retrieve(woocommerce_sync_config, 'product.template', 'woocommerce_product'),
+                fields=WOOCOMMERCE_PRODUCT_FIELDS,
+            )
+        else:
+            woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters, fields=WOOCOMMERCE_PRODUCT_FIELDS)
 
         # Filter for WooCommerce products that have SKU
         woocommerce_products = [product for product in woocommerce_products if product['sku']]
 
+        # Odoo taxes
+        odoo_taxes_map = self.odoo_taxes_map_build()
+        woocommerce_products_failed = []
+        woocommerce_sync_counts = Counter()
+
         for product in woocommerce_products:
             try:
                 # Search for existing product in Odoo
                 odoo_product = self.env['product.template'].search(
-                    [('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('woocommerce_product_id', '=', product['id'])],
+                    [('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('woocommerce_product_id_integer', '=', product['id'])],
                     limit=1,
                 )
 
@@ -811,8 +1793,14 @@ class WoocommerceConnector(models.Model):
                         odoo_product.unlink()
                         odoo_product = False
 
-                # Create new product in Odoo if it does not yet exist or update product in Odoo only if WooCommerce version is newer
-                if not odoo_product or (odoo_product and self.datetime_convert(product['date_modified_gmt']) > odoo_product.write_date):
+                # Skip product if its WooCommerce payload did not change
+                if self.odoo_record_payload_unchanged(odoo_product, 'woocommerce_product', product):
+                    # Commit changes
+                    self.env.cr.commit()
+                    continue
+
+                # Create new product in Odoo if it does not yet exist or update product in Odoo unless the WooCommerce payload is older than the last imported one
+                if self.odoo_record_payload_newer(odoo_product, 'woocommerce_product', product):
                     product_values = self.woocommerce_product_fields(woocommerce_sync_config, product, woocommerce_currency, woocommerce_weight_unit, woocommerce_dimension_unit, woocommerce_tax_rates)
 
                     # Currency
@@ -821,7 +1809,7 @@ class WoocommerceConnector(models.Model):
 
                     # Tax
                     if product_values['woocommerce_product_tax_rate']:
-                        odoo_product_tax = self.odoo_tax_create_or_retrieve(product_values['woocommerce_product_tax_rate'], woocommerce_product_prices_include_tax)
+                        odoo_product_tax = self.odoo_tax_create_or_retrieve(product_values['woocommerce_product_tax_rate'], woocommerce_product_prices_include_tax, odoo_taxes_map)
                         if odoo_product_tax:
                             odoo_product_tax_id = [(6, 0, [odoo_product_tax.id])]
                         else:
@@ -875,8 +1863,11 @@ class WoocommerceConnector(models.Model):
                             },
                         )
 
+                    # Images are only downloaded if they changed in WooCommerce
+                    odoo_product_images_changed = not odoo_product or odoo_product.woocommerce_product_images != product_values['woocommerce_product_images']
+
                     # Image featured
-                    if woocommerce_sync_config.settings_woocommerce_images_sync and len(product_values['woocommerce_product_images']) > 0:
+                    if woocommerce_sync_config.settings_woocommerce_images_sync and len(product_values['woocommerce_product_images']) > 0 and odoo_product_images_changed:
                         odoo_product_image_featured = self.image_download_file_to_base64(product_values['woocommerce_product_images'][0])
 
                     else:
@@ -923,16 +1914,25 @@ class WoocommerceConnector(models.Model):
                         },
                     )
 
-                    # Update product in Odoo only if WooCommerce version is newer
+                    # Keep the existing images if they did not change
+                    if not odoo_product_images_changed:
+                        product_values.pop('image_1920')
+
+                    # Update product in Odoo, limited to the fields that changed
+                    woocommerce_sync_count = None
                     if odoo_product:
-                        odoo_product.write(product_values)
+                        product_values_changed = self.odoo_record_values_changed(odoo_product, product_values)
+                        if product_values_changed:
+                            odoo_product.write(product_values_changed)
+                            woocommerce_sync_count = 'updated'
 
                     # Create new product in Odoo if it does not yet exist
                     else:
                         odoo_product = self.env['product.template'].create(product_values)
+                        woocommerce_sync_count = 'created'
 
                     # Product gallery
-                    if odoo_product and woocommerce_sync_config.settings_woocommerce_images_sync and len(product_values['woocommerce_product_images']) > 0:
+                    if odoo_product and woocommerce_sync_config.settings_woocommerce_images_sync and len(product_values['woocommerce_product_images']) > 0 and odoo_product_images_changed:
                         product_images_ids = self.image_process_attachments(product_values['woocommerce_product_images'], odoo_product)
 
                         if product_images_ids:
@@ -941,11 +1941,21 @@ class WoocommerceConnector(models.Model):
                     # Commit changes
                     self.env.cr.commit()
 
+                    # Count the product once committed
+                    if woocommerce_sync_count:
+                        woocommerce_sync_counts[woocommerce_sync_count] += 1
+
             except Exception as error:
                 # Roll back changes
                 self.env.cr.rollback()
+                woocommerce_products_failed.append(product)
                 _logger.exception(f'Error syncing product {product["id"]}: {error}')
 
+        # Advance the products watermark
+        self.woocommerce_watermark_update(woocommerce_sync_config, 'products', woocommerce_products, woocommerce_products_failed)
+
+        return self.woocommerce_sync_counts_complete(woocommerce_sync_counts, len(woocommerce_products), len(woocommerce_products_failed))
+
     def woocommerce_to_odoo_product_related_ids(self, woocommerce_sync_config):
         # Retrieve all Odoo products
         odoo_products = self.env['product.template'].search([('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True)])
@@ -1049,6 +2059,7 @@ class WoocommerceConnector(models.Model):
                 'woocommerce_product_variation_tax_rate': woocommerce_tax_rates.get(woocommerce_product_variation['tax_class'] if woocommerce_product_variation['tax_class'] else 'standard')
                 if woocommerce_tax_rates
                 else None,
+                'woocommerce_product_variation_payload_hash': self.woocommerce_payload_hash(woocommerce_product_variation),
             },
         )
 
@@ -1085,28 +2096,38 @@ class WoocommerceConnector(models.Model):
         woocommerce_weight_unit,
         woocommerce_dimension_unit,
     ):
-        # WooCommerce REST API parameters
-        search_parameters = {'status': 'publish', 'fields': 'id,variations', 'type': 'variable'}
-
-        if woocommerce_sync_config.settings_woocommerce_modified_records_import:
-            woocommerce_last_execution_datetime = self.woocommerce_last_execution_datetime()
-            if woocommerce_last_execution_datetime:
-                search_parameters['modified_after'] = woocommerce_last_execution_datetime.strftime('%Y-%m-%dT%H:%M:%S')  # ISO 8601 date format
+        # WooCommerce REST API parameters (the product variations watermark only applies to the product variations endpoint, as modifying a product variation does not change the modified date of its parent product)
+        search_parameters = {'status': 'publish', 'type': 'variable'}
 
         if woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code:
             search_parameters['lang'] = woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code
 
         # WooCommerce products
-        woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters)
+        woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters, fields=('id', 'name', 'sku', 'variations'))
+
+        # Odoo product variations modified dates
+        if woocommerce_sync_config.settings_woocommerce_changed_records_import:
+            odoo_product_variations_dates_modified = self.odoo_dates_modified_retrieve(woocommerce_sync_config, 'product.product', 'woocommerce_product_variation')
 
         # Filter for WooCommerce products that have SKU
         woocommerce_products = [product for product in woocommerce_products if product['sku']]
 
+        # Odoo taxes
+        odoo_taxes_map = self.odoo_taxes_map_build()
+
+        # WooCommerce product variations retrieved and failed, used to advance the product variations watermark
+        woocommerce_product_variations_all = []
+        woocommerce_product_variations_failed = []
+        woocommerce_product_variations_failed_count = 0
+        woocommerce_sync_counts = Counter()
+
         for product in woocommerce_products:
+            woocommerce_product_variations = []
+            woocommerce_product_variations_committed = 0
             try:
                 # Search for existing product in Odoo
                 odoo_product = self.env['product.template'].search(
-                    [('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('woocommerce_product_id', '=', product['id'])],
+                    [('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('woocommerce_product_id_integer', '=', product['id'])],
                     limit=1,
                 )
                 if not odoo_product:
@@ -1121,13 +2142,41 @@ class WoocommerceConnector(models.Model):
                     search_parameters = {'status': 'publish'}
 
                     if woocommerce_sync_config.settings_woocommerce_modified_records_import:
-                        if woocommerce_last_execution_datetime:
-                            search_parameters['modified_after'] = woocommerce_last_execution_datetime.strftime('%Y-%m-%dT%H:%M:%S')  # ISO 8601 date format
+                        search_parameters.update(self.woocommerce_modified_after_parameters(woocommerce_sync_config, 'product_variations'))
 
                     # WooCommerce product variations for the product
-                    woocommerce_product_variations = self.woocommerce_api_get_all_items(woocommerce_api, endpoint=f'products/{product["id"]}/variations', search_parameters=search_parameters)
+                    if woocommerce_sync_config.settings_woocommerce_changed_records_import:
+                        woocommerce_product_variations = self.woocommerce_api_get_changed_items(
+                            woocommerce_api,
+                            endpoint=f'products/{product["id"]}/variations',
+                            search_parameters=search_parameters,
+                            odoo_dates_modified=odoo_product_variations_dates_modified,
+                            fields=WOOCOMMERCE_PRODUCT_VARIATION_FIELDS,
+                        )
+                    else:
+                        woocommerce_product_variations = self.woocommerce_api_get_all_items(
+                            woocommerce_api,
+                            endpoint=f'products/{product["id"]}/variations',
+                            search_parameters=search_parameters,
+                            fields=WOOCOMMERCE_PRODUCT_VARIATION_FIELDS,
+                        )
+
+                    woocommerce_product_variations_all.extend(woocommerce_product_variations)
+
+                    # Existing product variants, keyed by 'woocommerce_product_variation_id'
+                    odoo_product_variants_map = {variant.woocommerce_product_variation_id: variant for variant in odoo_product.product_variant_ids if variant.woocommerce_product_variation_id}
+
+                    for product_variation_index, product_variation in enumerate(woocommerce_product_variations):
+                        odoo_variant = odoo_product_variants_map.get(str(product_variation['id']))
+                        woocommerce_sync_count = 'updated' if odoo_variant else 'created'
+
+                        # Skip product variation if its WooCommerce payload did not change
+                        if self.odoo_record_payload_unchanged(odoo_variant, 'woocommerce_product_variation', product_variation):
+                            # Commit changes
+                            self.env.cr.commit()
+                            woocommerce_product_variations_committed = product_variation_index + 1
+                            continue
 
-                    for product_variation in woocommerce_product_variations:
                         product_variation_values = self.woocommerce_product_variation_fields(
                             woocommerce_sync_config,
                             product_variation,
@@ -1143,7 +2192,7 @@ class WoocommerceConnector(models.Model):
 
                         # Tax
                         if product_variation_values['woocommerce_product_variation_tax_rate']:
-                            odoo_product_variation_tax = self.odoo_tax_create_or_retrieve(product_variation_values['woocommerce_product_variation_tax_rate'], woocommerce_product_prices_include_tax)
+                            odoo_product_variation_tax = self.odoo_tax_create_or_retrieve(product_variation_values['woocommerce_product_variation_tax_rate'], woocommerce_product_prices_include_tax, odoo_taxes_map)
                             if odoo_product_variation_tax:
                                 odoo_product_variation_tax_id = [(6, 0, [odoo_product_variation_tax.id])]
                             else:
@@ -1153,8 +2202,11 @@ class WoocommerceConnector(models.Model):
                         if product_variation_values['woocommerce_product_variation_weight_unit']:
                             odoo_product_variation_unit_of_measure = self.odoo_unit_of_measure_create_or_retrieve(product_variation_values['woocommerce_product_variation_weight_unit'])
 
+                        # Images are only downloaded if they changed in WooCommerce
+                        odoo_product_variation_image_changed = not odoo_variant or odoo_variant.woocommerce_product_variation_image != product_variation_values['woocommerce_product_variation_image']
+
                         # Image featured
-                        if woocommerce_sync_config.settings_woocommerce_images_sync and product_variation_values['woocommerce_product_variation_image'] is not None:
+                        if woocommerce_sync_config.settings_woocommerce_images_sync and product_variation_values['woocommerce_product_variation_image'] is not None and odoo_product_variation_image_changed:
                             odoo_product_variation_image_featured = self.image_download_file_to_base64(product_variation_values['woocommerce_product_variation_image'])
                         else:
                             odoo_product_variation_image_featured = None
@@ -1248,11 +2300,24 @@ class WoocommerceConnector(models.Model):
                         if not odoo_variant:
                             continue
 
-                        # Update the variant with the WooCommerce values
-                        odoo_variant.write(product_variation_values)
+                        # Keep the existing image if it did not change
+                        if not odoo_product_variation_image_changed:
+                            product_variation_values.pop('image_1920')
+
+                        # Update the variant with the WooCommerce values, limited to the fields that changed (variants are created by '_create_variant_ids')
+                        product_variation_values_changed = self.odoo_record_values_changed(odoo_variant, product_variation_values)
+                        if product_variation_values_changed:
+                            odoo_variant.write(product_variation_values_changed)
+                        elif woocommerce_sync_count == 'updated':
+                            woocommerce_sync_count = None
 
                         # Commit changes
                         self.env.cr.commit()
+                        woocommerce_product_variations_committed = product_variation_index + 1
+
+                        # Count the product variation once committed
+                        if woocommerce_sync_count:
+                            woocommerce_sync_counts[woocommerce_sync_count] += 1
 
                 # After processing all variations for the current product
                 aggregated_tax_ids = []
@@ -1270,33 +2335,102 @@ class WoocommerceConnector(models.Model):
                 # Save SKU back to 'parent.template'
                 odoo_product.write({'default_code': odoo_product_sku})
 
+                # Commit changes
+                self.env.cr.commit()
+
             except Exception as error:
                 # Roll back changes
                 self.env.cr.rollback()
+                # All product variations of the product are retrieved again, but only the ones not committed count as failed
+                woocommerce_product_variations_failed.extend(woocommerce_product_variations)
+                woocommerce_product_variations_failed_count += len(woocommerce_product_variations) - woocommerce_product_variations_committed
                 _logger.exception(f'Error syncing product {product["id"]}: {error}')
 
+        # Advance the product variations watermark
+        self.woocommerce_watermark_update(woocommerce_sync_config, 'product_variations', woocommerce_product_variations_all, woocommerce_product_variations_failed)
+
+        return self.woocommerce_sync_counts_complete(woocommerce_sync_counts, len(woocommerce_product_variations_all), woocommerce_product_variations_failed_count)
+
     def woocommerce_to_odoo_customers_sync(self, woocommerce_sync_config, woocommerce_api):
         # WooCommerce REST API parameters
         search_parameters = {}
 
         if woocommerce_sync_config.settings_woocommerce_modified_records_import:
-            woocommerce_last_execution_datetime = self.woocommerce_last_execution_datetime()
-            if woocommerce_last_execution_datetime:
-                search_parameters['modified_after'] = woocommerce_last_execution_datetime.strftime('%Y-%m-%dT%H:%M:%S')  # ISO 8601 date format
+            search_parameters.update(self.woocommerce_modified_after_parameters(woocommerce_sync_config, 'customers'))
 
         # WooCommerce customers
-        woocommerce_customers = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='customers', search_parameters=search_parameters)
+        woocommerce_customers_page_size = search_parameters.setdefault('per_page', 100)
 
-        for customer in woocommerce_customers:
-            try:
-                # Search for existing customer in Odoo
-                odoo_customer = self.env['res.partner'].search(
-                    [('woocommerce_customer_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('woocommerce_customer_id', '=', customer['id'])],
-                    limit=1,
+        if woocommerce_sync_config.settings_woocommerce_changed_records_import:
+            woocommerce_customers = self.woocommerce_api_get_changed_items(
+                woocommerce_api,
+                endpoint='customers',
+                search_parameters=search_parameters,
+                odoo_dates_modified=self.odoo_dates_modified_retrieve(woocommerce_sync_config, 'res.partner', 'woocommerce_customer'),
+                fields=WOOCOMMERCE_CUSTOMER_FIELDS,
+            )
+        else:
+            woocommerce_customers = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='customers', search_parameters=search_parameters, fields=WOOCOMMERCE_CUSTOMER_FIELDS)
+
+        # Odoo countries
+        odoo_countries_map = self.odoo_countries_map_retrieve()
+
+        # Odoo customers to be created, keyed by 'woocommerce_customer_id'
+        customers_values_create = {}
+        woocommerce_customers_failed = []
+        woocommerce_sync_counts = Counter()
+
+        # WooCommerce customers keyed by 'woocommerce_customer_id', used to record the customers whose batch creation failed
+        woocommerce_customers_map = {str(customer['id']): customer for customer in woocommerce_customers}
+
+        for customer_index, customer in enumerate(woocommerce_customers):
+            # Create the new customers of the previous page and prefetch existing customers for each page of WooCommerce customers
+            if customer_index % woocommerce_customers_page_size == 0:
+                customers_values_failed = self.odoo_records_create_batch('res.partner', list(customers_values_create.values()))
+                woocommerce_customers_failed.extend(woocommerce_customers_map[str(values['woocommerce_customer_id'])] for values in customers_values_failed)
+                woocommerce_sync_counts['created'] += len(customers_values_create) - len(customers_values_failed)
+                customers_values_create = {}
+
+                woocommerce_customers_page = woocommerce_customers[customer_index : customer_index + woocommerce_customers_page_size]
+                odoo_customers_map, odoo_customers_email_map = self.odoo_customers_prefetch(
+                    woocommerce_sync_config,
+                    [customer_page['id'] for customer_page in woocommerce_customers_page],
+                    [customer_page['email'] for customer_page in woocommerce_customers_page],
                 )
 
-                # Create new customer in Odoo if it does not yet exist or update customer in Odoo only if WooCommerce version is newer
-                if not odoo_customer or (odoo_customer and self.datetime_convert(customer['date_modified_gmt']) > odoo_customer.write_date):
+                # Download the customer avatars of the page concurrently, keyed by avatar URL (scoped to the page, so that memory use stays bounded), skipping avatar URLs that did not change
+                odoo_avatars_map = {}
+                if woocommerce_sync_config.settings_woocommerce_images_sync:
+                    avatar_urls = set()
+                    for customer_page in woocommerce_customers_page:
+                        odoo_customer_page = odoo_customers_map.get(str(customer_page['id']))
+                        if not customer_page['avatar_url']:
+                            continue
+                        if odoo_customer_page and odoo_customer_page.woocommerce_customer_avatar_url == customer_page['avatar_url']:
+                            continue
+                        avatar_urls.add(customer_page['avatar_url'])
+
+                    odoo_avatars_map = self.image_download_files_to_base64(avatar_urls, woocommerce_api=woocommerce_api)
+
+            try:
+                # Retrieve existing customer in Odoo, by WooCommerce ID or otherwise by email address
+                odoo_customer = odoo_customers_map.get(str(customer['id']))
+                odoo_customer_email_match = not odoo_customer and customer['email']
+                if odoo_customer_email_match:
+                    odoo_customer = odoo_customers_email_map.get(customer['email'].strip().lower(), self.env['res.partner'])
+
+                    # Do not take over a customer already linked to another WooCommerce customer
+                    if odoo_customer.woocommerce_customer_id and odoo_customer.woocommerce_customer_id != str(customer['id']):
+                        odoo_customer = self.env['res.partner']
+
+                # Skip customer if its WooCommerce payload did not change
+                if not odoo_customer_email_match and self.odoo_record_payload_unchanged(odoo_customer, 'woocommerce_customer', customer):
+                    # Commit changes
+                    self.env.cr.commit()
+                    continue
+
+                # Create new customer in Odoo if it does not yet exist or update customer in Odoo unless the WooCommerce payload is older than the last imported one
+                if odoo_customer_email_match or self.odoo_record_payload_newer(odoo_customer, 'woocommerce_customer', customer):
                     # WooCommerce site URL field
                     customer_values = {
                         'woocommerce_customer_site_url': woocommerce_sync_config.settings_woocommerce_connection_url,
@@ -1359,6 +2493,7 @@ class WoocommerceConnector(models.Model):
                             'woocommerce_customer_date_last_login': datetime.fromtimestamp(int(meta['value']))
                             if (meta := next((meta for meta in customer['meta_data'] if meta.get('key') == 'wfls-last-login'), None))
                             else None,  # Wordfence Security field
+                            'woocommerce_customer_payload_hash': self.woocommerce_payload_hash(customer),
                         },
                     )
 
@@ -1372,9 +2507,9 @@ class WoocommerceConnector(models.Model):
                         if column in customer_values and customer_values[column]:
                             customer_values[column] = self.datetime_convert(customer_values[column])
 
-                    # Customer avatar
+                    # Customer avatar (downloaded for each page)
                     if woocommerce_sync_config.settings_woocommerce_images_sync and customer_values['woocommerce_customer_avatar_url'] != '':
-                        odoo_avatar_url = self.image_download_file_to_base64({'src': customer_values['woocommerce_customer_avatar_url']})
+                        odoo_avatar_url = odoo_avatars_map.get(customer_values['woocommerce_customer_avatar_url'])
                     else:
                         odoo_avatar_url = None
 
@@ -1398,49 +2533,239 @@ class WoocommerceConnector(models.Model):
                             'street2': customer_values['woocommerce_customer_billing_address_2'],
                             'city': customer_values['woocommerce_customer_billing_city'],
                             'zip': customer_values['woocommerce_customer_billing_postcode'],
-                            'country_id': self.env['res.country'].search([('code', '=', customer_values['woocommerce_customer_billing_country'])], limit=1).id,
+                            'country_id': odoo_countries_map.get(customer_values['woocommerce_customer_billing_country'], False),
                         },
                     )
 
-                    # Update customer in Odoo only if WooCommerce version is newer
+                    # Keep the existing avatar if the avatar URL did not change
+                    if odoo_customer and odoo_customer.woocommerce_customer_avatar_url == customer_values['woocommerce_customer_avatar_url']:
+                        customer_values.pop('image_1920')
+
+                    # Update customer in Odoo, limited to the fields that changed, or link the customer matched by email address
                     if odoo_customer:
-                        if customer_values['woocommerce_customer_date_modified_gmt'] > odoo_customer.write_date:
-                            odoo_customer.write(customer_values)
+                        customer_values_changed = self.odoo_record_values_changed(odoo_customer, customer_values)
+                        if customer_values_changed:
+                            odoo_customer.write(customer_values_changed)
 
-                    # Create new customer in Odoo if it does not yet exist
-                    else:
-                        odoo_customer = self.env['res.partner'].create(customer_values)
+                        # Commit changes
+                        self.env.cr.commit()
 
-                    # Commit changes
-                    self.env.cr.commit()
+                        # Count the customer once committed
+                        if customer_values_changed:
+                            woocommerce_sync_counts['updated'] += 1
+
+                    # Create new customer in Odoo if it does not yet exist (created in batch for each page)
+                    else:
+                        customers_values_create[str(customer['id'])] = customer_values
 
             except Exception as error:
                 # Roll back changes
                 self.env.cr.rollback()
+                woocommerce_customers_failed.append(customer)
                 _logger.exception(f'Error syncing customer {customer["id"]}: {error}')
 
-    def woocommerce_to_odoo_orders_sync(self, woocommerce_sync_config, woocommerce_api, woocommerce_tax_rates, woocommerce_weight_unit):
+        # Create the new customers of the last page
+        customers_values_failed = self.odoo_records_create_batch('res.partner', list(customers_values_create.values()))
+        woocommerce_customers_failed.extend(woocommerce_customers_map[str(values['woocommerce_customer_id'])] for values in customers_values_failed)
+        woocommerce_sync_counts['created'] += len(customers_values_create) - len(customers_values_failed)
+
+        # Advance the customers watermark
+        self.woocommerce_watermark_update(woocommerce_sync_config, 'customers', woocommerce_customers, woocommerce_customers_failed)
+
+        return self.woocommerce_sync_counts_complete(woocommerce_sync_counts, len(woocommerce_customers), len(woocommerce_customers_failed))
+
+    def odoo_countries_map_retrieve(self):
+        """Retrieve a map of Odoo country IDs keyed by ISO 3166-1 alpha-2 country code."""
+        return {country['code']: country['id'] for country in self.env['res.country'].search_read([], fields=['code'])}
+
+    def odoo_customers_prefetch(self, woocommerce_sync_config, woocommerce_customer_ids, woocommerce_customer_emails):
+        """Prefetch the Odoo customers of a page of WooCommerce customers or orders. Returns a customers map keyed by 'woocommerce_customer_id' and a customers map keyed by lowercased email address."""
+        # Guest customers have a 'woocommerce_customer_id' of 0
+        woocommerce_customer_ids = [str(woocommerce_customer_id) for woocommerce_customer_id in woocommerce_customer_ids if woocommerce_customer_id]
+        woocommerce_customer_emails = {email.strip().lower() for email in woocommerce_customer_emails if email and email.strip()}
+
+        if not woocommerce_customer_ids and not woocommerce_customer_emails:
+            return {}, {}
+
+        # Email addresses are matched case-insensitively, with a single 'lower(email)' lookup ('res_partner_woocommerce_customer_email_index')
+        odoo_customers_conditions = []
+        odoo_customers_parameters = [woocommerce_sync_config.settings_woocommerce_connection_url]
+        if woocommerce_customer_ids:
+            odoo_customers_conditions.append('woocommerce_customer_id_integer IN %s')
+            odoo_customers_parameters.append(tuple(int(customer_id) for customer_id in woocommerce_customer_ids))
+        if woocommerce_customer_emails:
+            odoo_customers_conditions.append('lower(email) IN %s')
+            odoo_customers_parameters.append(tuple(sorted(woocommerce_customer_emails)))
+
+        self.env['res.partner'].flush_model(['woocommerce_customer_site_url', 'active', 'woocommerce_customer_id_integer', 'email'])
+        self.env.cr.execute(
+            f'SELECT id FROM res_partner WHERE woocommerce_customer_site_url = %s AND active AND ({" OR ".join(odoo_customers_conditions)}) ORDER BY id',
+            odoo_customers_parameters,
+        )
+        odoo_customers = self.env['res.partner'].browse([row[0] for row in self.env.cr.fetchall()])
+
+        odoo_customers_map = {}
+        odoo_customers_email_map = {}
+        for odoo_customer in odoo_customers:
+            if odoo_customer.woocommerce_customer_id in woocommerce_customer_ids:
+                odoo_customers_map.setdefault(odoo_customer.woocommerce_customer_id, odoo_customer)
+            if odoo_customer.email:
+                odoo_customers_email_map.setdefault(odoo_customer.email.strip().lower(), odoo_customer)
+
+        return odoo_customers_map, odoo_customers_email_map
+
+    def odoo_records_create_batch(self, model_name, values_list):
+        """Create Odoo records in a single batch and commit them. If the batch fails, the records are created one by one, so that a single invalid record does not discard the whole batch. Returns the values of the records that could not be created."""
+        values_failed = []
+        if not values_list:
+            return values_failed
+
+        try:
+            self.env[model_name].create(values_list)
+
+            # Commit changes
+            self.env.cr.commit()
+
+        except Exception as error:
+            # Roll back changes
+            self.env.cr.rollback()
+            _logger.warning(f'Error creating {len(values_list)} {model_name} records in batch, retrying one by one: {error}')
+
+            for values in values_list:
+                try:
+                    self.env[model_name].create(values)
+
+                    # Commit changes
+                    self.env.cr.commit()
+
+                except Exception as error:
+                    # Roll back changes
+                    self.env.cr.rollback()
+                    _logger.exception(f'Error creating {model_name} record {values.get("name")}: {error}')
+                    values_failed.append(values)
+
+        return values_failed
+
+    def odoo_products_index_build(self, woocommerce_sync_config):
+        """Build an index of Odoo 'product.product' IDs keyed by '(woocommerce_product_id, woocommerce_product_variation_id)'. Products are also indexed with a variation ID of 0, so that simple products and unmatched variations resolve to their product."""
+        odoo_products = self.env['product.product'].search_read(
+            [
+                '|',
+                ('woocommerce_product_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
+                ('woocommerce_product_variation_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
+                ('active', '=', True),
+                ('woocommerce_product_id', '!=', False),
+            ],
+            fields=['woocommerce_product_id', 'woocommerce_product_variation_id'],
+        )
+
+        odoo_products_index = {}
+        for odoo_product in odoo_products:
+            try:
+                woocommerce_product_id = int(odoo_product['woocommerce_product_id'])
+                woocommerce_product_variation_id = int(odoo_product['woocommerce_product_variation_id'] or 0)
+            except ValueError:
+                continue
+
+            if woocommerce_product_variation_id:
+                odoo_products_index.setdefault((woocommerce_product_id, woocommerce_product_variation_id), odoo_product['id'])
+            odoo_products_index.setdefault((woocommerce_product_id, 0), odoo_product['id'])
+
+        return odoo_products_index
+
+    @staticmethod
+    def odoo_products_index_retrieve(odoo_products_index, woocommerce_product_id, woocommerce_product_variation_id=0):
+        """Retrieve an Odoo 'product.product' ID from the products index, matching on the variation ID when present."""
+        woocommerce_product_id = int(woocommerce_product_id or 0)
+        woocommerce_product_variation_id = int(woocommerce_product_variation_id or 0)
+
+        if woocommerce_product_variation_id and (woocommerce_product_id, woocommerce_product_variation_id) in odoo_products_index:
+            return odoo_products_index[(woocommerce_product_id, woocommerce_product_variation_id)]
+
+        return odoo_products_index.get((woocommerce_product_id, 0), False)
+
+    def odoo_sale_orders_prefetch(self, woocommerce_sync_config, woocommerce_orders):
+        """Prefetch the Odoo sale orders and sale order lines of a page of WooCommerce orders. Returns a sale orders map keyed by 'woocommerce_order_id' and a sale order lines map keyed by '(order_id, woocommerce_order_line_item_id)'."""
+        odoo_sale_orders = self.env['sale.order'].search(
+            [('woocommerce_order_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('woocommerce_order_id_integer', 'in', [order['id'] for order in woocommerce_orders])],
+        )
+
+        odoo_sale_orders_map = {}
+        for odoo_sale_order in odoo_sale_orders:
+            odoo_sale_orders_map.setdefault(odoo_sale_order.woocommerce_order_id, odoo_sale_order)
+
+        odoo_sale_order_lines = self.env['sale.order.line'].search(
+            [
+                ('woocommerce_order_line_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
+                ('order_id', 'in', odoo_sale_orders.ids),
+                ('woocommerce_order_line_item_id_integer', '>', 0),
+            ],
+        )
+
+        odoo_sale_order_lines_map = {}
+        for odoo_sale_order_line in odoo_sale_order_lines:
+            odoo_sale_order_lines_map.setdefault((odoo_sale_order_line.order_id.id, odoo_sale_order_line.woocommerce_order_line_item_id), odoo_sale_order_line)
+
+        return odoo_sale_orders_map, odoo_sale_order_lines_map
+
+    def woocommerce_to_odoo_orders_sync(self, woocommerce_sync_config, woocommerce_api, woocommerce_tax_rates_index, woocommerce_weight_unit):
         # WooCommerce REST API parameters
         search_parameters = {}
 
         if woocommerce_sync_config.settings_woocommerce_modified_records_import:
-            woocommerce_last_execution_datetime = self.woocommerce_last_execution_datetime()
-            if woocommerce_last_execution_datetime:
-                search_parameters['modified_after'] = woocommerce_last_execution_datetime.strftime('%Y-%m-%dT%H:%M:%S')  # ISO 8601 date format
+            search_parameters.update(self.woocommerce_modified_after_parameters(woocommerce_sync_config, 'orders'))
 
         # WooCommerce orders
-        woocommerce_orders = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='orders', search_parameters=search_parameters)
+        woocommerce_orders_page_size = search_parameters.setdefault('per_page', 100)
 
-        for order in woocommerce_orders:
-            try:
-                # Search for existing sale order in Odoo
-                odoo_sale_order = self.env['sale.order'].search(
-                    [('woocommerce_order_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('woocommerce_order_id', '=', order['id'])],
-                    limit=1,
+        if woocommerce_sync_config.settings_woocommerce_changed_records_import:
+            woocommerce_orders = self.woocommerce_api_get_changed_items(
+                woocommerce_api,
+                endpoint='orders',
+                search_parameters=search_parameters,
+                odoo_dates_modified=self.odoo_dates_modified_retrieve(woocommerce_sync_config, 'sale.order', 'woocommerce_order', active_only=False),
+                fields=WOOCOMMERCE_ORDER_FIELDS,
+            )
+        else:
+            woocommerce_orders = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='orders', search_parameters=search_parameters, fields=WOOCOMMERCE_ORDER_FIELDS)
+
+        # Odoo products index, built once per run and used to map line items to Odoo products
+        odoo_products_index = self.odoo_products_index_build(woocommerce_sync_config) if woocommerce_sync_config.settings_woocommerce_order_line_items_product_map else {}
+        odoo_product_placeholder = None
+        woocommerce_orders_failed = []
+        woocommerce_sync_counts = Counter()
+
+        # Odoo taxes
+        odoo_taxes_map = self.odoo_taxes_map_build()
+
+        # Odoo countries
+        odoo_countries_map = self.odoo_countries_map_retrieve()
+
+        for order_index, order in enumerate(woocommerce_orders):
+            # Prefetch existing sale orders and sale order lines for each page of WooCommerce orders
+            if order_index % woocommerce_orders_page_size == 0:
+                woocommerce_orders_page = woocommerce_orders[order_index : order_index + woocommerce_orders_page_size]
+                odoo_sale_orders_map, odoo_sale_order_lines_map = self.odoo_sale_orders_prefetch(woocommerce_sync_config, woocommerce_orders_page)
+                odoo_customers_map, odoo_customers_email_map = self.odoo_customers_prefetch(
+                    woocommerce_sync_config,
+                    [order_page['customer_id'] for order_page in woocommerce_orders_page],
+                    [order_page['billing']['email'] for order_page in woocommerce_orders_page] if woocommerce_sync_config.settings_woocommerce_orders_customers_map else [],
                 )
 
-                # Create new sale order in Odoo if it does not yet exist or update sale order in Odoo only if WooCommerce version is newer
-                if not odoo_sale_order or (odoo_sale_order and self.datetime_convert(order['date_modified_gmt']) > odoo_sale_order.write_date):
+            odoo_customer_email_created = {}
+
+            try:
+                # Retrieve existing sale order in Odoo
+                odoo_sale_order = odoo_sale_orders_map.get(str(order['id']), self.env['sale.order'])
+
+                # Skip sale order if its WooCommerce payload did not change
+                if self.odoo_record_payload_unchanged(odoo_sale_order, 'woocommerce_order', order):
+                    # Commit changes
+                    self.env.cr.commit()
+                    continue
+
+                # Create new sale order in Odoo if it does not yet exist or update sale order in Odoo unless the WooCommerce payload is older than the last imported one
+                if self.odoo_record_payload_newer(odoo_sale_order, 'woocommerce_order', order):
                     # WooCommerce site URL field
                     order_values = {
                         'woocommerce_order_site_url': woocommerce_sync_config.settings_woocommerce_connection_url,
@@ -1545,6 +2870,7 @@ class WoocommerceConnector(models.Model):
                     order_values.update(
                         {
                             'order_language_code': order.get('lang', None),  # Polylang field
+                            'woocommerce_order_payload_hash': self.woocommerce_payload_hash(order),
                         },
                     )
 
@@ -1567,18 +2893,13 @@ class WoocommerceConnector(models.Model):
                         odoo_order_currency = self.odoo_currency_retrieve(order_values['woocommerce_order_currency'])
 
                     # Odoo Customer ID
-                    odoo_customer = self.env['res.partner'].search(
-                        [
-                            ('woocommerce_customer_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
-                            ('active', '=', True),
-                            ('woocommerce_customer_id', '=', order_values['woocommerce_order_customer_id']),
-                        ],
-                        limit=1,
-                    )
+                    odoo_customer = odoo_customers_map.get(str(order_values['woocommerce_order_customer_id']), self.env['res.partner'])
 
                     if not odoo_customer:
                         if woocommerce_sync_config.settings_woocommerce_orders_customers_map:
+                            # WooCommerce site URL field
                             customer_values = {
+                                'woocommerce_customer_site_url': woocommerce_sync_config.settings_woocommerce_connection_url,
                                 'woocommerce_customer_id': order_values['woocommerce_order_customer_id'],
                             }
 
@@ -1631,19 +2952,18 @@ class WoocommerceConnector(models.Model):
                                     'street2': customer_values['woocommerce_customer_billing_address_2'],
                                     'city': customer_values['woocommerce_customer_billing_city'],
                                     'zip': customer_values['woocommerce_customer_billing_postcode'],
-                                    'country_id': self.env['res.country'].search([('code', '=', customer_values['woocommerce_customer_billing_country'])], limit=1).id,
+                                    'country_id': odoo_countries_map.get(customer_values['woocommerce_customer_billing_country'], False),
                                 },
                             )
 
                             # Check for duplicate email
                             if customer_values['email']:
-                                odoo_customer = self.env['res.partner'].search(
-                                    [('woocommerce_customer_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url), ('active', '=', True), ('email', '=', customer_values['email'])],
-                                    limit=1,
-                                )
+                                odoo_customer = odoo_customers_email_map.get(customer_values['email'].strip().lower())
 
                                 if not odoo_customer:
                                     odoo_customer = self.env['res.partner'].create(customer_values)
+                                    # Added to the customers email map once the sale order is committed
+                                    odoo_customer_email_created = {customer_values['email'].strip().lower(): odoo_customer}
 
                         else:
                             # Create/retrieve customer placeholder
@@ -1690,8 +3010,20 @@ class WoocommerceConnector(models.Model):
                     # Create new sale order in Odoo if it does not yet exist
                     if not odoo_sale_order:
                         odoo_sale_order = self.env['sale.order'].create(order_values)
+                        odoo_sale_orders_map[str(order['id'])] = odoo_sale_order
+                        woocommerce_sync_count = 'created'
+
+                    # Update sale order once, only with the fields whose values changed
+                    else:
+                        order_values_changed = self.odoo_record_values_changed(odoo_sale_order, order_values)
+                        if order_values_changed:
+                            odoo_sale_order.write(order_values_changed)
+                        woocommerce_sync_count = 'updated'
 
                     # Order line items
+                    odoo_sale_order_lines_values_write = []
+                    odoo_sale_order_lines_values_create = []
+
                     for line_item in order_values['woocommerce_order_line_items']:
                         # WooCommerce site URL field
                         order_line_values = {
@@ -1706,7 +3038,7 @@ class WoocommerceConnector(models.Model):
                                 'woocommerce_order_line_item_product_id': line_item['product_id'],
                                 'woocommerce_order_line_item_variation_id': line_item['variation_id'],
                                 'woocommerce_order_line_item_quantity': line_item['quantity'],
-                                'woocommerce_order_line_item_tax_class': woocommerce_tax_rates.get(line_item['tax_class'] if line_item['tax_class'] else 'standard'),
+                                'woocommerce_order_line_item_tax_class': line_item['tax_class'] or 'standard',
                                 'woocommerce_order_line_item_subtotal': line_item['subtotal'],
                                 'woocommerce_order_line_item_subtotal_tax': line_item['subtotal_tax'],
                                 'woocommerce_order_line_item_total': line_item['total'],
@@ -1726,26 +3058,38 @@ class WoocommerceConnector(models.Model):
                         )
 
                         # Odoo Product ID
-                        odoo_product_variation = None
+                        odoo_product_variation = self.env['product.product']
 
                         if woocommerce_sync_config.settings_woocommerce_order_line_items_product_map:
                             # Product variation (for 'simple' products, Odoo still creates a single default variant under 'product.product' model)
-                            odoo_product_variation = self.env['product.product'].search(
-                                [
-                                    ('woocommerce_product_variation_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
-                                    ('active', '=', True),
-                                    ('woocommerce_product_id', '=', order_line_values['woocommerce_order_line_item_product_id']),
-                                ],
-                                limit=1,
+                            odoo_product_variation = self.env['product.product'].browse(
+                                self.odoo_products_index_retrieve(odoo_products_index, line_item['product_id'], line_item['variation_id']),
                             )
 
                         if not odoo_product_variation:
                             # Create/retrieve product placeholder
-                            odoo_product = self.odoo_product_placeholder_create_or_retrieve()
+                            if not odoo_product_placeholder:
+                                odoo_product_placeholder = self.odoo_product_placeholder_create_or_retrieve()
 
-                        # Tax
-                        if order_line_values['woocommerce_order_line_item_tax_class']:
-                            odoo_order_line_item_tax = self.odoo_tax_create_or_retrieve(order_line_values['woocommerce_order_line_item_tax_class'], order_values['woocommerce_order_prices_include_tax'])
+                            odoo_product_variation = odoo_product_placeholder.product_variant_ids[:1]
+
+                        # Tax (the tax rate applied by WooCommerce, or else, if the applied tax rate no longer exists in WooCommerce, the tax rate of the line item tax class for the order shipping/billing location). Line items without applied tax (e.g. exports, reverse charge, tax exempt customers) get no tax
+                        odoo_order_line_item_tax_id = []
+                        woocommerce_order_line_item_taxes_applied = [tax for tax in line_item['taxes'] if float(tax.get('total') or 0)]
+                        odoo_order_line_item_tax_rate = next(
+                            (woocommerce_tax_rates_index['by_id'][tax['id']] for tax in woocommerce_order_line_item_taxes_applied if woocommerce_tax_rates_index['by_id'].get(tax['id']) is not None),
+                            None,
+                        )
+                        if odoo_order_line_item_tax_rate is None and woocommerce_order_line_item_taxes_applied:
+                            odoo_order_line_item_tax_rate = self.woocommerce_tax_rate_retrieve(
+                                woocommerce_tax_rates_index,
+                                order_line_values['woocommerce_order_line_item_tax_class'],
+                                (order.get('shipping') or {}).get('country') or (order.get('billing') or {}).get('country'),
+                                (order.get('shipping') or {}).get('state') if (order.get('shipping') or {}).get('country') else (order.get('billing') or {}).get('state'),
+                            )
+
+                        if odoo_order_line_item_tax_rate:
+                            odoo_order_line_item_tax = self.odoo_tax_create_or_retrieve(odoo_order_line_item_tax_rate, order_values['woocommerce_order_prices_include_tax'], odoo_taxes_map)
                             if odoo_order_line_item_tax:
                                 odoo_order_line_item_tax_id = [(6, 0, [odoo_order_line_item_tax.id])]
 
@@ -1759,7 +3103,7 @@ class WoocommerceConnector(models.Model):
                                 # General information
                                 'order_id': odoo_sale_order.id,
                                 'name': order_line_values['woocommerce_order_line_item_name'],
-                                'product_id': odoo_product.product_variant_ids[:1].id,
+                                'product_id': odoo_product_variation.id,
                                 # Shipping and stock
                                 'warehouse_id': woocommerce_sync_config.settings_woocommerce_products_warehouse_location.id,
                                 # Dimensions
@@ -1778,34 +3122,42 @@ class WoocommerceConnector(models.Model):
                             },
                         )
 
-                        odoo_sale_order_line = self.env['sale.order.line'].search(
-                            [
-                                ('woocommerce_order_line_site_url', '=', woocommerce_sync_config.settings_woocommerce_connection_url),
-                                ('order_id', '=', odoo_sale_order.id),
-                                ('woocommerce_order_line_item_id', '=', order_line_values['woocommerce_order_line_item_id']),
-                            ],
-                            limit=1,
-                        )
+                        odoo_sale_order_line = odoo_sale_order_lines_map.get((odoo_sale_order.id, str(order_line_values['woocommerce_order_line_item_id'])))
 
                         if odoo_sale_order_line:
-                            # Update the sale order line
-                            odoo_sale_order_line.write(order_line_values)
-
-                            # Update sale order
-                            if odoo_sale_order:
-                                odoo_sale_order.write(order_values)
+                            order_line_values_changed = self.odoo_record_values_changed(odoo_sale_order_line, order_line_values)
+                            if order_line_values_changed:
+                                odoo_sale_order_lines_values_write.append((1, odoo_sale_order_line.id, order_line_values_changed))
 
                         else:
-                            self.env['sale.order.line'].create(order_line_values)
+                            odoo_sale_order_lines_values_create.append(order_line_values)
+
+                    # Update the changed sale order lines in a single write of the sale order
+                    if odoo_sale_order_lines_values_write:
+                        odoo_sale_order.write({'order_line': odoo_sale_order_lines_values_write})
+
+                    # Create the new sale order lines
+                    if odoo_sale_order_lines_values_create:
+                        self.env['sale.order.line'].create(odoo_sale_order_lines_values_create)
 
                     # Commit changes
                     self.env.cr.commit()
+                    odoo_customers_email_map.update(odoo_customer_email_created)
+
+                    # Count the sale order once committed
+                    woocommerce_sync_counts[woocommerce_sync_count] += 1
 
             except Exception as error:
                 # Roll back changes
                 self.env.cr.rollback()
+                woocommerce_orders_failed.append(order)
                 _logger.exception(f'Error syncing order {order["id"]}: {error}')
 
+        # Advance the orders watermark
+        self.woocommerce_watermark_update(woocommerce_sync_config, 'orders', woocommerce_orders, woocommerce_orders_failed)
+
+        return self.woocommerce_sync_counts_complete(woocommerce_sync_counts, len(woocommerce_orders), len(woocommerce_orders_failed))
+
     def woocommerce_attribute_create_or_retrieve(self, woocommerce_api, attribute_type, attribute_name, language_code=None):
         """Create or retrieve a WooCommerce attribute, brand, category or tag."""
         if not attribute_type and not attribute_name:
@@ -1815,7 +3167,7 @@ class WoocommerceConnector(models.Model):
         if language_code is not None:
             search_parameters['lang'] = language_code
 
-        woocommerce_attribute_values = self.woocommerce_api_get_all_items(woocommerce_api, endpoint=f'products/{attribute_type}', search_parameters=search_parameters)
+        woocommerce_attribute_values = self.woocommerce_api_get_all_items(woocommerce_api, endpoint=f'products/{attribute_type}', search_parameters=search_parameters, fields=('id', 'name'))
         if woocommerce_attribute_values:
             return woocommerce_attribute_values[0]
         else:
@@ -1852,7 +3204,7 @@ class WoocommerceConnector(models.Model):
                 if woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code:
                     search_parameters['lang'] = woocommerce_sync_config.settings_woocommerce_to_odoo_products_language_code
 
-                woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters)
+                woocommerce_products = self.woocommerce_api_get_all_items(woocommerce_api, endpoint='products', search_parameters=search_parameters, fields=('id', 'date_modified_gmt'))
                 woocommerce_product = woocommerce_products[0] if woocommerce_products else None
 
                 # Create new product in WooCommerce if it does not yet exist or update product in WooCommerce only if Odoo version is newer
@@ -1978,7 +3330,12 @@ class WoocommerceConnector(models.Model):
                     # For variable products, handle variations
                     if product_values.get('type') == 'variable':
                         # Retrieve existing variations from WooCommerce
-                        woocommerce_product_variations = self.woocommerce_api_get_all_items(woocommerce_api, endpoint=f'products/{woocommerce_product["id"]}/variations', search_parameters={'status': 'publish'})
+                        woocommerce_product_variations = self.woocommerce_api_get_all_items(
+                            woocommerce_api,
+                            endpoint=f'products/{woocommerce_product["id"]}/variations',
+                            search_parameters={'status': 'publish'},
+                            fields=('id', 'sku', 'date_modified_gmt'),
+                        )
 
                         # Build a mapping by SKU for easier lookup
                         variations_by_sku = {variation.get('sku'): variation for variation in woocommerce_product_variations if variation.get('sku')}
@@ -1,4 +1,34 @@
+import logging
+
 from odoo import api, fields, models
+from odoo.tools import sql
+
+# Settings
+_logger = logging.getLogger(__name__)
+
+
+def woocommerce_id_integer(woocommerce_id):
+    """Convert a WooCommerce ID stored as text to an integer (0 if empty or not numeric)."""
+    return int(woocommerce_id) if woocommerce_id and str(woocommerce_id).isdigit() else 0
+
+
+def woocommerce_id_integer_column_fill(cr, table_name, column_name):
+    """Fill the integer copy ('<column_name>_integer') of a WooCommerce ID column for existing rows, before its indexes are created (new stored computed columns are only computed by the ORM after 'init')."""
+    cr.execute(f"UPDATE {table_name} SET {column_name}_integer = CASE WHEN {column_name} ~ '^[0-9]{{1,9}}$' THEN {column_name}::integer ELSE 0 END WHERE {column_name}_integer IS NULL")
+
+
+def woocommerce_index_create(cr, index_name, table_name, expressions, where, unique=False):
+    """Create a composite partial index matching a sync lookup. Unique indexes are created as regular indexes, with a warning, if the table already contains duplicates."""
+    if sql.index_exists(cr, index_name):
+        return
+
+    if unique:
+        cr.execute(f'SELECT 1 FROM {table_name} WHERE {where} GROUP BY {", ".join(expressions)} HAVING count(*) > 1 LIMIT 1')
+        if cr.fetchone():
+            _logger.warning(f"Table '{table_name}' contains duplicate WooCommerce records ({', '.join(expressions)}), creating index '{index_name}' without unique constraint.")
+            unique = False
+
+    cr.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX {index_name} ON {table_name} ({", ".join(expressions)}) WHERE {where}')
 
 
 # Stock
@@ -26,6 +56,15 @@ class StockMove(models.Model):
         ondelete='cascade',
     )
 
+    def _action_done(self, cancel_backorder=False):
+        stock_moves = super()._action_done(cancel_backorder=cancel_backorder)
+
+        # Push the stock changes of products linked to WooCommerce (except the stock imported from WooCommerce by the stock sync)
+        if not self.env.context.get('woocommerce_stock_sync'):
+            self.env['woocommerce.configuration'].woocommerce_stock_push_enqueue(stock_moves.product_id)
+
+        return stock_moves
+
 
 class StockValuationLayer(models.Model):
     _inherit = 'stock.valuation.layer'
@@ -36,13 +75,27 @@ class StockValuationLayer(models.Model):
 
 # Product
 class ProductTemplate(models.Model):
-    _inherit = 'product.template'
+    _inherit = ['product.template', 'woocommerce.payload.archive.mixin']
+
+    @api.depends('woocommerce_product_id')
+    def woocommerce_product_id_integer_compute(self):
+        for product in self:
+            product.woocommerce_product_id_integer = woocommerce_id_integer(product.woocommerce_product_id)
+
+    def init(self):
+        super().init()
+
+        # Product sync lookup: active product of a WooCommerce store by ID (integer ID, so that lookups do not depend on the text representation of the ID)
+        woocommerce_id_integer_column_fill(self.env.cr, self._table, 'woocommerce_product_id')
+        woocommerce_index_create(
+            self.env.cr, 'product_template_woocommerce_product_id_index', self._table, ['woocommerce_product_site_url', 'woocommerce_product_id_integer'], 'active AND woocommerce_product_id_integer > 0', unique=True
+        )
 
     # Override the existing 'default_code' field to remove the compute/inverse for multi-variant products, so it can be set manually
     default_code = fields.Char(string='Internal Reference', store=True)
 
     # WooCommerce site URL field
-    woocommerce_product_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True)
+    woocommerce_product_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True, copy=False)
 
     # WooCommerce REST API - Common fields for Products and Product Variants
     woocommerce_product_type = fields.Selection(
@@ -59,7 +112,8 @@ class ProductTemplate(models.Model):
     )
 
     # WooCommerce REST API - Product properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#product-properties
-    woocommerce_product_id = fields.Char(string='WooCommerce ID', readonly=True, index=True)
+    woocommerce_product_id = fields.Char(string='WooCommerce ID', readonly=True, index=True, copy=False)
+    woocommerce_product_id_integer = fields.Integer(string='WooCommerce ID (Integer)', compute='woocommerce_product_id_integer_compute', store=True, readonly=True)
     woocommerce_product_name = fields.Char(string='Name', readonly=True)
     woocommerce_product_slug = fields.Char(string='Slug', readonly=True)
     woocommerce_product_permalink = fields.Char(string='Permalink', readonly=True)
@@ -88,8 +142,9 @@ class ProductTemplate(models.Model):
         string='Catalog Visibility',
         readonly=True,
     )
-    woocommerce_product_description = fields.Html(string='Description', readonly=True)
-    woocommerce_product_short_description = fields.Html(string='Short Description', readonly=True)
+    # Large fields (HTML, JSON, text) are not prefetched with the other fields of the model, but loaded together ('woocommerce_payload' prefetch group) only when one of them is read
+    woocommerce_product_description = fields.Html(string='Description', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_short_description = fields.Html(string='Short Description', prefetch='woocommerce_payload', readonly=True)
     woocommerce_product_sku = fields.Char(string='SKU', readonly=True)
     woocommerce_product_price = fields.Char(string='Price', readonly=True)
     woocommerce_product_regular_price = fields.Char(string='Regular Price', readonly=True)
@@ -104,7 +159,7 @@ class ProductTemplate(models.Model):
     woocommerce_product_total_sales = fields.Integer(string='Total Sales', readonly=True)
     woocommerce_product_virtual = fields.Boolean(string='Virtual', readonly=True)
     woocommerce_product_downloadable = fields.Boolean(string='Downloadable', readonly=True)
-    woocommerce_product_downloads = fields.Json(string='Downloads', readonly=True)
+    woocommerce_product_downloads = fields.Json(string='Downloads', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
     woocommerce_product_download_limit = fields.Integer(string='Download Limit', readonly=True)
     woocommerce_product_download_expiry = fields.Integer(string='Download Expiry', readonly=True)
     woocommerce_product_external_url = fields.Char(string='External URL', readonly=True)
@@ -143,7 +198,7 @@ class ProductTemplate(models.Model):
     woocommerce_product_backordered = fields.Boolean(string='Backordered', readonly=True)
     woocommerce_product_sold_individually = fields.Boolean(string='Sold Individually', readonly=True)
     woocommerce_product_weight = fields.Char(string='Weight', readonly=True)
-    woocommerce_product_dimensions = fields.Json(string='Dimensions', readonly=True)
+    woocommerce_product_dimensions = fields.Json(string='Dimensions', prefetch='woocommerce_payload', readonly=True)
     woocommerce_product_shipping_required = fields.Boolean(string='Shipping Required', readonly=True)
     woocommerce_product_shipping_taxable = fields.Boolean(string='Shipping Taxable', readonly=True)
     woocommerce_product_shipping_class = fields.Char(string='Shipping Class', readonly=True)
@@ -151,29 +206,30 @@ class ProductTemplate(models.Model):
     woocommerce_product_reviews_allowed = fields.Boolean(string='Reviews Allowed', readonly=True)
     woocommerce_product_average_rating = fields.Char(string='Average Rating', readonly=True)
     woocommerce_product_rating_count = fields.Integer(string='Rating Count', readonly=True)
-    woocommerce_product_related_ids = fields.Text(string='Related Products', readonly=True)
-    woocommerce_product_upsell_ids = fields.Text(string='Upsell Products', readonly=True)
-    woocommerce_product_cross_sell_ids = fields.Text(string='Cross-Sell Products', readonly=True)
+    woocommerce_product_related_ids = fields.Text(string='Related Products', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_upsell_ids = fields.Text(string='Upsell Products', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_cross_sell_ids = fields.Text(string='Cross-Sell Products', prefetch='woocommerce_payload', readonly=True)
     woocommerce_product_parent_id = fields.Integer(string='Parent Product ID', readonly=True)
-    woocommerce_product_purchase_note = fields.Text(string='Purchase Note', readonly=True)
-    woocommerce_product_categories = fields.Json(string='Categories', readonly=True)
-    woocommerce_product_tags = fields.Json(string='Tags', readonly=True)
-    woocommerce_product_images = fields.Json(string='Images', readonly=True)
-    woocommerce_product_attributes = fields.Json(string='Attributes', readonly=True)
-    woocommerce_product_default_attributes = fields.Json(string='Default Attributes', readonly=True)
-    woocommerce_product_variations = fields.Json(string='Variations', readonly=True)
-    woocommerce_product_grouped_products = fields.Json(string='Grouped Products', readonly=True)
+    woocommerce_product_purchase_note = fields.Text(string='Purchase Note', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_categories = fields.Json(string='Categories', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_product_tags = fields.Json(string='Tags', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_product_images = fields.Json(string='Images', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_attributes = fields.Json(string='Attributes', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_product_default_attributes = fields.Json(string='Default Attributes', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_product_variations = fields.Json(string='Variations', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_product_grouped_products = fields.Json(string='Grouped Products', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
     woocommerce_product_menu_order = fields.Integer(string='Menu Order', readonly=True)
-    woocommerce_product_meta_data = fields.Json(string='Meta Data', readonly=True)
+    woocommerce_product_meta_data = fields.Json(string='Meta Data', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
 
     # WooCommerce REST API - Fields not mentioned in the documentation
-    woocommerce_product_brands = fields.Json(string='Brands', readonly=True)
+    woocommerce_product_brands = fields.Json(string='Brands', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
 
     # Additional fields
     woocommerce_product_currency = fields.Char(string='Currency', readonly=True)
     woocommerce_product_weight_unit = fields.Char(string='Weight Unit', readonly=True)
     woocommerce_product_dimension_unit = fields.Char(string='Dimension Unit', readonly=True)
     woocommerce_product_tax_rate = fields.Integer(string='Tax Rate', readonly=True)
+    woocommerce_product_payload_hash = fields.Char(string='Payload Hash', help='Hash of the last imported WooCommerce payload, used to skip unchanged products.', readonly=True, copy=False)
 
     # Custom fields
     product_sync_to_woocommerce = fields.Boolean(string='Sync to WooCommerce', default=False)
@@ -190,7 +246,29 @@ class ProductTemplate(models.Model):
 
 # Product variations
 class ProductProduct(models.Model):
-    _inherit = 'product.product'
+    _inherit = ['product.product', 'woocommerce.payload.archive.mixin']
+
+    @api.depends('woocommerce_product_variation_id')
+    def woocommerce_product_variation_id_integer_compute(self):
+        for product_variation in self:
+            product_variation.woocommerce_product_variation_id_integer = woocommerce_id_integer(product_variation.woocommerce_product_variation_id)
+
+    def init(self):
+        super().init()
+
+        # Product variation sync lookup: active product variation of a WooCommerce store by ID (integer ID, so that lookups do not depend on the text representation of the ID)
+        woocommerce_id_integer_column_fill(self.env.cr, self._table, 'woocommerce_product_variation_id')
+        woocommerce_index_create(
+            self.env.cr,
+            'product_product_woocommerce_product_variation_id_index',
+            self._table,
+            ['woocommerce_product_variation_site_url', 'woocommerce_product_variation_id_integer'],
+            'active AND woocommerce_product_variation_id_integer > 0',
+            unique=True,
+        )
+
+        # Stock push lookup: products with stock changes not yet pushed to WooCommerce
+        woocommerce_index_create(self.env.cr, 'product_product_woocommerce_stock_push_pending_index', self._table, ['id'], 'woocommerce_stock_push_pending')
 
     def action_update_quantity_on_hand(self):
         # Update stock first
@@ -202,10 +280,11 @@ class ProductProduct(models.Model):
         return res
 
     # WooCommerce site URL field
-    woocommerce_product_variation_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True)
+    woocommerce_product_variation_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True, copy=False)
 
     # WooCommerce REST API - Product variation properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#product-variation-properties
-    woocommerce_product_variation_id = fields.Char(string='WooCommerce ID', readonly=True, index=True)
+    woocommerce_product_variation_id = fields.Char(string='WooCommerce ID', readonly=True, index=True, copy=False)
+    woocommerce_product_variation_id_integer = fields.Integer(string='WooCommerce ID (Integer)', compute='woocommerce_product_variation_id_integer_compute', store=True, readonly=True)
     woocommerce_product_variation_name = fields.Char(string='Name', readonly=True)
     woocommerce_product_variation_permalink = fields.Char(string='Permalink', readonly=True)
     woocommerce_product_variation_date_created = fields.Datetime(string='Date Created', readonly=True)
@@ -222,7 +301,7 @@ class ProductProduct(models.Model):
         string='Status',
         readonly=True,
     )
-    woocommerce_product_variation_description = fields.Html(string='Description', readonly=True)
+    woocommerce_product_variation_description = fields.Html(string='Description', prefetch='woocommerce_payload', readonly=True)
     woocommerce_product_variation_sku = fields.Char(string='SKU', readonly=True)
     woocommerce_product_variation_price = fields.Char(string='Price', readonly=True)
     woocommerce_product_variation_regular_price = fields.Char(string='Regular Price', readonly=True)
@@ -235,7 +314,7 @@ class ProductProduct(models.Model):
     woocommerce_product_variation_purchasable = fields.Boolean(string='Purchasable', readonly=True)
     woocommerce_product_variation_virtual = fields.Boolean(string='Virtual', readonly=True)
     woocommerce_product_variation_downloadable = fields.Boolean(string='Downloadable', readonly=True)
-    woocommerce_product_variation_downloads = fields.Json(string='Downloads', readonly=True)
+    woocommerce_product_variation_downloads = fields.Json(string='Downloads', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
     woocommerce_product_variation_download_limit = fields.Integer(string='Download Limit', readonly=True)
     woocommerce_product_variation_download_expiry = fields.Integer(string='Download Expiry', readonly=True)
     woocommerce_product_variation_tax_status = fields.Selection(
@@ -271,13 +350,13 @@ class ProductProduct(models.Model):
     woocommerce_product_variation_backorders_allowed = fields.Boolean(string='Backorders Allowed', readonly=True)
     woocommerce_product_variation_backordered = fields.Boolean(string='Backordered', readonly=True)
     woocommerce_product_variation_weight = fields.Char(string='Weight', readonly=True)
-    woocommerce_product_variation_dimensions = fields.Json(string='Dimensions', readonly=True)
+    woocommerce_product_variation_dimensions = fields.Json(string='Dimensions', prefetch='woocommerce_payload', readonly=True)
     woocommerce_product_variation_shipping_class = fields.Char(string='Shipping Class', readonly=True)
     woocommerce_product_variation_shipping_class_id = fields.Integer(string='Shipping Class ID', readonly=True)
-    woocommerce_product_variation_image = fields.Json(string='Images', readonly=True)
-    woocommerce_product_variation_attributes = fields.Json(string='Attributes', readonly=True)
+    woocommerce_product_variation_image = fields.Json(string='Images', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_product_variation_attributes = fields.Json(string='Attributes', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
     woocommerce_product_variation_menu_order = fields.Integer(string='Menu Order', readonly=True)
-    woocommerce_product_variation_meta_data = fields.Json(string='Meta Data', readonly=True)
+    woocommerce_product_variation_meta_data = fields.Json(string='Meta Data', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
 
     # WooCommerce REST API - Fields not mentioned in the documentation
     woocommerce_product_variation_parent_id = fields.Integer(string='Parent Product ID', readonly=True)
@@ -287,6 +366,8 @@ class ProductProduct(models.Model):
     woocommerce_product_variation_weight_unit = fields.Char(string='Weight Unit', readonly=True)
     woocommerce_product_variation_dimension_unit = fields.Char(string='Dimension Unit', readonly=True)
     woocommerce_product_variation_tax_rate = fields.Integer(string='Tax Rate', readonly=True)
+    woocommerce_stock_push_pending = fields.Boolean(string='Stock Push Pending', help='Stock changed in Odoo, not yet pushed to WooCommerce.', readonly=True, copy=False)
+    woocommerce_product_variation_payload_hash = fields.Char(string='Payload Hash', help='Hash of the last imported WooCommerce payload, used to skip unchanged product variations.', readonly=True, copy=False)
 
     # Custom fields
     if not hasattr(models.BaseModel, '_fields') or 'product_stock_date_updated' not in ProductTemplate._fields:
@@ -296,13 +377,31 @@ class ProductProduct(models.Model):
 
 # Customers
 class ResPartner(models.Model):
-    _inherit = 'res.partner'
+    _inherit = ['res.partner', 'woocommerce.payload.archive.mixin']
+
+    @api.depends('woocommerce_customer_id')
+    def woocommerce_customer_id_integer_compute(self):
+        for customer in self:
+            customer.woocommerce_customer_id_integer = woocommerce_id_integer(customer.woocommerce_customer_id)
+
+    def init(self):
+        super().init()
+
+        # Customer sync lookup: active customer of a WooCommerce store by ID (integer ID, so that lookups do not depend on the text representation of the ID)
+        woocommerce_id_integer_column_fill(self.env.cr, self._table, 'woocommerce_customer_id')
+        woocommerce_index_create(
+            self.env.cr, 'res_partner_woocommerce_customer_id_index', self._table, ['woocommerce_customer_site_url', 'woocommerce_customer_id_integer'], 'active AND woocommerce_customer_id_integer > 0', unique=True
+        )
+
+        # Customer sync lookup: active customers of a WooCommerce store by email address (case-insensitive)
+        woocommerce_index_create(self.env.cr, 'res_partner_woocommerce_customer_email_index', self._table, ['woocommerce_customer_site_url', 'lower(email)'], 'active AND email IS NOT NULL')
 
     # WooCommerce site URL field
-    woocommerce_customer_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True)
+    woocommerce_customer_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True, copy=False)
 
     # WooCommerce REST API - Customer properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#customer-properties
-    woocommerce_customer_id = fields.Char(string='WooCommerce ID', readonly=True, index=True)
+    woocommerce_customer_id = fields.Char(string='WooCommerce ID', readonly=True, index=True, copy=False)
+    woocommerce_customer_id_integer = fields.Integer(string='WooCommerce ID (Integer)', compute='woocommerce_customer_id_integer_compute', store=True, readonly=True)
     woocommerce_customer_date_created = fields.Datetime(string='Created Date', readonly=True)
     woocommerce_customer_date_created_gmt = fields.Datetime(string='Created Date', readonly=True)
     woocommerce_customer_date_modified = fields.Datetime(string='Modified Date', readonly=True)
@@ -314,7 +413,7 @@ class ResPartner(models.Model):
     woocommerce_customer_username = fields.Char(string='Username', readonly=True)
     woocommerce_customer_is_paying_customer = fields.Boolean(string='Is Paying Customer', readonly=True)
     woocommerce_customer_avatar_url = fields.Char(string='Avatar URL', readonly=True)
-    woocommerce_customer_meta_data = fields.Json(string='Meta Data', readonly=True)
+    woocommerce_customer_meta_data = fields.Json(string='Meta Data', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
 
     # WooCommerce REST API - Customer billing properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#customer-billing-properties
     woocommerce_customer_billing_first_name = fields.Char(string='Billing First Name', readonly=True)
@@ -342,11 +441,24 @@ class ResPartner(models.Model):
 
     # Custom fields
     woocommerce_customer_date_last_login = fields.Datetime(string='Last Login Date', readonly=True)  # Wordfence fields
+    woocommerce_customer_payload_hash = fields.Char(string='Payload Hash', help='Hash of the last imported WooCommerce payload, used to skip unchanged customers.', readonly=True, copy=False)
 
 
 # Orders
 class SaleOrder(models.Model):
-    _inherit = 'sale.order'
+    _inherit = ['sale.order', 'woocommerce.payload.archive.mixin']
+
+    @api.depends('woocommerce_order_id')
+    def woocommerce_order_id_integer_compute(self):
+        for order in self:
+            order.woocommerce_order_id_integer = woocommerce_id_integer(order.woocommerce_order_id)
+
+    def init(self):
+        super().init()
+
+        # Order sync lookup: order of a WooCommerce store by ID (integer ID, so that lookups do not depend on the text representation of the ID)
+        woocommerce_id_integer_column_fill(self.env.cr, self._table, 'woocommerce_order_id')
+        woocommerce_index_create(self.env.cr, 'sale_order_woocommerce_order_id_index', self._table, ['woocommerce_order_site_url', 'woocommerce_order_id_integer'], 'woocommerce_order_id_integer > 0', unique=True)
 
     @api.depends('woocommerce_order_total', 'woocommerce_order_transaction_fee')
     def payout_compute(self):
@@ -354,10 +466,11 @@ class SaleOrder(models.Model):
             order.woocommerce_order_payout = order.woocommerce_order_total - order.woocommerce_order_transaction_fee
 
     # WooCommerce site URL field
-    woocommerce_order_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True)
+    woocommerce_order_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True, copy=False)
 
     # WooCommerce REST API - Order properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#order-properties
-    woocommerce_order_id = fields.Char(string='WooCommerce ID', readonly=True, index=True)
+    woocommerce_order_id = fields.Char(string='WooCommerce ID', readonly=True, index=True, copy=False)
+    woocommerce_order_id_integer = fields.Integer(string='WooCommerce ID (Integer)', compute='woocommerce_order_id_integer_compute', store=True, readonly=True)
     woocommerce_order_parent_id = fields.Char(string='Parent ID', readonly=True)
     woocommerce_order_number = fields.Char(string='Number', readonly=True)
     woocommerce_order_order_key = fields.Char(string='Key', readonly=True)
@@ -393,13 +506,13 @@ class SaleOrder(models.Model):
     woocommerce_order_date_completed = fields.Datetime(string='Date Completed', readonly=True)
     woocommerce_order_date_completed_gmt = fields.Datetime(string='Date Completed', readonly=True)
     woocommerce_order_cart_hash = fields.Char(string='Cart Hash', readonly=True)
-    woocommerce_order_meta_data = fields.Json(string='Meta Data', readonly=True)
-    woocommerce_order_line_items = fields.Json(string='Line Items', readonly=True)
-    woocommerce_order_tax_lines = fields.Json(string='Tax Lines', readonly=True)
-    woocommerce_order_shipping_lines = fields.Json(string='Shipping Lines', readonly=True)
-    woocommerce_order_fee_lines = fields.Json(string='Fee Lines', readonly=True)
-    woocommerce_order_coupon_lines = fields.Json(string='Coupon Lines', readonly=True)
-    woocommerce_order_refunds = fields.Json(string='Refunds', readonly=True)
+    woocommerce_order_meta_data = fields.Json(string='Meta Data', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_line_items = fields.Json(string='Line Items', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_tax_lines = fields.Json(string='Tax Lines', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_shipping_lines = fields.Json(string='Shipping Lines', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_fee_lines = fields.Json(string='Fee Lines', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_coupon_lines = fields.Json(string='Coupon Lines', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
+    woocommerce_order_refunds = fields.Json(string='Refunds', compute='woocommerce_payload_compute', inverse='woocommerce_payload_inverse', readonly=True)
     # woocommerce_order_set_paid = fields.Boolean(string='Set Paid', readonly=True)
 
     # WooCommerce REST API - Order billing properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#order-billing-properties
@@ -428,6 +541,7 @@ class SaleOrder(models.Model):
 
     # Custom fields
     woocommerce_order_transaction_fee = fields.Float(string='Transaction Fee', help='Transaction fees incurred from PayPal or Stripe.', readonly=True, default=0.0)
+    woocommerce_order_payload_hash = fields.Char(string='Payload Hash', help='Hash of the last imported WooCommerce payload, used to skip unchanged orders.', readonly=True, copy=False)
     if not hasattr(models.BaseModel, '_fields') or 'order_language_code' not in ProductTemplate._fields:
         order_language_code = fields.Char(string='Language', help='Polylang 2-digit ISO 639-1 language code.', readonly=True)  # Polylang
 
@@ -451,11 +565,26 @@ class SaleOrder(models.Model):
 class SaleOrderLine(models.Model):
     _inherit = 'sale.order.line'
 
+    @api.depends('woocommerce_order_line_item_id')
+    def woocommerce_order_line_item_id_integer_compute(self):
+        for order_line in self:
+            order_line.woocommerce_order_line_item_id_integer = woocommerce_id_integer(order_line.woocommerce_order_line_item_id)
+
+    def init(self):
+        super().init()
+
+        # Order line item sync lookup: line item of an order by WooCommerce ID (integer ID, so that lookups do not depend on the text representation of the ID)
+        woocommerce_id_integer_column_fill(self.env.cr, self._table, 'woocommerce_order_line_item_id')
+        woocommerce_index_create(
+            self.env.cr, 'sale_order_line_woocommerce_order_line_item_id_index', self._table, ['order_id', 'woocommerce_order_line_item_id_integer'], 'woocommerce_order_line_item_id_integer > 0', unique=True
+        )
+
     # WooCommerce site URL field
     woocommerce_order_line_site_url = fields.Char(string='WooCommerce Site URL', readonly=True, index=True)
 
     # WooCommerce REST API - Order line items properties fields - https://woocommerce.github.io/woocommerce-rest-api-docs/#order-line-items-properties
     woocommerce_order_line_item_id = fields.Char(string='WooCommerce ID', readonly=True, index=True)
+    woocommerce_order_line_item_id_integer = fields.Integer(string='WooCommerce ID (Integer)', compute='woocommerce_order_line_item_id_integer_compute', store=True, readonly=True)
     woocommerce_order_line_item_name = fields.Char(string='Product Name', readonly=True)
     woocommerce_order_line_item_product_id = fields.Char(string='Product ID', readonly=True)
     woocommerce_order_line_item_variation_id = fields.Char(string='Variation ID', readonly=True)
@@ -465,8 +594,8 @@ class SaleOrderLine(models.Model):
     woocommerce_order_line_item_subtotal_tax = fields.Float(string='Subtotal Tax', readonly=True)
     woocommerce_order_line_item_total = fields.Float(string='Total', readonly=True)
     woocommerce_order_line_item_total_tax = fields.Float(string='Total Tax', readonly=True)
-    woocommerce_order_line_item_taxes = fields.Text(string='Taxes', readonly=True)
-    woocommerce_order_line_item_meta_data = fields.Text(string='Meta Data', readonly=True)
+    woocommerce_order_line_item_taxes = fields.Text(string='Taxes', prefetch='woocommerce_payload', readonly=True)
+    woocommerce_order_line_item_meta_data = fields.Text(string='Meta Data', prefetch='woocommerce_payload', readonly=True)
     woocommerce_order_line_item_sku = fields.Char(string='SKU', readonly=True)
     woocommerce_order_line_item_price = fields.Float(string='Price', readonly=True)
 
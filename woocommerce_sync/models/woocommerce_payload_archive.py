@@ -0,0 +1,89 @@
+from odoo import api, fields, models
+
+
+class WoocommercePayloadArchive(models.Model):
+    _name = 'woocommerce.payload.archive'
+    _description = 'WooCommerce Payload Archive'
+    _rec_name = 'res_model'
+
+    res_model = fields.Char(string='Model', required=True, index=True, readonly=True)
+    res_id = fields.Many2oneReference(string='Record ID', model_field='res_model', required=True, readonly=True)
+    payload = fields.Json(string='Payload', readonly=True)
+
+    _sql_constraints = [('res_model_res_id_unique', 'UNIQUE(res_model, res_id)', 'A record can only have one WooCommerce payload archive.')]
+
+    def init(self):
+        # Move payloads out of the table rows (TOAST, compressed) as soon as a row exceeds the minimum tuple target
+        self.env.cr.execute('ALTER TABLE woocommerce_payload_archive SET (toast_tuple_target = 128)')
+
+    @api.model
+    def payloads_retrieve(self, res_model, res_ids):
+        """Retrieve the archived WooCommerce payloads of a batch of records, keyed by record ID."""
+        if not res_ids:
+            return {}
+
+        woocommerce_payload_archives = self.search_read([('res_model', '=', res_model), ('res_id', 'in', list(res_ids))], fields=['res_id', 'payload'])
+        return {archive['res_id']: archive['payload'] or {} for archive in woocommerce_payload_archives}
+
+    @api.model
+    def payloads_store(self, res_model, payloads):
+        """Merge the given WooCommerce payloads ({record ID: {field name: value}}) into the archive of each record, creating missing archives in a single batch."""
+        if not payloads:
+            return
+
+        woocommerce_payload_archives = self.search([('res_model', '=', res_model), ('res_id', 'in', list(payloads))])
+        woocommerce_payload_archives_map = {archive.res_id: archive for archive in woocommerce_payload_archives}
+
+        values_create = []
+        for res_id, payload in payloads.items():
+            woocommerce_payload_archive = woocommerce_payload_archives_map.get(res_id)
+            if woocommerce_payload_archive:
+                payload_merged = {**(woocommerce_payload_archive.payload or {}), **payload}
+                if payload_merged != woocommerce_payload_archive.payload:
+                    woocommerce_payload_archive.write({'payload': payload_merged})
+            else:
+                values_create.append({'res_model': res_model, 'res_id': res_id, 'payload': payload})
+
+        if values_create:
+            self.create(values_create)
+
+
+class WoocommercePayloadArchiveMixin(models.AbstractModel):
+    """Raw WooCommerce payload fields (e.g. meta data, line items) kept in 'woocommerce.payload.archive' instead of the table of the model. Fields computed by 'woocommerce_payload_compute' (with the 'woocommerce_payload_inverse' inverse) are loaded lazily, for the whole prefetched batch at once, and written to the archive. The archive is only accessible to administrators: it is accessed with sudo, after checking the access to the records it belongs to."""
+
+    _name = 'woocommerce.payload.archive.mixin'
+    _description = 'WooCommerce Payload Archive Mixin'
+
+    def woocommerce_payload_fields(self):
+        return [field_name for field_name, field in self._fields.items() if field.compute == 'woocommerce_payload_compute']
+
+    def woocommerce_payload_compute(self):
+        woocommerce_payload_fields = self.woocommerce_payload_fields()
+        self._origin.check_access_rights('read')
+        self._origin.check_access_rule('read')
+        woocommerce_payloads = self.env['woocommerce.payload.archive'].sudo().payloads_retrieve(self._name, self._origin.ids)
+
+        for record in self:
+            woocommerce_payload = woocommerce_payloads.get(record._origin.id, {})
+            for field_name in woocommerce_payload_fields:
+                record[field_name] = woocommerce_payload.get(field_name, False)
+
+    def woocommerce_payload_inverse(self):
+        # Only the values in cache are archived (the written values), so that fields not written are not computed (and overwritten) from the previous archive
+        woocommerce_payload_fields = [self._fields[field_name] for field_name in self.woocommerce_payload_fields()]
+
+        woocommerce_payloads = {}
+        for record in self:
+            woocommerce_payload = {field.name: record[field.name] for field in woocommerce_payload_fields if self.env.cache.contains(record, field)}
+            if woocommerce_payload:
+                woocommerce_payloads[record.id] = woocommerce_payload
+
+        self.check_access_rights('write')
+        self.check_access_rule('write')
+        self.env['woocommerce.payload.archive'].sudo().payloads_store(self._name, woocommerce_payloads)
+
+    def unlink(self):
+        woocommerce_payload_archives = self.env['woocommerce.payload.archive'].sudo().search([('res_model', '=', self._name), ('res_id', 'in', self.ids)])
+        res = super().unlink()
+        woocommerce_payload_archives.unlink()
+        return res
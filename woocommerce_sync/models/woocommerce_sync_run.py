@@ -0,0 +1,170 @@
+import logging
+import time
+from base64 import b64encode
+from contextlib import contextmanager
+
+from odoo import api, fields, models
+
+from ..tools.profiler import WoocommerceStageProfiler
+
+# Settings
+_logger = logging.getLogger(__name__)
+
+
+class WoocommerceSyncRun(models.Model):
+    _name = 'woocommerce.sync.run'
+    _description = 'WooCommerce Sync Run'
+    _order = 'date_start desc, id desc'
+    _rec_name = 'date_start'
+
+    woocommerce_configuration_id = fields.Many2one(comodel_name='woocommerce.configuration', string='WooCommerce Configuration', ondelete='cascade', index=True, readonly=True)
+    date_start = fields.Datetime(string='Started', readonly=True)
+    date_end = fields.Datetime(string='Finished', readonly=True)
+    state = fields.Selection(selection=[('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], string='Status', default='running', readonly=True)
+    error = fields.Text(string='Error', readonly=True)
+    stage_ids = fields.One2many(comodel_name='woocommerce.sync.run.stage', inverse_name='run_id', string='Stages', readonly=True)
+    profile_attachment_ids = fields.One2many(comodel_name='ir.attachment', inverse_name='res_id', domain=[('res_model', '=', 'woocommerce.sync.run')], string='Profiles', readonly=True)
+
+    # Totals
+    wall_time = fields.Float(string='Wall Time (s)', compute='totals_compute', store=True)
+    cpu_time = fields.Float(string='CPU Time (s)', compute='totals_compute', store=True)
+    http_requests = fields.Integer(string='HTTP Requests', compute='totals_compute', store=True)
+    http_bytes = fields.Float(string='HTTP Bytes', digits=(16, 0), compute='totals_compute', store=True)
+    query_count = fields.Integer(string='SQL Queries', compute='totals_compute', store=True)
+    records_failed = fields.Integer(string='Failed', compute='totals_compute', store=True)
+
+    @api.depends('stage_ids.wall_time', 'stage_ids.cpu_time', 'stage_ids.http_requests', 'stage_ids.http_bytes', 'stage_ids.query_count', 'stage_ids.records_failed')
+    def totals_compute(self):
+        for record in self:
+            record.wall_time = sum(record.stage_ids.mapped('wall_time'))
+            record.cpu_time = sum(record.stage_ids.mapped('cpu_time'))
+            record.http_requests = sum(record.stage_ids.mapped('http_requests'))
+            record.http_bytes = sum(record.stage_ids.mapped('http_bytes'))
+            record.query_count = sum(record.stage_ids.mapped('query_count'))
+            record.records_failed = sum(record.stage_ids.mapped('records_failed'))
+
+    @api.model
+    def run_start(self, woocommerce_sync_config):
+        """Create a sync run for a WooCommerce configuration. Committed right away, as sync steps commit and roll back per record."""
+        woocommerce_sync_run = self.create({'woocommerce_configuration_id': woocommerce_sync_config.id, 'date_start': fields.Datetime.now()})
+
+        # Commit changes
+        self.env.cr.commit()
+
+        return woocommerce_sync_run
+
+    def run_finish(self, error=None):
+        self.write({'date_end': fields.Datetime.now(), 'state': 'failed' if error else 'done', 'error': str(error) if error else False})
+
+        # Commit changes
+        self.env.cr.commit()
+
+    def stage_record(self, stage, state='done', **values):
+        """Record a stage of the sync run."""
+        self.ensure_one()
+        woocommerce_sync_run_stage = self.env['woocommerce.sync.run.stage'].create({'run_id': self.id, 'stage': stage, 'state': state, **values})
+
+        # Commit changes
+        self.env.cr.commit()
+
+        return woocommerce_sync_run_stage
+
+    @contextmanager
+    def stage_measure(self, stage, woocommerce_api=None):
+        """Measure a stage of the sync run (wall and CPU time, WooCommerce REST API requests and bytes, SQL queries) and record it. Yields a dict in which the stage can store its record counts ('created', 'updated', 'skipped', 'failed') under the 'counts' key."""
+        self.ensure_one()
+        woocommerce_sync_stage = {'counts': None, 'values': {}}
+
+        date_start = fields.Datetime.now()
+        wall_time_start = time.perf_counter()
+        cpu_time_start = time.thread_time()
+        query_count_start = self.env.cr.sql_log_count
+        http_requests_start = woocommerce_api.http_requests_count if woocommerce_api else 0
+        http_retries_start = woocommerce_api.http_retries_count if woocommerce_api else 0
+        http_bytes_start = woocommerce_api.http_bytes_count if woocommerce_api else 0
+
+        # Debug mode: profile the stage
+        woocommerce_stage_profiler = WoocommerceStageProfiler(self.woocommerce_configuration_id.settings_woocommerce_debug_profiling, stage)
+
+        error = None
+        try:
+            with woocommerce_stage_profiler:
+                yield woocommerce_sync_stage
+        except Exception as stage_error:
+            error = stage_error
+            raise
+        finally:
+            counts = woocommerce_sync_stage['counts'] or {}
+            if error:
+                # Leave the cursor usable for recording the stage
+                self.env.cr.rollback()
+
+            try:
+                self.stage_record(
+                    stage,
+                    state='failed' if error else 'done',
+                    date_start=date_start,
+                    wall_time=time.perf_counter() - wall_time_start,
+                    cpu_time=time.thread_time() - cpu_time_start,
+                    query_count=self.env.cr.sql_log_count - query_count_start,
+                    http_requests=(woocommerce_api.http_requests_count - http_requests_start) if woocommerce_api else 0,
+                    http_retries=(woocommerce_api.http_retries_count - http_retries_start) if woocommerce_api else 0,
+                    http_bytes=(woocommerce_api.http_bytes_count - http_bytes_start) if woocommerce_api else 0,
+                    records_created=counts.get('created', 0),
+                    records_updated=counts.get('updated', 0),
+                    records_skipped=counts.get('skipped', 0),
+                    records_failed=counts.get('failed', 0),
+                    error=str(error) if error else False,
+                    **woocommerce_sync_stage['values'],
+                )
+            except Exception:
+                _logger.exception(f"Error recording WooCommerce sync stage '{stage}'")
+
+            try:
+                self.profile_attachments_create(woocommerce_stage_profiler.results())
+            except Exception:
+                _logger.exception(f"Error saving the profile of WooCommerce sync stage '{stage}'")
+
+    def profile_attachments_create(self, profile_results):
+        """Save the profile output of a stage as attachments of the sync run."""
+        if not profile_results:
+            return
+
+        self.env['ir.attachment'].create(
+            [{'name': file_name, 'type': 'binary', 'datas': b64encode(content), 'mimetype': mimetype, 'res_model': self._name, 'res_id': self.id} for file_name, content, mimetype in profile_results],
+        )
+
+        # Commit changes
+        self.env.cr.commit()
+
+
+class WoocommerceSyncRunStage(models.Model):
+    _name = 'woocommerce.sync.run.stage'
+    _description = 'WooCommerce Sync Run Stage'
+    _order = 'run_id desc, id'
+    _rec_name = 'stage'
+
+    run_id = fields.Many2one(comodel_name='woocommerce.sync.run', string='Sync Run', required=True, ondelete='cascade', index=True, readonly=True)
+    woocommerce_configuration_id = fields.Many2one(related='run_id.woocommerce_configuration_id', store=True, readonly=True)
+    stage = fields.Char(string='Stage', required=True, readonly=True)
+    state = fields.Selection(selection=[('done', 'Done'), ('skipped', 'Skipped (Locked)'), ('failed', 'Failed')], string='Status', default='done', readonly=True)
+    date_start = fields.Datetime(string='Started', readonly=True)
+    error = fields.Text(string='Error', readonly=True)
+
+    # Timing
+    wall_time = fields.Float(string='Wall Time (s)', group_operator='sum', readonly=True)
+    cpu_time = fields.Float(string='CPU Time (s)', group_operator='sum', readonly=True)
+
+    # WooCommerce REST API
+    http_requests = fields.Integer(string='HTTP Requests', group_operator='sum', readonly=True)
+    http_retries = fields.Integer(string='HTTP Retries', group_operator='sum', readonly=True)
+    http_bytes = fields.Float(string='HTTP Bytes', digits=(16, 0), group_operator='sum', readonly=True)
+
+    # PostgreSQL
+    query_count = fields.Integer(string='SQL Queries', group_operator='sum', readonly=True)
+
+    # Records
+    records_created = fields.Integer(string='Created', group_operator='sum', readonly=True)
+    records_updated = fields.Integer(string='Updated', group_operator='sum', readonly=True)
+    records_skipped = fields.Integer(string='Skipped', group_operator='sum', readonly=True)
+    records_failed = fields.Integer(string='Failed', group_operator='sum', readonly=True)
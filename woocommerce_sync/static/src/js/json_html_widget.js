@@ -1,75 +1,110 @@
 /** @odoo-module **/
 
-import { registry } from "@web/core/registry";  // Keep the registry import
-import { Markup } from "web.utils";  // Import Markup for HTML rendering
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
 
-const { Component, useRef } = owl;
+const { Component, useState } = owl;
 
-export class JsonHtmlField extends Component {
-    static template = "JsonHtmlField";
+// Number of array items or object keys rendered at once (the next ones are rendered on demand)
+const JSON_PAGE_SIZE = 50;
+
+function jsonParse(value) {
+    if (value === false || value === null || value === undefined || value === "") {
+        return undefined;
+    }
+    return typeof value === "string" ? JSON.parse(value) : value;
+}
+
+// Collapsible JSON node: the children of a node are only rendered once it is expanded, and large arrays and objects are paginated
+export class JsonTreeNode extends Component {
+    static template = "woocommerce_sync.JsonTreeNode";
 
     setup() {
-        super.setup();
-        this.input = useRef("jsonInput");
+        this.state = useState({ expanded: Boolean(this.props.expanded), limit: this.props.pageSize || JSON_PAGE_SIZE });
     }
 
-    get formattedValue() {
-        try {
-            const value = this.props.value;
-            if (!value) return "No data";
+    get isContainer() {
+        return this.props.value !== null && typeof this.props.value === "object";
+    }
+
+    get isArray() {
+        return Array.isArray(this.props.value);
+    }
 
-            const jsonData = typeof value === "string" ? JSON.parse(value) : value;
+    get size() {
+        return this.isArray ? this.props.value.length : Object.keys(this.props.value).length;
+    }
+
+    get summary() {
+        return this.isArray ? `[${this.size} items]` : `{${this.size} keys}`;
+    }
+
+    get visibleEntries() {
+        const entries = this.isArray ? this.props.value.slice(0, this.state.limit).map((item, index) => [index, item]) : Object.entries(this.props.value).slice(0, this.state.limit);
+        return entries.map(([key, value]) => ({ key: String(key), value }));
+    }
+
+    get remainingCount() {
+        return Math.max(this.size - this.state.limit, 0);
+    }
+
+    get formattedPrimitive() {
+        return typeof this.props.value === "string" ? this.props.value : JSON.stringify(this.props.value);
+    }
 
-            // Convert JSON to a table with improved formatting
-            const formattedHtml = this.formatJsonToTable(jsonData);
-            return Markup(formattedHtml);  // This ensures it's rendered as raw HTML
-        } catch (e) {
-            return "Invalid JSON";
+    toggle() {
+        this.state.expanded = !this.state.expanded;
+    }
+
+    showMore() {
+        this.state.limit += this.props.pageSize || JSON_PAGE_SIZE;
+    }
+}
+JsonTreeNode.components = { JsonTreeNode };
+
+// Field widget: renders the JSON value of the field, loaded with the form, as a collapsible tree
+export class JsonHtmlField extends Component {
+    static template = "JsonHtmlField";
+    static components = { JsonTreeNode };
+
+    get jsonData() {
+        try {
+            return { value: jsonParse(this.props.value) };
+        } catch {
+            return { error: true };
         }
     }
+}
+
+registry.category("fields").add("json_html", JsonHtmlField);
+
+// View widget: the JSON field (given by the 'field_name' attribute) is not read with the form, but fetched when the widget is first expanded
+export class JsonHtmlLazyWidget extends Component {
+    static template = "JsonHtmlLazyWidget";
+    static components = { JsonTreeNode };
 
-    formatJsonToTable(data) {
-        const tableStyle = `
-            border-collapse: collapse;
-            width: 100%;
-            margin-bottom: 1em;
-            font-family: Arial, sans-serif;
-        `;
-        const thStyle = `
-            background-color: #f2f2f2;
-            text-align: left;
-            padding: 8px;
-            font-weight: bold;
-        `;
-        const tdStyle = `
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        `;
-
-        if (Array.isArray(data)) {
-            return `
-                <table class="json-table" style="${tableStyle}">
-                    <tr><th style="${thStyle}">Index</th><th style="${thStyle}">Value</th></tr>
-                    ${data.map((item, index) => `
-            <tr>
-            <td style="${tdStyle}">${index}</td>
-            <td style="${tdStyle}">${this.formatJsonToTable(item)}</td>
-            </tr>`).join('')}
-                </table>`;
-        } else if (typeof data === "object") {
-            return `
-                <table class="json-table" style="${tableStyle}">
-                    <tr><th style="${thStyle}">Key</th><th style="${thStyle}">Value</th></tr>
-                    ${Object.entries(data).map(([key, value]) => `
-            <tr>
-            <td style="${tdStyle}">${key}</td>
-            <td style="${tdStyle}">${this.formatJsonToTable(value)}</td>
-            </tr>`).join('')}
-                </table>`;
+    setup() {
+        this.orm = useService("orm");
+        this.state = useState({ expanded: false, loading: false, loaded: false, value: undefined, error: false });
+    }
+
+    async toggle() {
+        this.state.expanded = !this.state.expanded;
+        if (!this.state.expanded || this.state.loaded || this.state.loading || !this.props.record.resId) {
+            return;
+        }
+
+        this.state.loading = true;
+        try {
+            const [record] = await this.orm.read(this.props.record.resModel, [this.props.record.resId], [this.props.fieldName]);
+            this.state.value = jsonParse(record && record[this.props.fieldName]);
+        } catch {
+            this.state.error = true;
         }
-        return data;
+        this.state.loading = false;
+        this.state.loaded = true;
     }
 }
+JsonHtmlLazyWidget.extractProps = ({ attrs }) => ({ fieldName: attrs.field_name });
 
-registry.category("fields").add("json_html", JsonHtmlField);  // Ensure registration
+registry.category("view_widgets").add("json_html_lazy", JsonHtmlLazyWidget);
@@ -0,0 +1,7 @@
+from . import (
+    test_woocommerce_stock_push,
+    test_woocommerce_sync_queries,
+    test_woocommerce_tax_rates,
+)
+
+__all__ = ['test_woocommerce_stock_push', 'test_woocommerce_sync_queries', 'test_woocommerce_tax_rates']
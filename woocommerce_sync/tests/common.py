@@ -0,0 +1,171 @@
+import json
+import os
+import re
+
+from odoo.tests.common import TransactionCase
+
+# Settings
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'fixtures')
+WOOCOMMERCE_TEST_URL = 'https://shop.example.com'
+
+
+def fixture_load(fixture_name):
+    """Load a recorded WooCommerce REST API (wc/v3) fixture."""
+    with open(os.path.join(FIXTURES_DIRECTORY, f'{fixture_name}.json'), encoding='utf-8') as fixture_file:
+        return json.load(fixture_file)
+
+
+class WoocommerceFakeResponse:
+    """Minimal 'requests.Response' stand-in returned by WoocommerceFakeApi."""
+
+    def __init__(self, status_code, data, headers=None):
+        self.status_code = status_code
+        self.data = data
+        self.headers = headers or {}
+        self.content = json.dumps(data).encode()
+        self.text = self.content.decode()
+
+    def json(self):
+        return self.data
+
+
+class WoocommerceFakeApi:
+    """WooCommerce REST API client stand-in serving recorded fixtures, with the pagination headers, the list parameters ('page', 'per_page', '_fields', 'include', 'type', 'manage_stock') and the batch updates used by the sync. Every request is recorded, so that tests can assert the number of HTTP calls."""
+
+    def __init__(self, products=None, product_variations=None, customers=None, orders=None, taxes=None):
+        self.products = products if products is not None else fixture_load('products')
+        self.product_variations = product_variations if product_variations is not None else fixture_load('product_variations')
+        self.customers = customers if customers is not None else fixture_load('customers')
+        self.orders = orders if orders is not None else fixture_load('orders')
+        self.taxes = taxes if taxes is not None else fixture_load('taxes')
+
+        # WoocommerceApi attributes read by the sync
+        self.async_transport = None
+        self.requests = []
+        self.http_requests_count = 0
+        self.http_retries_count = 0
+        self.http_bytes_count = 0
+
+    def request_record(self, method, endpoint, response):
+        self.requests.append((method, endpoint))
+        self.http_requests_count += 1
+        self.http_bytes_count += len(response.content)
+        return response
+
+    def records_retrieve(self, endpoint):
+        if endpoint in ('products', 'customers', 'orders', 'taxes'):
+            return getattr(self, endpoint)
+
+        match = re.fullmatch(r'products/(\d+)/variations', endpoint)
+        if match:
+            return self.product_variations.get(match.group(1), [])
+
+        return None
+
+    def record_retrieve(self, endpoint):
+        match = re.fullmatch(r'products/(\d+)(?:/variations/(\d+))?', endpoint)
+        if not match:
+            return None
+
+        if match.group(2):
+            records = self.product_variations.get(match.group(1), [])
+            record_id = int(match.group(2))
+        else:
+            records = self.products
+            record_id = int(match.group(1))
+
+        return next((record for record in records if record['id'] == record_id), None)
+
+    def get(self, endpoint, params=None, **kwargs):
+        params = params or {}
+        records = self.records_retrieve(endpoint)
+        if records is None:
+            return self.request_record('get', endpoint, WoocommerceFakeResponse(404, {'code': 'rest_no_route'}))
+
+        if params.get('include'):
+            record_ids = {int(record_id) for record_id in str(params['include']).split(',')}
+            records = [record for record in records if record['id'] in record_ids]
+        if params.get('type'):
+            records = [record for record in records if record.get('type') == params['type']]
+        if params.get('manage_stock'):
+            records = [record for record in records if record.get('manage_stock') is (params['manage_stock'] == 'true')]
+
+        per_page = int(params.get('per_page', 10))
+        page = int(params.get('page', 1))
+        total_pages = max(1, -(-len(records) // per_page))
+        fields = [field for field in params.get('_fields', '').split(',') if field]
+        records_page = [{field: record[field] for field in fields if field in record} if fields else record for record in records[(page - 1) * per_page : page * per_page]]
+
+        return self.request_record('get', endpoint, WoocommerceFakeResponse(200, records_page, headers={'X-WP-Total': str(len(records)), 'X-WP-TotalPages': str(total_pages)}))
+
+    def put(self, endpoint, data, **kwargs):
+        record = self.record_retrieve(endpoint)
+        if record is None:
+            return self.request_record('put', endpoint, WoocommerceFakeResponse(404, {'code': 'woocommerce_rest_invalid_id'}))
+
+        record.update(data)
+        return self.request_record('put', endpoint, WoocommerceFakeResponse(200, record))
+
+    def post(self, endpoint, data, **kwargs):
+        # Batch endpoints ('products/batch', 'products/<id>/variations/batch'), updates only
+        match = re.fullmatch(r'products(?:/(\d+)/variations)?/batch', endpoint)
+        if match:
+            records_updated = []
+            for record_data in data.get('update', []):
+                record = self.record_retrieve(f'products/{match.group(1)}/variations/{record_data["id"]}' if match.group(1) else f'products/{record_data["id"]}')
+                if record is None:
+                    records_updated.append({'id': record_data['id'], 'error': {'code': 'woocommerce_rest_invalid_id'}})
+                else:
+                    record.update(record_data)
+                    records_updated.append(record)
+            return self.request_record('post', endpoint, WoocommerceFakeResponse(200, {'update': records_updated}))
+
+        return self.request_record('post', endpoint, WoocommerceFakeResponse(201, {'id': len(self.requests) + 1, **data}))
+
+
+class WoocommerceSyncCase(TransactionCase):
+    """Base class for the WooCommerce sync tests: a WooCommerce configuration without scheduling and image downloads, and 'cr.commit'/'cr.rollback' disabled (the sync commits per record, which must not end the test transaction)."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env.ref('base.EUR').active = True
+        cls.woocommerce_sync_config = cls.env['woocommerce.configuration'].create(
+            {
+                'settings_woocommerce_connection_name': 'Test',
+                'settings_woocommerce_connection_url': WOOCOMMERCE_TEST_URL,
+                'settings_woocommerce_consumer_key': 'ck_test',
+                'settings_woocommerce_consumer_secret': 'cs_test',
+                'settings_woocommerce_images_sync': False,
+                'settings_woocommerce_changed_records_import': True,
+                'settings_woocommerce_sync_scheduled': False,
+            },
+        )
+        cls.woocommerce_connector = cls.env['woocommerce.configuration']
+        cls.woocommerce_tax_rates_index = cls.woocommerce_connector.woocommerce_tax_rates_index_build(fixture_load('taxes'))
+        cls.woocommerce_tax_rates = cls.woocommerce_connector.woocommerce_tax_rates_location_retrieve(cls.woocommerce_tax_rates_index, 'DE:BE')
+
+    def setUp(self):
+        super().setUp()
+        self.patch(type(self.env.cr), 'commit', lambda cr: None)
+        self.patch(type(self.env.cr), 'rollback', lambda cr: None)
+
+    def products_sync(self, woocommerce_api):
+        return self.woocommerce_connector.woocommerce_to_odoo_products_sync(self.woocommerce_sync_config, woocommerce_api, 'EUR', self.woocommerce_tax_rates, False, 'kg', 'cm')
+
+    def products_variations_sync(self, woocommerce_api):
+        return self.woocommerce_connector.woocommerce_to_odoo_products_variations_sync(self.woocommerce_sync_config, woocommerce_api, 'EUR', self.woocommerce_tax_rates, False, 'kg', 'cm')
+
+    def customers_sync(self, woocommerce_api):
+        return self.woocommerce_connector.woocommerce_to_odoo_customers_sync(self.woocommerce_sync_config, woocommerce_api)
+
+    def orders_sync(self, woocommerce_api):
+        return self.woocommerce_connector.woocommerce_to_odoo_orders_sync(self.woocommerce_sync_config, woocommerce_api, self.woocommerce_tax_rates_index, 'kg')
+
+    def stock_sync(self, woocommerce_api):
+        return self.woocommerce_connector.product_stock_quantity_create_or_update(self.woocommerce_sync_config, woocommerce_api)
+
+    def assertCounts(self, woocommerce_sync_counts, created=0, updated=0, failed=0):
+        self.assertEqual(woocommerce_sync_counts.get('created', 0), created)
+        self.assertEqual(woocommerce_sync_counts.get('updated', 0), updated)
+        self.assertEqual(woocommerce_sync_counts.get('failed', 0), failed)
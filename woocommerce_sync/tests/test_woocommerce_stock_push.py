@@ -0,0 +1,125 @@
+import requests
+from odoo.addons.queue_job.tests.common import trap_jobs
+from odoo.tests.common import tagged
+
+from .common import WoocommerceFakeApi, WoocommerceSyncCase, fixture_load
+
+
+@tagged('post_install', '-at_install', 'woocommerce_sync')
+class TestWoocommerceStockPush(WoocommerceSyncCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.woocommerce_sync_config.settings_woocommerce_stock_push = True
+
+    def setUp(self):
+        super().setUp()
+        # The fake WooCommerce REST API updates its records in place
+        self.woocommerce_api = WoocommerceFakeApi(products=fixture_load('products'), product_variations=fixture_load('product_variations'))
+        self.patch(type(self.woocommerce_connector), 'woocommerce_api_get', lambda woocommerce_connector, woocommerce_sync_config: self.woocommerce_api)
+
+        self.products_sync(self.woocommerce_api)
+        self.products_variations_sync(self.woocommerce_api)
+
+    def odoo_products_retrieve(self, woocommerce_product_id, woocommerce_product_variation_ids=None):
+        domain = [('woocommerce_product_site_url', '=', self.woocommerce_sync_config.settings_woocommerce_connection_url), ('woocommerce_product_id', '=', str(woocommerce_product_id))]
+        if woocommerce_product_variation_ids:
+            domain.append(('woocommerce_product_variation_id', 'in', [str(variation_id) for variation_id in woocommerce_product_variation_ids]))
+        return self.env['product.product'].search(domain)
+
+    def stock_moves_done(self, odoo_products, quantity):
+        stock_moves = self.env['stock.move'].create(
+            [
+                {
+                    'name': 'WooCommerce Stock Push Test',
+                    'product_id': product.id,
+                    'product_uom': product.uom_id.id,
+                    'product_uom_qty': quantity,
+                    'location_id': self.env.ref('stock.stock_location_suppliers').id,
+                    'location_dest_id': self.woocommerce_sync_config.settings_woocommerce_products_warehouse_location.id,
+                }
+                for product in odoo_products
+            ],
+        )
+        stock_moves._action_confirm()
+        for stock_move in stock_moves:
+            stock_move.quantity_done = quantity
+        stock_moves._action_done()
+
+    def test_stock_sync_not_pushed(self):
+        # The stock imported from WooCommerce is not pushed back
+        with trap_jobs() as trap:
+            self.stock_sync(self.woocommerce_api)
+            trap.assert_jobs_count(0, only=self.woocommerce_sync_config.woocommerce_stock_push)
+
+        self.assertFalse(self.env['product.product'].search_count([('woocommerce_stock_push_pending', '=', True)]))
+
+    def test_stock_sync_untagged_quant(self):
+        woocommerce_stock_quantity = next(record['stock_quantity'] for record in fixture_load('products') if record['id'] == 1000)
+        odoo_product = self.odoo_products_retrieve(1000)
+        woocommerce_warehouse_location = self.woocommerce_sync_config.settings_woocommerce_products_warehouse_location
+
+        # Stock received in Odoo before the first stock sync, in a quant not tagged with the WooCommerce site URL
+        self.env['stock.quant']._update_available_quantity(odoo_product, woocommerce_warehouse_location, 5)
+
+        # The stock quantity level of the location is set once, whichever quant Odoo updates
+        for _sync_index in range(2):
+            self.stock_sync(self.woocommerce_api)
+
+            odoo_quants = self.env['stock.quant'].search([('product_id', '=', odoo_product.id), ('location_id', '=', woocommerce_warehouse_location.id)])
+            self.assertEqual(sum(odoo_quants.mapped('quantity')), woocommerce_stock_quantity)
+            self.assertEqual(odoo_product.with_context(location=woocommerce_warehouse_location.id).qty_available, woocommerce_stock_quantity)
+
+    def test_stock_moves_pushed_in_batches(self):
+        self.stock_sync(self.woocommerce_api)
+
+        odoo_products = self.odoo_products_retrieve(1000) | self.odoo_products_retrieve(3000) | self.odoo_products_retrieve(2000, [2001, 2002])
+
+        # A single receipt of several products enqueues a single stock push
+        with trap_jobs() as trap:
+            self.stock_moves_done(odoo_products, 10)
+            trap.assert_jobs_count(1, only=self.woocommerce_sync_config.woocommerce_stock_push)
+            self.assertTrue(all(odoo_products.mapped('woocommerce_stock_push_pending')))
+
+            self.woocommerce_api.requests.clear()
+            trap.perform_enqueued_jobs()
+
+        # One batch request for the simple products and one for the product variations of the parent product
+        self.assertCountEqual(self.woocommerce_api.requests, [('post', 'products/batch'), ('post', 'products/2000/variations/batch')])
+
+        for product in odoo_products:
+            self.assertFalse(product.woocommerce_stock_push_pending)
+            self.assertTrue(product.product_stock_date_updated)
+
+        # Pushed stock quantity levels: imported stock + received quantity (the product variation without stock move is unchanged)
+        woocommerce_stock_quantities = {record['id']: record['stock_quantity'] for record in fixture_load('products') + fixture_load('product_variations')['2000']}
+        woocommerce_stock_quantities_pushed = {record['id']: record['stock_quantity'] for record in self.woocommerce_api.products + self.woocommerce_api.product_variations['2000']}
+        for woocommerce_record_id in (1000, 3000, 2001, 2002):
+            self.assertEqual(woocommerce_stock_quantities_pushed[woocommerce_record_id], woocommerce_stock_quantities[woocommerce_record_id] + 10)
+        self.assertEqual(woocommerce_stock_quantities_pushed[2003], woocommerce_stock_quantities[2003])
+
+    def test_stock_push_failed_flagged_again(self):
+        self.stock_sync(self.woocommerce_api)
+
+        odoo_products = self.odoo_products_retrieve(1000) | self.odoo_products_retrieve(2000, [2001])
+
+        def post_connection_error(endpoint, data, **kwargs):
+            raise requests.exceptions.ConnectionError('Connection reset')
+
+        # Products whose push failed (e.g. a connection error after retries) remain flagged, to be retried
+        with trap_jobs() as trap:
+            self.stock_moves_done(odoo_products, 10)
+            self.patch(self.woocommerce_api, 'post', post_connection_error)
+            trap.perform_enqueued_jobs()
+
+        self.assertTrue(all(odoo_products.mapped('woocommerce_stock_push_pending')))
+
+        # Products not reached because the job was aborted remain flagged
+        def post_aborted(endpoint, data, **kwargs):
+            raise RuntimeError('Worker stopped')
+
+        self.patch(self.woocommerce_api, 'post', post_aborted)
+        with self.assertRaises(RuntimeError):
+            self.woocommerce_sync_config.woocommerce_stock_push()
+
+        self.assertTrue(all(odoo_products.mapped('woocommerce_stock_push_pending')))
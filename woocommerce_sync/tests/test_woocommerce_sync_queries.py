@@ -0,0 +1,179 @@
+import json
+import os
+from contextlib import contextmanager
+
+from odoo.tests.common import tagged, warmup
+
+from .common import (
+    FIXTURES_DIRECTORY,
+    WoocommerceFakeApi,
+    WoocommerceSyncCase,
+    fixture_load,
+)
+
+# Measured SQL query counts of each sync step with the test fixtures ('fixtures/query_counts.json'). A step may exceed its measured count by QUERIES_MARGIN queries at most, so that a query added per record (N+1) fails the test.
+# To measure them, run the tests once with WOOCOMMERCE_SYNC_QUERY_COUNTS_RECORD=1 ('WOOCOMMERCE_SYNC_QUERY_COUNTS_RECORD=1 odoo-bin --test-tags woocommerce_sync'), which writes the actual counts to 'fixtures/query_counts.json'.
+QUERY_COUNTS = fixture_load('query_counts')
+QUERY_COUNTS_RECORD = os.environ.get('WOOCOMMERCE_SYNC_QUERY_COUNTS_RECORD') == '1'
+QUERIES_MARGIN = 5
+
+# Upper bounds of SQL queries (base + per record) of each sync step, used while its query count is not measured yet. Records are created, updated and looked up in batches, so a step exceeding them most likely runs a query per record (N+1)
+PRODUCTS_QUERIES_BASE = 60
+PRODUCTS_QUERIES_PER_RECORD = 25
+PRODUCT_VARIATIONS_QUERIES_BASE = 40
+PRODUCT_VARIATIONS_QUERIES_PER_RECORD = 20
+CUSTOMERS_QUERIES_BASE = 30
+CUSTOMERS_QUERIES_PER_RECORD = 4
+ORDERS_QUERIES_BASE = 80
+ORDERS_QUERIES_PER_RECORD = 20
+ORDERS_QUERIES_PER_LINE_ITEM = 6
+STOCK_QUERIES_BASE = 30
+STOCK_QUERIES_PER_RECORD = 3
+
+# Unchanged records are skipped after the first pass (IDs and modified dates only)
+UNCHANGED_QUERIES_BASE = 20
+UNCHANGED_PRODUCT_VARIATIONS_QUERIES_PER_PRODUCT = 10
+
+
+@tagged('post_install', '-at_install', 'woocommerce_sync')
+class TestWoocommerceSyncQueries(WoocommerceSyncCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.woocommerce_products = fixture_load('products')
+        cls.woocommerce_products_variable = [product for product in cls.woocommerce_products if product['type'] == 'variable']
+        cls.woocommerce_product_variations = [variation for variations in fixture_load('product_variations').values() for variation in variations]
+        cls.woocommerce_customers = fixture_load('customers')
+        cls.woocommerce_orders = fixture_load('orders')
+        cls.woocommerce_order_line_items = [line_item for order in cls.woocommerce_orders for line_item in order['line_items']]
+        cls.query_counts_recorded = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        # Record the measured SQL query counts
+        if QUERY_COUNTS_RECORD and cls.query_counts_recorded:
+            with open(os.path.join(FIXTURES_DIRECTORY, 'query_counts.json'), 'w', encoding='utf-8') as query_counts_file:
+                json.dump({**QUERY_COUNTS, **cls.query_counts_recorded}, query_counts_file, indent=2, sort_keys=True)
+                query_counts_file.write('\n')
+
+        super().tearDownClass()
+
+    @contextmanager
+    def assertSyncQueryCount(self, sync_step, queries_max):
+        """Assert the SQL query count of a sync step: its measured count plus QUERIES_MARGIN, or else the given upper bound."""
+        queries_measured = QUERY_COUNTS.get(sync_step)
+        queries_expected = queries_measured + QUERIES_MARGIN if queries_measured is not None and not QUERY_COUNTS_RECORD else queries_max
+
+        self.env.flush_all()
+        query_count_start = self.env.cr.sql_log_count
+        yield
+        self.env.flush_all()
+        query_count = self.env.cr.sql_log_count - query_count_start
+
+        # Only the warm run of a '@warmup' test is asserted and recorded, like 'assertQueryCount'
+        if not getattr(self, 'warm', True):
+            return
+
+        self.query_counts_recorded[sync_step] = query_count
+        self.assertLessEqual(query_count, queries_expected, f"Sync step '{sync_step}': {query_count} SQL queries, {queries_expected} expected at most.")
+
+    @warmup
+    def test_products_sync(self):
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('products', PRODUCTS_QUERIES_BASE + PRODUCTS_QUERIES_PER_RECORD * len(self.woocommerce_products)):
+            woocommerce_sync_counts = self.products_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts, created=len(self.woocommerce_products))
+
+        # First pass (IDs and modified dates) and second pass (changed records), one page each
+        self.assertEqual(woocommerce_api.http_requests_count, 2)
+
+        # Unchanged products
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('products_unchanged', UNCHANGED_QUERIES_BASE):
+            woocommerce_sync_counts = self.products_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts)
+        self.assertEqual(woocommerce_api.http_requests_count, 1)
+
+    @warmup
+    def test_products_variations_sync(self):
+        self.products_sync(WoocommerceFakeApi())
+
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('product_variations', PRODUCT_VARIATIONS_QUERIES_BASE + PRODUCT_VARIATIONS_QUERIES_PER_RECORD * len(self.woocommerce_product_variations)):
+            woocommerce_sync_counts = self.products_variations_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts, created=len(self.woocommerce_product_variations))
+
+        # Variable products listing, then two passes per variable product
+        self.assertLessEqual(woocommerce_api.http_requests_count, 1 + 2 * len(self.woocommerce_products_variable))
+
+        # Unchanged product variations
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('product_variations_unchanged', UNCHANGED_QUERIES_BASE + UNCHANGED_PRODUCT_VARIATIONS_QUERIES_PER_PRODUCT * len(self.woocommerce_products_variable)):
+            woocommerce_sync_counts = self.products_variations_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts)
+        self.assertLessEqual(woocommerce_api.http_requests_count, 1 + len(self.woocommerce_products_variable))
+
+    @warmup
+    def test_customers_sync(self):
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('customers', CUSTOMERS_QUERIES_BASE + CUSTOMERS_QUERIES_PER_RECORD * len(self.woocommerce_customers)):
+            woocommerce_sync_counts = self.customers_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts, created=len(self.woocommerce_customers))
+        self.assertEqual(woocommerce_api.http_requests_count, 2)
+
+        # Unchanged customers
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('customers_unchanged', UNCHANGED_QUERIES_BASE):
+            woocommerce_sync_counts = self.customers_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts)
+        self.assertEqual(woocommerce_api.http_requests_count, 1)
+
+    @warmup
+    def test_orders_sync(self):
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('orders', ORDERS_QUERIES_BASE + ORDERS_QUERIES_PER_RECORD * len(self.woocommerce_orders) + ORDERS_QUERIES_PER_LINE_ITEM * len(self.woocommerce_order_line_items)):
+            woocommerce_sync_counts = self.orders_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts, created=len(self.woocommerce_orders))
+        self.assertEqual(woocommerce_api.http_requests_count, 2)
+        self.assertEqual(
+            self.env['sale.order.line'].search_count([('woocommerce_order_line_site_url', '=', self.woocommerce_sync_config.settings_woocommerce_connection_url)]),
+            len(self.woocommerce_order_line_items),
+        )
+
+        # Unchanged orders
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('orders_unchanged', UNCHANGED_QUERIES_BASE):
+            woocommerce_sync_counts = self.orders_sync(woocommerce_api)
+
+        self.assertCounts(woocommerce_sync_counts)
+        self.assertEqual(woocommerce_api.http_requests_count, 1)
+
+    @warmup
+    def test_stock_sync(self):
+        self.products_sync(WoocommerceFakeApi())
+        self.products_variations_sync(WoocommerceFakeApi())
+
+        woocommerce_products_stock = [product for product in self.woocommerce_products if product['manage_stock']] + [variation for variation in self.woocommerce_product_variations if variation['manage_stock']]
+
+        woocommerce_api = WoocommerceFakeApi()
+        with self.assertSyncQueryCount('stock', STOCK_QUERIES_BASE + STOCK_QUERIES_PER_RECORD * len(woocommerce_products_stock)):
+            woocommerce_sync_counts = self.stock_sync(woocommerce_api)
+
+        # Stock quantity levels never synced before are imported into Odoo
+        self.assertCounts(woocommerce_sync_counts, updated=len(woocommerce_products_stock))
+
+        # Products listing, then the variations of each variable product (retrieved once for all its product variations)
+        self.assertLessEqual(woocommerce_api.http_requests_count, 1 + len(self.woocommerce_products_variable))
+
+        # WooCommerce stock quantities imported into Odoo
+        odoo_product = self.env['product.product'].search(
+            [('woocommerce_product_site_url', '=', self.woocommerce_sync_config.settings_woocommerce_connection_url), ('woocommerce_product_id', '=', str(self.woocommerce_products[0]['id']))], limit=1
+        )
+        self.assertEqual(odoo_product.qty_available, self.woocommerce_products[0]['stock_quantity'])
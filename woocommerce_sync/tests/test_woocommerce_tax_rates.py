@@ -0,0 +1,25 @@
+from odoo.tests.common import tagged
+
+from .common import WoocommerceFakeApi, WoocommerceSyncCase, fixture_load
+
+
+@tagged('post_install', '-at_install', 'woocommerce_sync')
+class TestWoocommerceTaxRates(WoocommerceSyncCase):
+    def test_tax_rate_location(self):
+        self.assertEqual(self.woocommerce_connector.woocommerce_tax_rate_retrieve(self.woocommerce_tax_rates_index, 'standard', 'DE', 'BE'), 19.0)
+        self.assertEqual(self.woocommerce_connector.woocommerce_tax_rate_retrieve(self.woocommerce_tax_rates_index, 'standard', 'AT', 'W'), 20.0)
+
+        # No tax rate of another location for locations without a matching rate (e.g. exports)
+        self.assertIsNone(self.woocommerce_connector.woocommerce_tax_rate_retrieve(self.woocommerce_tax_rates_index, 'standard', 'US', 'CA'))
+
+    def test_order_line_items_without_applied_tax(self):
+        woocommerce_orders = fixture_load('orders')[:1]
+        for line_item in woocommerce_orders[0]['line_items']:
+            line_item['taxes'] = []
+            line_item['total_tax'] = '0.00'
+
+        self.orders_sync(WoocommerceFakeApi(orders=woocommerce_orders))
+
+        odoo_sale_order_lines = self.env['sale.order.line'].search([('woocommerce_order_line_site_url', '=', self.woocommerce_sync_config.settings_woocommerce_connection_url)])
+        self.assertTrue(odoo_sale_order_lines)
+        self.assertFalse(odoo_sale_order_lines.tax_id)
@@ -0,0 +1,3 @@
+from . import profiler, woocommerce_api, woocommerce_api_async
+
+__all__ = ['profiler', 'woocommerce_api', 'woocommerce_api_async']
@@ -0,0 +1,98 @@
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class WoocommerceSamplingProfiler:
+    """Sampling profiler: a background thread samples the call stack of the profiled thread at a fixed interval and counts identical stacks. The collapsed stacks ('frame;frame;frame count' lines) can be rendered as a flame graph (e.g. with flamegraph.pl or speedscope)."""
+
+    def __init__(self, thread_id=None, interval_seconds=0.005):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval_seconds = interval_seconds
+        self.stacks = Counter()
+        self.samples = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.sample_loop, name='woocommerce-sync-sampling-profiler', daemon=True)
+
+    @staticmethod
+    def frame_name(frame):
+        code = frame.f_code
+        return f'{code.co_name} ({code.co_filename.rsplit("/", 1)[-1]}:{code.co_firstlineno})'
+
+    def sample_loop(self):
+        while not self.stop_event.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                stack.append(self.frame_name(frame))
+                frame = frame.f_back
+
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+
+    def collapsed_stacks(self):
+        return '\n'.join(f'{stack} {count}' for stack, count in self.stacks.most_common())
+
+
+class WoocommerceStageProfiler:
+    """Profile a sync stage with cProfile (deterministic) or the sampling profiler. 'results' returns the profile output as a list of (file name, content, mimetype) tuples."""
+
+    def __init__(self, mode, stage):
+        self.mode = mode
+        self.stage = stage
+        self.profile = None
+        self.sampling_profiler = None
+        self.time_start = None
+        self.time_end = None
+
+    def __enter__(self):
+        self.time_start = time.perf_counter()
+        if self.mode == 'cprofile':
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        elif self.mode == 'sampling':
+            self.sampling_profiler = WoocommerceSamplingProfiler()
+            self.sampling_profiler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.profile:
+            self.profile.disable()
+        if self.sampling_profiler:
+            self.sampling_profiler.stop()
+        self.time_end = time.perf_counter()
+        return False
+
+    def results(self):
+        results = []
+
+        if self.profile:
+            # Binary profile, readable with pstats, snakeviz or gprof2dot
+            self.profile.create_stats()
+            results.append((f'{self.stage}.prof', marshal.dumps(self.profile.stats), 'application/octet-stream'))
+
+            # Text report, sorted by cumulative time
+            stats_stream = io.StringIO()
+            pstats.Stats(self.profile, stream=stats_stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(100)
+            results.append((f'{self.stage}.pstats.txt', stats_stream.getvalue().encode(), 'text/plain'))
+
+        if self.sampling_profiler:
+            # Collapsed stacks, ready for flame graph rendering
+            results.append((f'{self.stage}.collapsed.txt', self.sampling_profiler.collapsed_stacks().encode(), 'text/plain'))
+
+        return results
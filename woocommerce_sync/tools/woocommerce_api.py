@@ -0,0 +1,189 @@
+import logging
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import requests
+from woocommerce import API
+
+# Settings
+_logger = logging.getLogger(__name__)
+
+# HTTP status codes that are retried (rate limited, or WordPress host temporarily unavailable)
+WOOCOMMERCE_API_RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# HTTP status codes that are retried for POST requests (rejected before being processed). POST requests are not idempotent: after a timeout, a connection error or a gateway error, WooCommerce may have already created the record, so they are not sent again
+WOOCOMMERCE_API_POST_RETRY_STATUS_CODES = (429, 503)
+
+# HTTP methods that are retried after a timeout or a connection error (idempotent methods)
+WOOCOMMERCE_API_RETRY_METHODS = ('get', 'put', 'delete')
+
+
+def woocommerce_api_retry_status_codes(method):
+    """Return the HTTP status codes that are retried for an HTTP method."""
+    return WOOCOMMERCE_API_RETRY_STATUS_CODES if method.lower() in WOOCOMMERCE_API_RETRY_METHODS else WOOCOMMERCE_API_POST_RETRY_STATUS_CODES
+
+
+class WoocommerceApiTokenBucket:
+    """Token bucket rate limiter: allows bursts of up to 'capacity' requests and 'rate' requests per second on average."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = max(rate, 0.1)
+        self.capacity = capacity or max(self.rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_seconds = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_seconds)
+
+
+class WoocommerceApiConcurrencyController:
+    """AIMD (additive increase, multiplicative decrease) concurrency controller: the number of concurrent requests grows by one after each window of successful requests and is halved when the server throttles."""
+
+    def __init__(self, limit_max, limit_min=1):
+        self.limit_min = max(limit_min, 1)
+        self.limit_max = max(limit_max, self.limit_min)
+        self.limit = self.limit_min
+        self.in_flight = 0
+        self.successes = 0
+        self.condition = threading.Condition()
+
+    def __enter__(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+        return False
+
+    def increase(self):
+        """Additive increase: one more concurrent request after 'limit' consecutive successes."""
+        with self.condition:
+            self.successes += 1
+            if self.successes >= self.limit and self.limit < self.limit_max:
+                self.limit += 1
+                self.successes = 0
+                self.condition.notify_all()
+
+    def decrease(self):
+        """Multiplicative decrease: halve the number of concurrent requests."""
+        with self.condition:
+            self.limit = max(self.limit_min, int(self.limit // 2))
+            self.successes = 0
+
+
+class WoocommerceApi(API):
+    """WooCommerce REST API client with a token bucket rate limiter, an AIMD concurrency controller and retries with exponential backoff and jitter for throttled (429, 503) or failed requests, honoring the 'Retry-After' header."""
+
+    def __init__(self, url, consumer_key, consumer_secret, requests_per_second=5.0, concurrency_max=4, retries_max=5, backoff_base_seconds=1.0, backoff_max_seconds=60.0, **kwargs):
+        super().__init__(url, consumer_key, consumer_secret, **kwargs)
+        self.token_bucket = WoocommerceApiTokenBucket(rate=requests_per_second)
+        self.concurrency_controller = WoocommerceApiConcurrencyController(limit_max=concurrency_max)
+        self.retries_max = retries_max
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        # Optional asynchronous transport (WoocommerceAsyncApi), used for concurrent requests
+        self.async_transport = None
+
+        # HTTP counters
+        self.counters_lock = threading.Lock()
+        self.http_requests_count = 0
+        self.http_retries_count = 0
+        self.http_bytes_count = 0
+
+    def backoff_seconds(self, attempt):
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt))
+
+    def retry_after_seconds(self, response):
+        """Parse the 'Retry-After' header (either a number of seconds or an HTTP date), if present."""
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+
+        try:
+            return min(self.backoff_max_seconds, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+        try:
+            return min(self.backoff_max_seconds, max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds()))
+        except (TypeError, ValueError):
+            return None
+
+    def request_with_retry(self, method, endpoint, *args, **kwargs):
+        """Send a request through the rate limiter and concurrency controller, retrying throttled requests, server unavailability and timeouts (POST requests: throttled requests and server unavailability only)."""
+        retry_status_codes = woocommerce_api_retry_status_codes(method)
+        attempt = 0
+        while True:
+            self.token_bucket.acquire()
+
+            try:
+                with self.concurrency_controller:
+                    response = getattr(super(), method)(endpoint, *args, **kwargs)
+
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as error:
+                self.concurrency_controller.decrease()
+                if attempt >= self.retries_max or method not in WOOCOMMERCE_API_RETRY_METHODS:
+                    raise
+
+                wait_seconds = self.backoff_seconds(attempt)
+                _logger.warning(f"WooCommerce REST API {method.upper()} '{endpoint}' failed ({error}), retrying in {wait_seconds:.1f} seconds.")
+
+            else:
+                with self.counters_lock:
+                    self.http_requests_count += 1
+                    self.http_bytes_count += len(response.content or b'')
+
+                if response.status_code not in retry_status_codes:
+                    self.concurrency_controller.increase()
+                    return response
+
+                self.concurrency_controller.decrease()
+                if attempt >= self.retries_max:
+                    return response
+
+                wait_seconds = self.retry_after_seconds(response)
+                if wait_seconds is None:
+                    wait_seconds = self.backoff_seconds(attempt)
+                _logger.warning(f"WooCommerce REST API {method.upper()} '{endpoint}' returned status {response.status_code}, retrying in {wait_seconds:.1f} seconds.")
+
+            with self.counters_lock:
+                self.http_retries_count += 1
+
+            attempt += 1
+            time.sleep(wait_seconds)
+
+    def get(self, endpoint, **kwargs):
+        return self.request_with_retry('get', endpoint, **kwargs)
+
+    def post(self, endpoint, data, **kwargs):
+        return self.request_with_retry('post', endpoint, data, **kwargs)
+
+    def put(self, endpoint, data, **kwargs):
+        return self.request_with_retry('put', endpoint, data, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self.request_with_retry('delete', endpoint, **kwargs)
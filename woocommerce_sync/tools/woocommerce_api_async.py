@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from woocommerce.oauth import OAuth
+
+from .woocommerce_api import (
+    WOOCOMMERCE_API_RETRY_METHODS,
+    woocommerce_api_retry_status_codes,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Settings
+_logger = logging.getLogger(__name__)
+
+
+def run_coroutine_sync(coroutine):
+    """Run a coroutine to completion from synchronous code (sync-to-async bridge). Odoo workers have no running event loop, in which case a new one is used; otherwise, the coroutine runs in a separate thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class WoocommerceAsyncConcurrencyLimiter:
+    """Asyncio counterpart of the AIMD concurrency controller of the synchronous client: allows up to 'limit_max' concurrent requests, each request waiting until the number of requests in flight is below the current limit of the controller."""
+
+    def __init__(self, concurrency_controller):
+        self.concurrency_controller = concurrency_controller
+        self.semaphore = asyncio.Semaphore(concurrency_controller.limit_max)
+        self.condition = asyncio.Condition()
+        self.in_flight = 0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            async with self.condition:
+                await self.condition.wait_for(lambda: self.in_flight < max(1, int(self.concurrency_controller.limit)))
+                self.in_flight += 1
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+        self.semaphore.release()
+        return False
+
+    async def limit_changed(self):
+        """Wake up the waiting requests after the limit of the controller grew."""
+        async with self.condition:
+            self.condition.notify_all()
+
+
+class WoocommerceAsyncApi:
+    """Asynchronous (asyncio/httpx) transport for a WoocommerceApi client: sends concurrent, pipelined requests over a shared HTTP/1.1 keep-alive connection pool, with the same authentication (OAuth 1.0a for HTTP, basic authentication or query string authentication for HTTPS), rate limiting, AIMD concurrency control, retries and counters as the synchronous client."""
+
+    def __init__(self, woocommerce_api):
+        if httpx is None:
+            raise ImportError("The 'httpx' Python package is required for the asynchronous WooCommerce REST API transport.")
+
+        self.woocommerce_api = woocommerce_api
+
+    @staticmethod
+    def is_available():
+        return httpx is not None
+
+    def url_get(self, endpoint):
+        """Build the WooCommerce REST API URL of an endpoint, as the synchronous client does."""
+        url = self.woocommerce_api.url if self.woocommerce_api.url.endswith('/') else f'{self.woocommerce_api.url}/'
+        api = 'wp-json' if self.woocommerce_api.wp_api else 'wc-api'
+        return f'{url}{api}/{self.woocommerce_api.version}/{endpoint}'
+
+    def request_arguments_get(self, method, endpoint, params=None):
+        """Return the URL, query parameters and authentication of a request."""
+        url = self.url_get(endpoint)
+        params = dict(params or {})
+        auth = None
+
+        if self.woocommerce_api.is_ssl and not self.woocommerce_api.query_string_auth:
+            auth = (self.woocommerce_api.consumer_key, self.woocommerce_api.consumer_secret)
+        elif self.woocommerce_api.is_ssl:
+            params.update({'consumer_key': self.woocommerce_api.consumer_key, 'consumer_secret': self.woocommerce_api.consumer_secret})
+        else:
+            # OAuth 1.0a signs the URL, including its query parameters
+            url = OAuth(
+                url=f'{url}?{urlencode(params)}' if params else url,
+                consumer_key=self.woocommerce_api.consumer_key,
+                consumer_secret=self.woocommerce_api.consumer_secret,
+                version=self.woocommerce_api.version,
+                method=method.upper(),
+                oauth_timestamp=int(time.time()),
+            ).get_oauth_url()
+            params = {}
+
+        return url, params, auth
+
+    async def request(self, client, concurrency_limiter, method, endpoint, params=None, data=None):
+        """Send a request, retrying throttled requests, server unavailability and timeouts (POST requests: throttled requests and server unavailability only) with exponential backoff and jitter."""
+        woocommerce_api = self.woocommerce_api
+        retry_status_codes = woocommerce_api_retry_status_codes(method)
+        attempt = 0
+        while True:
+            # Token bucket: wait (without blocking the event loop) until a request is allowed
+            await asyncio.get_running_loop().run_in_executor(None, woocommerce_api.token_bucket.acquire)
+
+            url, request_params, auth = self.request_arguments_get(method, endpoint, params)
+
+            try:
+                async with concurrency_limiter:
+                    response = await client.request(method.upper(), url, params=request_params, json=data, auth=auth)
+
+            except (httpx.TimeoutException, httpx.TransportError) as error:
+                woocommerce_api.concurrency_controller.decrease()
+                if attempt >= woocommerce_api.retries_max or method.lower() not in WOOCOMMERCE_API_RETRY_METHODS:
+                    raise
+
+                wait_seconds = woocommerce_api.backoff_seconds(attempt)
+                _logger.warning(f"WooCommerce REST API {method.upper()} '{endpoint}' failed ({error}), retrying in {wait_seconds:.1f} seconds.")
+
+            else:
+                with woocommerce_api.counters_lock:
+                    woocommerce_api.http_requests_count += 1
+                    woocommerce_api.http_bytes_count += len(response.content or b'')
+
+                if response.status_code not in retry_status_codes:
+                    woocommerce_api.concurrency_controller.increase()
+                    await concurrency_limiter.limit_changed()
+                    return response
+
+                woocommerce_api.concurrency_controller.decrease()
+                if attempt >= woocommerce_api.retries_max:
+                    return response
+
+                wait_seconds = woocommerce_api.retry_after_seconds(response)
+                if wait_seconds is None:
+                    wait_seconds = woocommerce_api.backoff_seconds(attempt)
+                _logger.warning(f"WooCommerce REST API {method.upper()} '{endpoint}' returned status {response.status_code}, retrying in {wait_seconds:.1f} seconds.")
+
+            with woocommerce_api.counters_lock:
+                woocommerce_api.http_retries_count += 1
+
+            attempt += 1
+            await asyncio.sleep(wait_seconds)
+
+    def client_get(self):
+        return httpx.AsyncClient(
+            timeout=self.woocommerce_api.timeout,
+            verify=self.woocommerce_api.verify_ssl,
+            headers={'user-agent': self.woocommerce_api.user_agent, 'accept': 'application/json'},
+            limits=httpx.Limits(max_connections=self.woocommerce_api.concurrency_controller.limit_max, max_keepalive_connections=self.woocommerce_api.concurrency_controller.limit_max),
+        )
+
+    def concurrency_limiter_get(self):
+        """Concurrency limiter sized from the configured maximum concurrency and gated on the current limit of the AIMD concurrency controller of the synchronous client."""
+        return WoocommerceAsyncConcurrencyLimiter(self.woocommerce_api.concurrency_controller)
+
+    async def requests_send(self, method, requests_arguments):
+        async with self.client_get() as client:
+            concurrency_limiter = self.concurrency_limiter_get()
+            return await asyncio.gather(*(self.request(client, concurrency_limiter, method, endpoint, params=params, data=data) for endpoint, params, data in requests_arguments))
+
+    def get_many(self, requests_arguments):
+        """Send concurrent GET requests. 'requests_arguments' is a list of (endpoint, params) tuples. Returns the responses in the same order."""
+        return run_coroutine_sync(self.requests_send('get', [(endpoint, params, None) for endpoint, params in requests_arguments]))
+
+    def put_many(self, requests_arguments):
+        """Send concurrent PUT requests. 'requests_arguments' is a list of (endpoint, data) tuples. Returns the responses in the same order."""
+        return run_coroutine_sync(self.requests_send('put', [(endpoint, None, data) for endpoint, data in requests_arguments]))
+
+    def post_many(self, requests_arguments):
+        """Send concurrent POST requests. 'requests_arguments' is a list of (endpoint, data) tuples. Returns the responses in the same order."""
+        return run_coroutine_sync(self.requests_send('post', [(endpoint, None, data) for endpoint, data in requests_arguments]))
+
+    async def pages_get(self, endpoint, params):
+        """Retrieve the first page of a listing, then all remaining pages concurrently (using the 'X-WP-TotalPages' header)."""
+        async with self.client_get() as client:
+            concurrency_limiter = self.concurrency_limiter_get()
+
+            response_first = await self.request(client, concurrency_limiter, 'get', endpoint, params={**params, 'page': 1})
+            if response_first.status_code != 200:
+                return [response_first]
+
+            total_pages = response_first.headers.get('X-WP-TotalPages')
+            total_pages = int(total_pages) if total_pages and total_pages.isdigit() else 1
+
+            responses = await asyncio.gather(*(self.request(client, concurrency_limiter, 'get', endpoint, params={**params, 'page': page}) for page in range(2, total_pages + 1)))
+
+            return [response_first, *responses]
+
+    def get_pages(self, endpoint, params):
+        """Retrieve all pages of a listing. Returns the responses ordered by page."""
+        return run_coroutine_sync(self.pages_get(endpoint, params))
+
+    async def files_download(self, urls):
+        async with httpx.AsyncClient(timeout=self.woocommerce_api.timeout, follow_redirects=True) as client:
+            semaphore = asyncio.Semaphore(self.woocommerce_api.concurrency_controller.limit_max)
+
+            async def file_download(url):
+                try:
+                    async with semaphore:
+                        response = await client.get(url)
+                    response.raise_for_status()
+                    return response.content
+
+                except httpx.HTTPError as error:
+                    _logger.error(f'Failed to download file from {url}: {error}')
+                    return None
+
+            return dict(zip(urls, await asyncio.gather(*(file_download(url) for url in urls))))
+
+    def download_many(self, urls):
+        """Download files concurrently. Returns a map of file contents (None for failed downloads) keyed by URL."""
+        return run_coroutine_sync(self.files_download(list(urls)))